@@ -1,9 +1,29 @@
-from .api.DualSenseController import DualSenseController, Mapping, HidDeviceInfo, ConnectionType
+from .api.DualSenseController import DualSenseController, Mapping, HidDeviceInfo, ConnectionType, ReadStateName
+from .api.AsyncDualSenseController import AsyncDualSenseController
+from .api.SharedDualSenseController import SharedDualSenseController
+from .api.StateChange import StateChange
 from .api.contextmanager import active_dualsense_controller
-from .api.enum import UpdateLevel
+from .api.enum import DropPolicy, UpdateLevel
 from .api.property import TriggerProperty
-from .core.Benchmarker import Benchmark
-from .core.exception import InvalidDeviceIndexException
+from .core.Benchmarker import Benchmark, PipelineHistograms
+from .core.ControllerHub import ControllerHub, HubDeviceStats
+from .core.LatencyHistogram import LatencyHistogram, LatencyStats
+from .core.HidrawDevice import HidrawDevice
+from .core.InReportRingBuffer import PipelineStats
+from .core.OutReportScheduler import OutReportScheduler
+from .core.enum import PipelinePolicy
+from .core.recording.RecordedReport import RecordedReport
+from .core.recording.ReplayHidDevice import ReplayHidDevice
+from .core.recording.SessionRecorder import SessionRecorder
+from .core.recording.SessionRecording import SessionRecording
+from .core.recording.enum import ReportDirection
+from .core.report.in_report.batch import decode_reports
+from .core.exception import InvalidDeviceIndexException, SharedReaderException, SharedStateListenerException, \
+    SnapshotsNotEnabledException
+from .core.state.CallbackDispatcher import CallbackDispatcher
+from .core.state.CallbackProfiler import CallbackProfile, CallbackProfiler
+from .core.state.read_state.ControllerSnapshot import ControllerSnapshot
 from .core.state.read_state.value_type import Accelerometer, Battery, Connection, Gyroscope, JoyStick, Orientation, \
     TouchFinger
 from .core.state.typedef import Number
+from .core.state.write_state.enum import WritePriority
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from threading import Lock
+from typing import Any, Callable, Final, Generic, TypeVar
+
+from dualsense_controller.api.enum import DropPolicy
+
+QueueItem = TypeVar('QueueItem')
+
+
+class AsyncChangeQueue(Generic[QueueItem]):
+    # filled from the hid loop thread without ever blocking it, consumed inside an asyncio event loop
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def __init__(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            maxsize: int = 64,
+            drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+    ):
+        assert maxsize > 0, 'maxsize has to be greater than 0'
+        self._loop: Final[asyncio.AbstractEventLoop] = loop
+        self._maxsize: Final[int] = 1 if drop_policy == DropPolicy.LATEST else maxsize
+        self._drop_policy: Final[DropPolicy] = drop_policy
+        self._lock: Final[Lock] = Lock()
+        self._items: Final[deque[QueueItem]] = deque()
+        self._item_available: Final[asyncio.Event] = asyncio.Event()
+        self._wakeup_scheduled: bool = False
+        self._closed: bool = False
+        self._dropped: int = 0
+
+    def put_threadsafe(self, item: QueueItem) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            if len(self._items) >= self._maxsize:
+                self._dropped += 1
+                if self._drop_policy == DropPolicy.DROP_NEWEST:
+                    return
+                self._items.popleft()
+            self._items.append(item)
+            # one wakeup per batch of items, not per item
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+        self._call_soon_threadsafe(self._wakeup)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+        self._call_soon_threadsafe(self._wakeup)
+
+    async def get(self) -> QueueItem:
+        while True:
+            with self._lock:
+                if self._items:
+                    return self._items.popleft()
+                if self._closed:
+                    raise StopAsyncIteration
+            self._item_available.clear()
+            await self._item_available.wait()
+
+    def __aiter__(self) -> AsyncChangeQueue[QueueItem]:
+        return self
+
+    async def __anext__(self) -> QueueItem:
+        return await self.get()
+
+    @staticmethod
+    def call_soon_threadsafe(loop: asyncio.AbstractEventLoop, callback: Callable[..., Any], *args: Any) -> bool:
+        # False when the event loop is already closed, nobody is waiting anymore
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            return False
+        return True
+
+    def _call_soon_threadsafe(self, callback: Callable[[], None]) -> None:
+        AsyncChangeQueue.call_soon_threadsafe(self._loop, callback)
+
+    def _wakeup(self) -> None:
+        with self._lock:
+            self._wakeup_scheduled = False
+        self._item_available.set()
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Final
+
+from dualsense_controller.api.AsyncChangeQueue import AsyncChangeQueue
+from dualsense_controller.api.DualSenseController import DualSenseController
+from dualsense_controller.api.enum import DropPolicy
+from dualsense_controller.core.report.in_report.InReportSnapshot import InReportSnapshot
+from dualsense_controller.core.state.read_state.ControllerSnapshot import ControllerSnapshot
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+
+
+class AsyncDualSenseController:
+    # wraps a DualSenseController, its blocking calls run in the default executor, reports and changes are delivered
+    # into the running event loop. the hid loop thread never waits for a consumer, full queues drop according to their
+    # DropPolicy. all other attributes, i.e. the properties, are the ones of the wrapped controller
+
+    @property
+    def controller(self) -> DualSenseController:
+        return self._controller
+
+    def __init__(self, controller: DualSenseController | None = None, **kwargs: Any):
+        # the arguments of a DualSenseController, when none is given
+        assert controller is None or not kwargs, 'either a controller or the arguments to create one'
+        self._controller: Final[DualSenseController] = (
+            controller if controller is not None else DualSenseController(**kwargs)
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes not found on this wrapper. private ones are not forwarded,
+        # so a half initialized wrapper does not recurse looking for its own _controller
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._controller, name)
+
+    async def __aenter__(self) -> AsyncDualSenseController:
+        await self.activate()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.deactivate()
+
+    async def activate(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._controller.activate)
+
+    async def deactivate(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._controller.deactivate)
+
+    async def wait_until_updated(self, timeout: float | None = None) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._controller.wait_until_updated, timeout)
+        )
+
+    async def wait_for_state(
+            self, state_name: ReadStateName, predicate: Callable[[Any], bool], timeout: float | None = None
+    ) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(self._controller.wait_for_state, state_name, predicate, timeout)
+        )
+
+    async def snapshot(self, timeout: float | None = None) -> ControllerSnapshot | None:
+        # only the first call after enable_snapshots() waits, for the next report. a timeout of 0 does not wait
+        snapshot: ControllerSnapshot | None = self._controller.snapshot(0)
+        if snapshot is not None:
+            return snapshot
+        return await asyncio.get_running_loop().run_in_executor(None, partial(self._controller.snapshot, timeout))
+
+    async def reports(
+            self,
+            maxsize: int = 1,
+            drop_policy: DropPolicy = DropPolicy.LATEST,
+    ) -> AsyncIterator[InReportSnapshot]:
+        queue: AsyncChangeQueue[InReportSnapshot] = AsyncChangeQueue(
+            asyncio.get_running_loop(), maxsize=maxsize, drop_policy=drop_policy
+        )
+
+        def on_updated() -> None:
+            in_report: InReportSnapshot | None = self._controller.in_report_snapshot
+            if in_report is not None:
+                queue.put_threadsafe(in_report)
+
+        self._controller.on_updated(on_updated)
+        try:
+            async for snapshot in queue:
+                yield snapshot
+        finally:
+            self._controller.remove_updated_listener(on_updated)
+            queue.close()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import os
 import warnings
-from typing import Final, Callable
+from typing import Any, Final, Callable
 
-from hidapi_py import HidDeviceInfo
+from hidapi_py import HidDevice, HidDeviceInfo
 
 from dualsense_controller.api.Properties import Properties
 from dualsense_controller.api.enum import UpdateLevel
@@ -22,9 +23,21 @@ from dualsense_controller.api.property.PlayerLedsProperty import PlayerLedsPrope
 from dualsense_controller.api.property.RumbleProperty import RumbleProperty
 from dualsense_controller.api.property.TouchFingerProperty import TouchFingerProperty
 from dualsense_controller.api.property.TriggerProperty import TriggerProperty
+from dualsense_controller.core.ControllerHub import ControllerHub, HubDeviceStats
 from dualsense_controller.core.DualSenseControllerCore import DualSenseControllerCore
-from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.InReportRingBuffer import PipelineStats
+from dualsense_controller.core.OutReportScheduler import OutReportScheduler
+from dualsense_controller.core.enum import ConnectionType, PipelinePolicy
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.InReportSnapshot import InReportSnapshot
+from dualsense_controller.core.recording.SessionRecorder import SessionRecorder
+from dualsense_controller.core.state.CallbackDispatcher import CallbackDispatcher
+from dualsense_controller.core.state.CallbackProfiler import CallbackProfiler
 from dualsense_controller.core.state.mapping.enum import StateValueMapping as Mapping
+from dualsense_controller.core.state.read_state.ControllerSnapshot import ControllerSnapshot
+from dualsense_controller.core.state.read_state.enum import ReadStateName
 from dualsense_controller.core.state.typedef import Number
 
 
@@ -46,6 +59,32 @@ class DualSenseController:
     def is_active(self) -> bool:
         return self._core.is_initialized
 
+    @property
+    def pipeline_stats(self) -> PipelineStats | None:
+        return self._core.pipeline_stats
+
+    @property
+    def hub_stats(self) -> HubDeviceStats | None:
+        return self._core.hub_stats
+
+    @property
+    def in_report_snapshot(self) -> InReportSnapshot | None:
+        # the raw values of the last report, None until the first one arrived
+        in_report: InReport | None = self._core.read_states.in_report
+        return in_report.snapshot if in_report is not None else None
+
+    @property
+    def update_level(self) -> UpdateLevel:
+        return self._update_level
+
+    @update_level.setter
+    def update_level(self, update_level: UpdateLevel) -> None:
+        self._update_level = update_level
+        self._core.set_update_level(
+            enforce_update=update_level.value.enforce_update,
+            can_update_itself=update_level.value.can_update_itself,
+        )
+
     # ############################################# GETTERS READ PROPS ##############################################
 
     # ############ MAIN
@@ -238,6 +277,14 @@ class DualSenseController:
             orientation_threshold: int = 0,
             mapping: Mapping = Mapping.NORMALIZED,
             update_level: UpdateLevel = UpdateLevel.DEFAULT,
+            pipeline_policy: PipelinePolicy | None = None,
+            pipeline_capacity: int = 8,
+            latest_only: bool = False,
+            hid_device: HidDevice | HidrawDevice | ReplayHidDevice | None = None,
+            callback_dispatcher: CallbackDispatcher | None = None,
+            write_scheduler: OutReportScheduler | None = None,
+            write_thread: bool = False,
+            hub: ControllerHub | None = None,
             # OPTS
             microphone_initially_muted: bool = True,
             microphone_invert_led: bool = False,
@@ -245,6 +292,8 @@ class DualSenseController:
 
         warnings.filterwarnings("always", category=UserWarning)
 
+        self._update_level: UpdateLevel = update_level
+
         self._core: DualSenseControllerCore = DualSenseControllerCore(
             device_index_or_device_info=device_index_or_device_info,
             left_joystick_deadzone=left_joystick_deadzone,
@@ -257,6 +306,14 @@ class DualSenseController:
             state_value_mapping=mapping,
             enforce_update=update_level.value.enforce_update,
             can_update_itself=update_level.value.can_update_itself,
+            pipeline_policy=pipeline_policy,
+            pipeline_capacity=pipeline_capacity,
+            latest_only=latest_only,
+            hid_device=hid_device,
+            callback_dispatcher=callback_dispatcher,
+            write_scheduler=write_scheduler,
+            write_thread=write_thread,
+            hub=hub,
         )
 
         self._properties: Properties = Properties(
@@ -275,8 +332,46 @@ class DualSenseController:
     def on_error(self, callback: Callable[[Exception], None]) -> None:
         self._properties.exceptions.on_change(callback)
 
-    def wait_until_updated(self) -> None:
-        return self._core.wait_until_updated()
+    def on_updated(self, callback: Callable[[], None]) -> None:
+        # called in the hid loop thread after all states were updated from a report
+        self._core.on_updated(callback)
+
+    def remove_updated_listener(self, callback: Callable[[], None]) -> None:
+        self._core.remove_updated_listener(callback)
+
+    def wait_until_updated(self, timeout: float | None = None) -> bool:
+        return self._core.wait_until_updated(timeout)
+
+    def wait_for_state(
+            self, state_name: ReadStateName, predicate: Callable[[Any], bool], timeout: float | None = None
+    ) -> bool:
+        return self._core.wait_for_state(state_name, predicate, timeout)
+
+    def enable_snapshots(self) -> None:
+        self._core.enable_snapshots()
+
+    def disable_snapshots(self) -> None:
+        self._core.disable_snapshots()
+
+    def snapshot(self, timeout: float | None = None) -> ControllerSnapshot | None:
+        return self._core.snapshot(timeout)
+
+    def tick(self) -> bool:
+        return self._core.tick()
+
+    def enable_callback_profiling(self, budget: float = 0.001, warn: bool = True) -> CallbackProfiler:
+        profiler: CallbackProfiler = CallbackProfiler(budget_ns=int(budget * 1e9), warn=warn)
+        self._core.set_callback_profiler(profiler)
+        return profiler
+
+    def disable_callback_profiling(self) -> None:
+        self._core.set_callback_profiler(None)
+
+    def start_recording(self, path: str | os.PathLike, mmap_records: int | None = None) -> SessionRecorder:
+        return self._core.start_recording(path, mmap_records)
+
+    def stop_recording(self) -> None:
+        self._core.stop_recording()
 
     def activate(self) -> None:
         self._core.init()
@@ -285,7 +380,7 @@ class DualSenseController:
         else:
             self._properties.microphone.set_unmuted()
         self._properties.microphone.refresh_workaround()
-        self.wait_until_updated()
+        self._core.wait_until_updated()
 
     def deactivate(self) -> None:
         self._core.deinit()
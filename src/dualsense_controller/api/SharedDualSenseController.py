@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import multiprocessing
+import time
+from multiprocessing.connection import Connection as PipeConnection
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event
+from typing import Any, Callable, Final
+
+from hidapi_py import HidDevice, HidDeviceInfo
+
+from dualsense_controller.api.property.AccelerometerProperty import AccelerometerProperty
+from dualsense_controller.api.property.BatteryProperty import BatteryProperty
+from dualsense_controller.api.property.ButtonProperty import ButtonProperty
+from dualsense_controller.api.property.ConnectionProperty import ConnectionProperty
+from dualsense_controller.api.property.GyroscopeProperty import GyroscopeProperty
+from dualsense_controller.api.property.JoyStickProperty import JoyStickProperty
+from dualsense_controller.api.property.OrientationProperty import OrientationProperty
+from dualsense_controller.api.property.TouchFingerProperty import TouchFingerProperty
+from dualsense_controller.api.property.TriggerFeedbackProperty import TriggerFeedbackProperty
+from dualsense_controller.api.property.TriggerProperty import TriggerProperty
+from dualsense_controller.core.HidControllerDevice import HidControllerDevice
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.enum import ConnectionType, EventType
+from dualsense_controller.core.exception import SharedReaderException
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.shared.SharedReadState import SharedReadState
+from dualsense_controller.core.shared.SharedStateLayout import SharedStateEntry, SharedStateLayout
+from dualsense_controller.core.shared.SharedStateReader import SharedStateReader
+from dualsense_controller.core.shared.enum import SharedReaderStatus
+from dualsense_controller.core.shared.reader_process import run_reader_process
+from dualsense_controller.core.state.mapping.enum import StateValueMapping as Mapping
+from dualsense_controller.core.state.read_state.ControllerSnapshot import ControllerSnapshot
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from dualsense_controller.core.state.read_state.value_type import Connection
+from dualsense_controller.core.state.typedef import Number
+
+
+class SharedDualSenseController:
+    # the reader thread and the read states run in a child process, which publishes them into shared memory
+    # after every report. this side only reads, so the application does not compete with the reader for the GIL.
+    # read only: no listeners, no rumble, lightbar or trigger effects
+
+    # ################################################# GETTERS  MISC ##################################################
+
+    @property
+    def connection_type(self) -> ConnectionType:
+        return self._reader.connection_type if self._reader is not None else ConnectionType.UNDEFINED
+
+    @property
+    def is_active(self) -> bool:
+        return (
+                self._reader is not None
+                and self._process.is_alive()
+                and self._reader.status is SharedReaderStatus.RUNNING
+        )
+
+    @property
+    def update_count(self) -> int:
+        # number of reports published so far
+        return self._reader.sequence if self._reader is not None else 0
+
+    @property
+    def errors(self) -> list[str]:
+        # formatted exceptions of the reader process since the last call
+        errors: list[str] = []
+        while self._messages is not None and self._messages.poll():
+            message: str | None = self._messages.recv()
+            if message is not None:
+                errors.append(message)
+        return errors
+
+    # ################################################# GETTERS PROPERTIES ##############################################
+
+    @property
+    def connection(self) -> ConnectionProperty:
+        return self._connection
+
+    @property
+    def battery(self) -> BatteryProperty:
+        return self._battery
+
+    @property
+    def btn_ps(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_PS]
+
+    @property
+    def btn_options(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_OPTIONS]
+
+    @property
+    def btn_create(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_CREATE]
+
+    @property
+    def btn_mute(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_MUTE]
+
+    @property
+    def btn_touchpad(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_TOUCHPAD]
+
+    @property
+    def btn_cross(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_CROSS]
+
+    @property
+    def btn_square(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_SQUARE]
+
+    @property
+    def btn_triangle(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_TRIANGLE]
+
+    @property
+    def btn_circle(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_CIRCLE]
+
+    @property
+    def btn_left(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_LEFT]
+
+    @property
+    def btn_up(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_UP]
+
+    @property
+    def btn_right(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_RIGHT]
+
+    @property
+    def btn_down(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_DOWN]
+
+    @property
+    def btn_l1(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_L1]
+
+    @property
+    def btn_r1(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_R1]
+
+    @property
+    def btn_l2(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_L2]
+
+    @property
+    def btn_r2(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_R2]
+
+    @property
+    def btn_l3(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_L3]
+
+    @property
+    def btn_r3(self) -> ButtonProperty:
+        return self._buttons[ReadStateName.BTN_R3]
+
+    @property
+    def left_trigger(self) -> TriggerProperty:
+        return self._left_trigger
+
+    @property
+    def right_trigger(self) -> TriggerProperty:
+        return self._right_trigger
+
+    @property
+    def left_stick_x(self) -> JoyStickProperty:
+        return self._sticks[ReadStateName.LEFT_STICK_X]
+
+    @property
+    def left_stick_y(self) -> JoyStickProperty:
+        return self._sticks[ReadStateName.LEFT_STICK_Y]
+
+    @property
+    def left_stick(self) -> JoyStickProperty:
+        return self._sticks[ReadStateName.LEFT_STICK]
+
+    @property
+    def right_stick_x(self) -> JoyStickProperty:
+        return self._sticks[ReadStateName.RIGHT_STICK_X]
+
+    @property
+    def right_stick_y(self) -> JoyStickProperty:
+        return self._sticks[ReadStateName.RIGHT_STICK_Y]
+
+    @property
+    def right_stick(self) -> JoyStickProperty:
+        return self._sticks[ReadStateName.RIGHT_STICK]
+
+    @property
+    def touch_finger_1(self) -> TouchFingerProperty:
+        return self._touch_finger_1
+
+    @property
+    def touch_finger_2(self) -> TouchFingerProperty:
+        return self._touch_finger_2
+
+    @property
+    def gyroscope(self) -> GyroscopeProperty:
+        return self._gyroscope
+
+    @property
+    def accelerometer(self) -> AccelerometerProperty:
+        return self._accelerometer
+
+    @property
+    def orientation(self) -> OrientationProperty:
+        return self._orientation
+
+    # ################################################# MAIN ##################################################
+
+    def __init__(
+            self,
+            # CORE
+            device_index_or_device_info: int | HidDeviceInfo = 0,
+            left_joystick_deadzone: Number = 0.05,
+            right_joystick_deadzone: Number = 0.05,
+            left_trigger_deadzone: Number = 0,
+            right_trigger_deadzone: Number = 0,
+            gyroscope_threshold: int = 0,
+            accelerometer_threshold: int = 0,
+            orientation_threshold: int = 0,
+            mapping: Mapping = Mapping.NORMALIZED,
+            # only with the fork start method, a device can not be passed to a spawned process
+            hid_device: HidDevice | HidrawDevice | ReplayHidDevice | None = None,
+            # PROCESS
+            # not the platform default, on linux that is fork, which copies the threads' locks in whatever state
+            start_method: str = 'spawn',
+            start_timeout: float = 5,
+    ):
+        self._context: Final[BaseContext] = multiprocessing.get_context(start_method)
+        if start_method != 'fork':
+            # the arguments are pickled for any other start method
+            assert hid_device is None, 'a hid_device can only be passed with the fork start method'
+            device_index_or_device_info = self._to_device_index(device_index_or_device_info)
+        self._core_kwargs: Final[dict[str, Any]] = dict(
+            device_index_or_device_info=device_index_or_device_info,
+            left_joystick_deadzone=left_joystick_deadzone,
+            right_joystick_deadzone=right_joystick_deadzone,
+            left_trigger_deadzone=left_trigger_deadzone,
+            right_trigger_deadzone=right_trigger_deadzone,
+            gyroscope_threshold=gyroscope_threshold,
+            accelerometer_threshold=accelerometer_threshold,
+            orientation_threshold=orientation_threshold,
+            state_value_mapping=mapping,
+            hid_device=hid_device,
+        )
+        self._start_timeout: Final[float] = start_timeout
+        self._layout: Final[SharedStateLayout] = SharedStateLayout()
+        self._shared_memory: SharedMemory | None = None
+        self._reader: SharedStateReader | None = None
+        self._process: BaseProcess | None = None
+        self._stop: Event | None = None
+        self._messages: PipeConnection | None = None
+
+        self._connection: Final[ConnectionProperty] = ConnectionProperty(
+            SharedReadState(EventType.CONNECTION_CHANGE, self._read_connection, lambda: False)
+        )
+        self._battery: Final[BatteryProperty] = BatteryProperty(self._create_state(ReadStateName.BATTERY))
+        self._buttons: Final[dict[ReadStateName, ButtonProperty]] = {
+            name: ButtonProperty(self._create_state(name)) for name in (
+                ReadStateName.BTN_PS, ReadStateName.BTN_OPTIONS, ReadStateName.BTN_CREATE, ReadStateName.BTN_MUTE,
+                ReadStateName.BTN_TOUCHPAD, ReadStateName.BTN_CROSS, ReadStateName.BTN_SQUARE,
+                ReadStateName.BTN_TRIANGLE, ReadStateName.BTN_CIRCLE, ReadStateName.BTN_LEFT, ReadStateName.BTN_UP,
+                ReadStateName.BTN_RIGHT, ReadStateName.BTN_DOWN, ReadStateName.BTN_L1, ReadStateName.BTN_R1,
+                ReadStateName.BTN_L2, ReadStateName.BTN_R2, ReadStateName.BTN_L3, ReadStateName.BTN_R3,
+            )
+        }
+        self._left_trigger: Final[TriggerProperty] = TriggerProperty(
+            trigger_value_state=self._create_state(ReadStateName.LEFT_TRIGGER_VALUE),
+            trigger_feedback_property=TriggerFeedbackProperty(
+                self._create_state(ReadStateName.LEFT_TRIGGER_FEEDBACK)
+            ),
+            trigger_effect_property=None,
+        )
+        self._right_trigger: Final[TriggerProperty] = TriggerProperty(
+            trigger_value_state=self._create_state(ReadStateName.RIGHT_TRIGGER_VALUE),
+            trigger_feedback_property=TriggerFeedbackProperty(
+                self._create_state(ReadStateName.RIGHT_TRIGGER_FEEDBACK)
+            ),
+            trigger_effect_property=None,
+        )
+        self._sticks: Final[dict[ReadStateName, JoyStickProperty]] = {
+            name: JoyStickProperty(self._create_state(name)) for name in (
+                ReadStateName.LEFT_STICK_X, ReadStateName.LEFT_STICK_Y, ReadStateName.LEFT_STICK,
+                ReadStateName.RIGHT_STICK_X, ReadStateName.RIGHT_STICK_Y, ReadStateName.RIGHT_STICK,
+            )
+        }
+        self._touch_finger_1: Final[TouchFingerProperty] = TouchFingerProperty(
+            self._create_state(ReadStateName.TOUCH_FINGER_1)
+        )
+        self._touch_finger_2: Final[TouchFingerProperty] = TouchFingerProperty(
+            self._create_state(ReadStateName.TOUCH_FINGER_2)
+        )
+        self._gyroscope: Final[GyroscopeProperty] = GyroscopeProperty(self._create_state(ReadStateName.GYROSCOPE))
+        self._accelerometer: Final[AccelerometerProperty] = AccelerometerProperty(
+            self._create_state(ReadStateName.ACCELEROMETER)
+        )
+        self._orientation: Final[OrientationProperty] = OrientationProperty(
+            self._create_state(ReadStateName.ORIENTATION)
+        )
+
+    @staticmethod
+    def _to_device_index(device_index_or_device_info: int | HidDeviceInfo) -> int:
+        # a device info of hidapi can not be pickled, the child enumerates the same devices in the same order
+        if isinstance(device_index_or_device_info, int):
+            return device_index_or_device_info
+        paths: list[str] = [device_info.path for device_info in HidControllerDevice.enumerate_devices()]
+        assert device_index_or_device_info.path in paths, 'device not found'
+        return paths.index(device_index_or_device_info.path)
+
+    def __enter__(self) -> SharedDualSenseController:
+        self.activate()
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.deactivate()
+
+    def activate(self) -> None:
+        assert self._process is None, 'already activated'
+        shared_memory: SharedMemory = SharedMemory(create=True, size=self._layout.size)
+        messages, child_messages = self._context.Pipe(duplex=False)
+        stop: Event = self._context.Event()
+        process: BaseProcess = self._context.Process(
+            target=run_reader_process,
+            args=(shared_memory.name, stop, child_messages, self._core_kwargs),
+            name='DualSenseReader',
+            daemon=True,
+        )
+        process.start()
+        child_messages.close()
+        self._shared_memory, self._messages, self._stop, self._process = shared_memory, messages, stop, process
+        self._reader = SharedStateReader(shared_memory.buf, self._layout)
+
+        error: str | None
+        if not messages.poll(self._start_timeout):
+            error = 'not started in time'
+        else:
+            try:
+                error = messages.recv()
+            except EOFError:
+                error = f'exited with code {process.exitcode}'
+        if error is not None:
+            self.deactivate()
+            raise SharedReaderException(error)
+        self.wait_until_updated(self._start_timeout)
+
+    def deactivate(self) -> None:
+        assert self._process is not None, 'not activated yet'
+        self._stop.set()
+        self._process.join(self._start_timeout)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._messages.close()
+        # the reader's view of the memory is released by close(), values read afterwards raise
+        self._reader = None
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+        self._shared_memory, self._messages, self._stop, self._process = None, None, None, None
+
+    def wait_until_updated(self, timeout: float | None = None) -> bool:
+        if self._reader is None:
+            return False
+        return self._reader.wait_for_sequence(self._reader.sequence, timeout)
+
+    def snapshot(self, timeout: float | None = None) -> ControllerSnapshot | None:
+        # published with every report anyway, only the first one is waited for
+        if self._reader is None:
+            return None
+        snapshot: ControllerSnapshot | None = self._reader.read_snapshot()
+        if snapshot is None and self._reader.wait_for_sequence(0, timeout):
+            snapshot = self._reader.read_snapshot()
+        return snapshot
+
+    def wait_for_state(
+            self, state_name: ReadStateName, predicate: Callable[[Any], bool], timeout: float | None = None
+    ) -> bool:
+        if self._reader is None:
+            return False
+        entry: SharedStateEntry = self._layout.get_entry(state_name)
+        deadline: float | None = None if timeout is None else time.perf_counter() + timeout
+        sequence: int = self._reader.sequence
+        # None until the first report was published
+        while (value := self._reader.read_value(entry)) is None or not predicate(value):
+            remaining: float | None = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0 or not self._reader.wait_for_sequence(sequence, remaining):
+                return False
+            sequence = self._reader.sequence
+        return True
+
+    def _create_state(self, name: ReadStateName) -> SharedReadState[Any]:
+        entry: SharedStateEntry = self._layout.get_entry(name)
+        return SharedReadState(
+            name,
+            lambda: self._reader.read_value(entry) if self._reader is not None else None,
+            lambda: self._reader.read_changed(entry) if self._reader is not None else False,
+        )
+
+    def _read_connection(self) -> Connection:
+        return Connection(self.is_active, self.connection_type)
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Generic
+
+from dualsense_controller.api.typedef import PropertyType
+
+
+@dataclass(frozen=True, slots=True)
+class StateChange(Generic[PropertyType]):
+    old_value: PropertyType | None
+    value: PropertyType
+    timestamp: int
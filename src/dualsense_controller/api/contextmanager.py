@@ -1,10 +1,16 @@
 from contextlib import contextmanager
 from typing import Generator
 
-from hidapi_py import HidDeviceInfo
+from hidapi_py import HidDevice, HidDeviceInfo
 
 from dualsense_controller.api.DualSenseController import DualSenseController, Mapping
 from dualsense_controller.api.enum import UpdateLevel
+from dualsense_controller.core.ControllerHub import ControllerHub
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.OutReportScheduler import OutReportScheduler
+from dualsense_controller.core.enum import PipelinePolicy
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.state.CallbackDispatcher import CallbackDispatcher
 from dualsense_controller.core.state.typedef import Number
 
 
@@ -21,6 +27,14 @@ def active_dualsense_controller(
         orientation_threshold: int = 0,
         mapping: Mapping = Mapping.NORMALIZED,
         update_level: UpdateLevel = UpdateLevel.DEFAULT,
+        pipeline_policy: PipelinePolicy | None = None,
+        pipeline_capacity: int = 8,
+        latest_only: bool = False,
+        hid_device: HidDevice | HidrawDevice | ReplayHidDevice | None = None,
+        callback_dispatcher: CallbackDispatcher | None = None,
+        write_scheduler: OutReportScheduler | None = None,
+        write_thread: bool = False,
+        hub: ControllerHub | None = None,
         # OPTS
         microphone_initially_muted: bool = True,
         microphone_invert_led: bool = False,
@@ -36,6 +50,14 @@ def active_dualsense_controller(
         orientation_threshold=orientation_threshold,
         mapping=mapping,
         update_level=update_level,
+        pipeline_policy=pipeline_policy,
+        pipeline_capacity=pipeline_capacity,
+        latest_only=latest_only,
+        hid_device=hid_device,
+        callback_dispatcher=callback_dispatcher,
+        write_scheduler=write_scheduler,
+        write_thread=write_thread,
+        hub=hub,
         microphone_initially_muted=microphone_initially_muted,
         microphone_invert_led=microphone_invert_led,
     )
@@ -25,3 +25,12 @@ class UpdateLevel(Enum):
         can_update_itself=False,
     )
     DEFAULT = LAZY
+
+
+class DropPolicy(Enum):
+    # a full queue discards its oldest item to make room for the new one
+    DROP_OLDEST = 'DROP_OLDEST'
+    # a full queue discards the new item
+    DROP_NEWEST = 'DROP_NEWEST'
+    # only the latest item is kept, regardless of the queue size
+    LATEST = 'LATEST'
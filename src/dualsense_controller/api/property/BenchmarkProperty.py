@@ -1,5 +1,6 @@
 from dualsense_controller.api.property.base import Property
-from dualsense_controller.core.Benchmarker import Benchmark
+from dualsense_controller.core.Benchmarker import Benchmark, PipelineHistograms
+from dualsense_controller.core.LatencyHistogram import LatencyStats
 
 
 class BenchmarkProperty(Property[Benchmark]):
@@ -7,3 +8,17 @@ class BenchmarkProperty(Property[Benchmark]):
     @property
     def value(self) -> Benchmark:
         return self._get_value()
+
+    @property
+    def histograms(self) -> PipelineHistograms | None:
+        benchmark: Benchmark | None = self._get_value()
+        return benchmark.histograms if benchmark is not None else None
+
+    def stats(self) -> dict[str, LatencyStats]:
+        histograms: PipelineHistograms | None = self.histograms
+        return histograms.stats() if histograms is not None else {}
+
+    def reset(self) -> None:
+        histograms: PipelineHistograms | None = self.histograms
+        if histograms is not None:
+            histograms.reset()
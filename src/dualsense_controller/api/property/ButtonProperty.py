@@ -10,6 +10,12 @@ class ButtonProperty(BoolProperty):
     def on_up(self, callback: Callable[[], None]):
         self._on_false(callback)
 
+    async def wait_pressed(self, timeout: float | None = None) -> None:
+        await self._wait_for_change(lambda pressed: pressed is True, timeout)
+
+    async def wait_released(self, timeout: float | None = None) -> None:
+        await self._wait_for_change(lambda pressed: pressed is False, timeout)
+
     @property
     def pressed(self) -> bool:
-        return self._get_value()
\ No newline at end of file
+        return self._get_value()
@@ -1,7 +1,11 @@
+import asyncio
 from abc import ABC
 from functools import partial
-from typing import Final, Generic, Callable
+from typing import AsyncIterator, Final, Generic, Callable
 
+from dualsense_controller.api.AsyncChangeQueue import AsyncChangeQueue
+from dualsense_controller.api.StateChange import StateChange
+from dualsense_controller.api.enum import DropPolicy
 from dualsense_controller.api.typedef import PropertyType
 from dualsense_controller.core.state.State import State
 from dualsense_controller.core.state.typedef import Number
@@ -18,6 +22,26 @@ class Property(Generic[PropertyType], ABC):
     def once_change(self, callback: Callable[[PropertyType], None]):
         self._state.once_change(callback)
 
+    async def changes(
+            self,
+            maxsize: int = 64,
+            drop_policy: DropPolicy = DropPolicy.DROP_OLDEST,
+    ) -> AsyncIterator[StateChange[PropertyType]]:
+        queue: AsyncChangeQueue[StateChange[PropertyType]] = AsyncChangeQueue(
+            asyncio.get_running_loop(), maxsize=maxsize, drop_policy=drop_policy
+        )
+
+        def on_change(old_value: PropertyType, value: PropertyType, timestamp: int) -> None:
+            queue.put_threadsafe(StateChange(old_value, value, timestamp))
+
+        self._state.on_change(on_change)
+        try:
+            async for change in queue:
+                yield change
+        finally:
+            self._state.remove_change_listener(on_change)
+            queue.close()
+
     @property
     def changed(self) -> bool:
         return self._state.has_changed_since_last_set_value
@@ -31,6 +55,27 @@ class Property(Generic[PropertyType], ABC):
     def _set_value(self, value: PropertyType) -> None:
         self._state.value = value
 
+    async def _wait_for_change(
+            self, predicate: Callable[[PropertyType], bool], timeout: float | None = None
+    ) -> PropertyType:
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[PropertyType] = loop.create_future()
+
+        def resolve(value: PropertyType) -> None:
+            if not future.done():
+                future.set_result(value)
+
+        def on_change(value: PropertyType) -> None:
+            if value is not None and predicate(value) and not AsyncChangeQueue.call_soon_threadsafe(loop, resolve, value):
+                # the waiting loop is gone, no need to be called again
+                self._state.remove_change_listener(on_change)
+
+        self._state.on_change(on_change)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._state.remove_change_listener(on_change)
+
 
 class GetNumberProperty(Property[Number], ABC):
 
@@ -1,38 +1,79 @@
-from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from time import perf_counter_ns
 from typing import Final
 
+from dualsense_controller.core.LatencyHistogram import LatencyHistogram, LatencyStats
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineHistograms:
+    # time between two in reports
+    interval: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # in report bytes to snapshot
+    decode: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # read state update without the change callbacks
+    update: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # change and update callbacks
+    callbacks: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # out report encoding and write
+    write: LatencyHistogram = field(default_factory=LatencyHistogram)
+    # first write state change to the out report written
+    write_latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def stats(self) -> dict[str, LatencyStats]:
+        return {
+            'interval': self.interval.stats(),
+            'decode': self.decode.stats(),
+            'update': self.update.stats(),
+            'callbacks': self.callbacks.stats(),
+            'write': self.write.stats(),
+            'write_latency': self.write_latency.stats(),
+        }
+
+    def reset(self) -> None:
+        for histogram in (
+                self.interval, self.decode, self.update, self.callbacks, self.write, self.write_latency
+        ):
+            histogram.reset()
+
 
 @dataclass
 class Benchmark:
     duration: float
     per_second: int
+    histograms: PipelineHistograms | None = None
 
 
 _ONE_SECOND_NS: Final[float] = 1e+9
 
 
 class Benchmarker:
+
+    @property
+    def histograms(self) -> PipelineHistograms:
+        return self._histograms
+
     def __init__(self, maxsize: int = 50):
-        self._durations_queue: Final[deque] = deque(maxlen=maxsize)
+        # exponential moving average, weighted like a mean over the last maxsize durations
+        self._alpha: Final[float] = 2 / (maxsize + 1)
+        self._duration_mean: float | None = None
         self._last_time: int | None = None
+        self._histograms: Final[PipelineHistograms] = PipelineHistograms()
 
     def update(self) -> Benchmark | None:
         current: int = perf_counter_ns()
         if self._last_time is None:
             self._last_time = current
             return None
-        duration: int = perf_counter_ns() - current
+        duration: int = current - self._last_time
         self._last_time = current
-        self._durations_queue.append(duration)
-
-        sum_dur: int = 0
-        for dur in self._durations_queue:
-            sum_dur += dur
+        self._histograms.interval.record(duration)
 
-        duration_mean: float = sum_dur / len(self._durations_queue)
+        duration_mean: float | None = self._duration_mean
+        duration_mean = duration if duration_mean is None else duration_mean + self._alpha * (duration - duration_mean)
+        self._duration_mean = duration_mean
         return Benchmark(
             duration=duration_mean,
-            per_second=int(_ONE_SECOND_NS / duration_mean)
+            per_second=int(_ONE_SECOND_NS / duration_mean) if duration_mean > 0 else 0,
+            histograms=self._histograms,
         )
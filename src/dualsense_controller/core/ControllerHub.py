@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import os
+import select
+import threading
+import time
+from dataclasses import dataclass
+from threading import Condition, Lock, Thread
+from typing import Final, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dualsense_controller.core.HidControllerDevice import HidControllerDevice
+
+# seconds a worker with several devices waits for a report of each, the shortest wait hidapi knows.
+# a silent device costs the others one such wait per round, idle workers wait instead of spinning
+_SHARED_WORKER_TIMEOUT: Final[float] = 0.001
+
+@dataclass(frozen=True, slots=True)
+class HubDeviceStats:
+    reports: int
+    # time spent processing the reports, callbacks included
+    busy_time_ns: int
+    # read through epoll or by a worker of the pool
+    polled: bool
+
+
+class _Entry:
+    __slots__ = ('device', 'fd', 'lock', 'removed', 'reports', 'busy_time_ns')
+
+    def __init__(self, device: HidControllerDevice, fd: int | None):
+        self.device: Final[HidControllerDevice] = device
+        self.fd: Final[int | None] = fd
+        # held while the device is serviced, so unregistering waits for a running read
+        self.lock: Final[Lock] = Lock()
+        self.removed: bool = False
+        self.reports: int = 0
+        self.busy_time_ns: int = 0
+
+
+class _Worker:
+    __slots__ = ('entries', 'thread')
+
+    def __init__(self):
+        # replaced on change, the worker iterates over the current tuple
+        self.entries: tuple[_Entry, ...] = ()
+        self.thread: Thread | None = None
+
+
+class ControllerHub:
+    # services many controllers from few threads instead of one reader thread per controller.
+    # devices with a descriptor (HidrawDevice) are waited for by one epoll thread,
+    # all others are spread over a pool of num_workers threads that read their devices in turn.
+    # every device gets at most one report per round, so a busy controller can not starve the others
+
+    @property
+    def num_devices(self) -> int:
+        return len(self._entries)
+
+    def __init__(self, num_workers: int = 1, poll_timeout: float = 0.1):
+        assert num_workers > 0, 'at least one worker'
+        self._poll_timeout: Final[float] = poll_timeout
+        self._lock: Final[Lock] = Lock()
+        self._workers_changed: Final[Condition] = Condition(self._lock)
+        self._entries: Final[dict[HidControllerDevice, _Entry]] = {}
+        self._closed: bool = False
+
+        # #### epoll, for devices with a descriptor
+        self._epoll: select.epoll | None = None
+        self._fd_entries: Final[dict[int, _Entry]] = {}
+        self._wakeup_fds: tuple[int, int] | None = None
+        self._poll_thread: Thread | None = None
+
+        # #### worker pool, for blocking devices
+        self._workers: Final[tuple[_Worker, ...]] = tuple(_Worker() for _ in range(num_workers))
+
+    def __enter__(self) -> ControllerHub:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def register(self, device: HidControllerDevice) -> None:
+        fd: int | None = device.fileno()
+        with self._lock:
+            assert not self._closed, 'hub closed'
+            assert device not in self._entries, 'device already registered'
+            entry: _Entry = _Entry(device, fd)
+            self._entries[device] = entry
+            if fd is not None:
+                self._register_polled(entry)
+            else:
+                self._register_blocking(entry)
+
+    def unregister(self, device: HidControllerDevice) -> None:
+        with self._lock:
+            entry: _Entry | None = self._entries.pop(device, None)
+            if entry is None:
+                return
+            self._remove(entry)
+        # a read running right now ends with the next report or after poll_timeout at the latest
+        with entry.lock:
+            pass
+
+    def stats(self, device: HidControllerDevice) -> HubDeviceStats | None:
+        entry: _Entry | None = self._entries.get(device)
+        if entry is None:
+            return None
+        return HubDeviceStats(reports=entry.reports, busy_time_ns=entry.busy_time_ns, polled=entry.fd is not None)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._workers_changed.notify_all()
+        # devices still registered are left to their controllers, the hub only stops servicing them
+        if self._wakeup_fds is not None:
+            os.write(self._wakeup_fds[1], b'\x00')
+        threads: list[Thread | None] = [self._poll_thread] + [worker.thread for worker in self._workers]
+        for thread in threads:
+            if thread is not None and thread is not threading.current_thread():
+                thread.join()
+        if self._epoll is not None:
+            self._epoll.close()
+        if self._wakeup_fds is not None:
+            for fd in self._wakeup_fds:
+                os.close(fd)
+
+    # ################################################# EPOLL ##################################################
+
+    def _register_polled(self, entry: _Entry) -> None:
+        if self._epoll is None:
+            self._epoll = select.epoll()
+            self._wakeup_fds = os.pipe()
+            self._epoll.register(self._wakeup_fds[0], select.EPOLLIN)
+            self._poll_thread = Thread(target=self._poll_loop, daemon=True, name='ControllerHub-poll')
+            self._poll_thread.start()
+        self._fd_entries[entry.fd] = entry
+        self._epoll.register(entry.fd, select.EPOLLIN)
+
+    def _poll_loop(self) -> None:
+        epoll: select.epoll = self._epoll
+        wakeup_fd: int = self._wakeup_fds[0]
+        while not self._closed:
+            # level triggered, a device with more queued reports is ready again in the next round
+            for fd, _ in epoll.poll(self._poll_timeout):
+                if fd == wakeup_fd:
+                    continue
+                entry: _Entry | None = self._fd_entries.get(fd)
+                if entry is not None:
+                    # ready, the read returns at once
+                    self._service(entry, 0)
+
+    # ############################################## WORKER POOL ###############################################
+
+    def _register_blocking(self, entry: _Entry) -> None:
+        worker: _Worker = min(self._workers, key=lambda candidate: len(candidate.entries))
+        worker.entries = worker.entries + (entry,)
+        if worker.thread is None:
+            worker.thread = Thread(
+                target=self._worker_loop, args=(worker,), daemon=True,
+                name=f'ControllerHub-worker-{self._workers.index(worker)}',
+            )
+            worker.thread.start()
+        self._workers_changed.notify_all()
+
+    def _worker_loop(self, worker: _Worker) -> None:
+        while not self._closed:
+            entries: tuple[_Entry, ...] = worker.entries
+            if not entries:
+                with self._lock:
+                    while not self._closed and not worker.entries:
+                        self._workers_changed.wait()
+                continue
+            # a single device is waited for up to poll_timeout, several only shortly each, so a silent device
+            # does not hold back the others. either way a read ends in time for unregister and close
+            timeout: float = self._poll_timeout if len(entries) == 1 else _SHARED_WORKER_TIMEOUT
+            for entry in entries:
+                self._service(entry, timeout)
+
+    # ################################################## BOTH ##################################################
+
+    def _service(self, entry: _Entry, timeout: float) -> None:
+        with entry.lock:
+            if entry.removed:
+                return
+            try:
+                buffer: bytes = entry.device.read_in_report(timeout)
+                if not buffer:
+                    return
+                start: int = time.perf_counter_ns()
+                entry.device.handle_in_report(buffer)
+                entry.busy_time_ns += time.perf_counter_ns() - start
+                entry.reports += 1
+            except Exception as exception:
+                # like the own reader thread of a device, a failing device is not read any further
+                with self._lock:
+                    self._remove(entry)
+                entry.device.emit_exception(exception)
+
+    def _remove(self, entry: _Entry) -> None:
+        # with the lock held. the stats of a failed device stay until it gets unregistered
+        entry.removed = True
+        if entry.fd is not None and self._fd_entries.pop(entry.fd, None) is not None:
+            self._epoll.unregister(entry.fd)
+        for worker in self._workers:
+            if entry in worker.entries:
+                worker.entries = tuple(other for other in worker.entries if other is not entry)
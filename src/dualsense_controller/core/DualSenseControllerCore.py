@@ -1,21 +1,37 @@
-from typing import Final
+import os
+import time
+from threading import Event
+from typing import Any, Callable, Final
 
-from hidapi_py import HidDeviceInfo
+from hidapi_py import HidDevice, HidDeviceInfo
 
-from dualsense_controller.core.Benchmarker import Benchmark, Benchmarker
+from dualsense_controller.core.Benchmarker import Benchmark, Benchmarker, PipelineHistograms
+from dualsense_controller.core.ControllerHub import ControllerHub, HubDeviceStats
 from dualsense_controller.core.HidControllerDevice import HidControllerDevice
-from dualsense_controller.core.enum import ConnectionType, EventType
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.InReportRingBuffer import PipelineStats
+from dualsense_controller.core.OutReportScheduler import OutReportScheduler
+from dualsense_controller.core.OutReportWriter import OutReportWriter
+from dualsense_controller.core.ReportCoalescer import ReportCoalescer
+from dualsense_controller.core.enum import ConnectionType, EventType, PipelinePolicy
+from dualsense_controller.core.exception import SnapshotsNotEnabledException
 from dualsense_controller.core.log import Log
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.recording.SessionRecorder import SessionRecorder
 from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.out_report.OutReport import OutReport
+from dualsense_controller.core.state.CallbackDispatcher import CallbackDispatcher
+from dualsense_controller.core.state.CallbackProfiler import CallbackProfiler
 from dualsense_controller.core.state.State import State
 from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
 from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ControllerSnapshot import ControllerSnapshot
 from dualsense_controller.core.state.read_state.ReadStates import ReadStates
 from dualsense_controller.core.state.read_state.enum import ReadStateName
 from dualsense_controller.core.state.read_state.value_type import Connection
 from dualsense_controller.core.state.typedef import Number, StateChangeCallback
 from dualsense_controller.core.state.write_state.WriteStates import WriteStates
-from dualsense_controller.core.state.write_state.enum import WriteStateName
+from dualsense_controller.core.state.write_state.enum import WritePriority, WriteStateName
 from dualsense_controller.core.typedef import EmptyCallback
 from dualsense_controller.core.util import format_exception
 
@@ -44,6 +60,14 @@ class DualSenseControllerCore:
     def connection_type(self) -> ConnectionType:
         return self._hid_controller_device.connection_type
 
+    @property
+    def pipeline_stats(self) -> PipelineStats | None:
+        return self._hid_controller_device.pipeline_stats
+
+    @property
+    def hub_stats(self) -> HubDeviceStats | None:
+        return self._hid_controller_device.hub_stats
+
     # ######################################### SPECIAL STATES  ##########################################v
 
     @property
@@ -54,6 +78,10 @@ class DualSenseControllerCore:
     def update_benchmark_state(self) -> State[Benchmark]:
         return self._update_benchmark_state
 
+    @property
+    def write_scheduler(self) -> OutReportScheduler | None:
+        return self._write_scheduler
+
     @property
     def exception_state(self) -> State[Exception]:
         return self._exception_state
@@ -75,10 +103,24 @@ class DualSenseControllerCore:
             # ##### CORE #####
             enforce_update: bool = False,
             can_update_itself: bool = True,
+            pipeline_policy: PipelinePolicy | None = None,
+            pipeline_capacity: int = 8,
+            latest_only: bool = False,
+            hid_device: HidDevice | HidrawDevice | ReplayHidDevice | None = None,
+            callback_dispatcher: CallbackDispatcher | None = None,
+            write_scheduler: OutReportScheduler | None = None,
+            write_thread: bool = False,
+            hub: ControllerHub | None = None,
     ):
 
         # HARDWARE
-        self._hid_controller_device: HidControllerDevice = HidControllerDevice(device_index_or_device_info)
+        self._hid_controller_device: HidControllerDevice = HidControllerDevice(
+            device_index_or_device_info,
+            pipeline_policy=pipeline_policy,
+            pipeline_capacity=pipeline_capacity,
+            hid_device=hid_device,
+            hub=hub,
+        )
 
         # SPECIAL STATES
         self._connection_state: Final[State[Connection]] = State(
@@ -95,6 +137,14 @@ class DualSenseControllerCore:
 
         # MAIN
         self._update_benchmark: Final[Benchmarker] = Benchmarker()
+        # latest only: the reader thread only collects reports, states are updated by the consumer's tick()
+        self._report_coalescer: Final[ReportCoalescer | None] = ReportCoalescer() if latest_only else None
+        self._tick_in_report: InReport | None = None
+        # without a scheduler every change is written with the next in report
+        if write_thread and write_scheduler is None:
+            # the write thread is always rate limited, changes are not held back though
+            write_scheduler = OutReportScheduler(coalesce_window={priority: 0 for priority in WritePriority})
+        self._write_scheduler: Final[OutReportScheduler | None] = write_scheduler
 
         state_value_mapper: StateValueMapper = StateValueMapper(
             mapping=state_value_mapping,
@@ -117,26 +167,94 @@ class DualSenseControllerCore:
             state_value_mapper=state_value_mapper,
         )
 
+        # write thread: changes are written as soon as they are due instead of with the next in report
+        self._out_report_writer: Final[OutReportWriter | None] = OutReportWriter(
+            due_at=self._get_write_due_at,
+            write=self._write_out_report,
+            on_exception=self._on_thread_exception,
+        ) if write_thread else None
+        if self._out_report_writer is not None:
+            self._write_states.on_changed(self._out_report_writer.notify)
+
         self._hid_controller_device.on_exception(self._on_thread_exception)
         self._hid_controller_device.on_in_report(self._on_in_report)
 
+        self._callback_dispatcher: CallbackDispatcher | None = None
+        self.set_callback_dispatcher(callback_dispatcher)
+
     def on_updated(self, callback: EmptyCallback) -> None:
         self._read_states.on_updated(callback)
 
     def once_updated(self, callback: EmptyCallback) -> None:
         self._read_states.once_updated(callback)
 
-    def wait_until_updated(self) -> None:
-
-        wait: bool = True
-
-        def on_updated() -> None:
-            nonlocal wait
-            wait = False
-
-        self._read_states.once_updated(on_updated)
-        while wait:
-            pass
+    def remove_updated_listener(self, callback: EmptyCallback) -> None:
+        self._read_states.remove_updated_listener(callback)
+
+    def wait_until_updated(self, timeout: float | None = None) -> bool:
+        if self._report_coalescer is None:
+            return self._read_states.wait_until_updated(timeout)
+        # latest only, nobody else updates the states while waiting, so the waiting thread ticks itself
+        return self._report_coalescer.wait(timeout) and self.tick()
+
+    def wait_for_state(
+            self, state_name: ReadStateName, predicate: Callable[[Any], bool], timeout: float | None = None
+    ) -> bool:
+        if self._report_coalescer is None:
+            return self._read_states.wait_for(state_name, predicate, timeout)
+
+        matched: Final[Event] = Event()
+
+        def on_change(value: Any) -> None:
+            if value is not None and predicate(value):
+                matched.set()
+
+        deadline: float | None = None if timeout is None else time.perf_counter() + timeout
+        state: State[Any] = self._read_states.get_state(state_name)
+        self._read_states.on_change(state_name, on_change)
+        try:
+            # the current value is checked after every update too, the first one is set without a change
+            while not matched.is_set() and (state.value_raw is None or not predicate(state.value)):
+                remaining: float | None = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0 or not self.wait_until_updated(remaining):
+                    return False
+            return True
+        finally:
+            self._read_states.remove_change_listener(state_name, on_change)
+
+    def enable_snapshots(self) -> None:
+        self._read_states.enable_snapshots()
+
+    def disable_snapshots(self) -> None:
+        self._read_states.disable_snapshots()
+
+    def snapshot(self, timeout: float | None = None) -> ControllerSnapshot | None:
+        # created with every report while enabled, so the first call after enabling waits for the next report
+        if not self._read_states.snapshots_enabled:
+            raise SnapshotsNotEnabledException
+        deadline: float | None = None if timeout is None else time.perf_counter() + timeout
+        snapshot: ControllerSnapshot | None = self._read_states.snapshot
+        while snapshot is None:
+            remaining: float | None = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0 or not self.wait_until_updated(remaining):
+                return None
+            snapshot = self._read_states.snapshot
+        return snapshot
+
+    def tick(self) -> bool:
+        assert self._report_coalescer is not None, 'tick() is only available in latest only mode'
+        raw_reports: list[bytes] = self._report_coalescer.pop()
+        if not raw_reports:
+            return False
+        in_report: InReport | None = self._tick_in_report
+        if in_report is None:
+            # own in report, the one of the device is updated by the reader thread in the meantime
+            in_report = self._tick_in_report = type(self._hid_controller_device.in_report)()
+        measure: bool = self._update_benchmark_state.has_listeners
+        for raw_bytes in raw_reports:
+            in_report.update(raw_bytes)
+            self._update_read_states(in_report, measure)
+        return True
 
     def on_connection_change(self, callback: StateChangeCallback):
         self._connection_state.on_change(callback)
@@ -156,34 +274,131 @@ class DualSenseControllerCore:
     def once_any_state_change(self, callback: StateChangeCallback):
         self._read_states.once_any_change(callback)
 
+    def set_update_level(self, enforce_update: bool, can_update_itself: bool) -> None:
+        self._read_states.set_update_level(enforce_update, can_update_itself)
+
+    def start_recording(self, path: str | os.PathLike, mmap_records: int | None = None) -> SessionRecorder:
+        assert self._hid_controller_device.recorder is None, 'already recording'
+        recorder: SessionRecorder = SessionRecorder(path, mmap_records=mmap_records)
+        self._hid_controller_device.recorder = recorder
+        return recorder
+
+    def stop_recording(self) -> None:
+        recorder: SessionRecorder | None = self._hid_controller_device.recorder
+        if recorder is not None:
+            self._hid_controller_device.recorder = None
+            recorder.close()
+
+    def set_callback_profiler(self, profiler: CallbackProfiler | None) -> None:
+        self._read_states.set_callback_profiler(profiler)
+        for state in (self._connection_state, self._update_benchmark_state, self._exception_state):
+            state.set_callback_profiler(profiler)
+
+    def set_callback_dispatcher(self, dispatcher: CallbackDispatcher | None) -> None:
+        # exception callbacks stay inline, a raising exception callback must not feed the dispatcher itself
+        if dispatcher is not None and dispatcher is not self._callback_dispatcher:
+            dispatcher.on_exception(self._on_thread_exception)
+        self._callback_dispatcher = dispatcher
+        self._read_states.set_callback_dispatcher(dispatcher)
+        for state in (self._connection_state, self._update_benchmark_state):
+            state.set_callback_dispatcher(dispatcher)
+
     def set_state(self, state_name: WriteStateName, value: Number):
         self._write_states.set_value(state_name, value)
 
     def init(self) -> None:
         assert self._hid_controller_device.is_opened is False, 'already opened'
         self._hid_controller_device.open()
+        if self._out_report_writer is not None:
+            self._out_report_writer.start()
         self._connection_state.value = Connection(True, self._hid_controller_device.connection_type)
 
     def deinit(self) -> None:
         assert self._hid_controller_device.is_opened is True, 'not opened yet'
+        if self._out_report_writer is not None:
+            self._out_report_writer.stop()
         self._hid_controller_device.close()
+        self.stop_recording()
         self._connection_state.value = Connection(False, self._hid_controller_device.connection_type)
 
     def _on_in_report(self, in_report: InReport) -> None:
-
-        self._read_states.update(in_report, self._hid_controller_device.connection_type)
-
-        if self._write_states.has_changed and self._hid_controller_device.out_report is not None:
-            # print(f'Sending report.')
-            self._write_states.update_out_report(self._hid_controller_device.out_report)
-            self._write_states.set_unchanged()
-            self._hid_controller_device.write()
-
-        if self._update_benchmark_state.has_listeners:
+        # the histograms are only recorded while somebody listens to the benchmark
+        measure: bool = self._update_benchmark_state.has_listeners
+
+        if self._report_coalescer is not None:
+            self._report_coalescer.push(in_report)
+        else:
+            self._update_read_states(in_report, measure)
+
+        if (
+                self._out_report_writer is None
+                and self._write_states.has_changed
+                and self._hid_controller_device.out_report is not None
+                and self._is_write_due()
+        ):
+            self._write_out_report()
+
+        if measure:
             benchmark = self._update_benchmark.update()
             if benchmark is not None:
                 self._update_benchmark_state.value = benchmark
 
+    def _write_out_report(self) -> None:
+        out_report: OutReport | None = self._hid_controller_device.out_report
+        if out_report is None:
+            return
+        # taken before the states are read, so a change set by another thread meanwhile is written the next time
+        changed_timestamp: int | None = self._write_states.take_changed()
+        if changed_timestamp is None:
+            return
+        measure: bool = self._update_benchmark_state.has_listeners
+        start: int = time.perf_counter_ns() if measure else 0
+        # print(f'Sending report.')
+        self._write_states.update_out_report(out_report)
+        self._write_states.reset_flags_controls()
+        self._hid_controller_device.write()
+        if self._write_scheduler is not None:
+            self._write_scheduler.written()
+        if measure:
+            end: int = time.perf_counter_ns()
+            self._update_benchmark.histograms.write.record(end - start)
+            self._update_benchmark.histograms.write_latency.record(end - changed_timestamp)
+
+    def _get_write_due_at(self) -> int | None:
+        priority: WritePriority | None = self._write_states.changed_priority
+        if priority is None or self._hid_controller_device.out_report is None:
+            return None
+        if self._write_scheduler is None:
+            return 0
+        return self._write_scheduler.due_at(
+            priority, self._write_states.changed_timestamp, self._hid_controller_device.connection_type
+        )
+
+    def _is_write_due(self) -> bool:
+        if self._write_scheduler is None:
+            return True
+        return self._write_scheduler.is_due(
+            self._write_states.changed_priority,
+            self._write_states.changed_timestamp,
+            self._hid_controller_device.connection_type,
+        )
+
+    def _update_read_states(self, in_report: InReport, measure: bool) -> None:
+        read_states: ReadStates = self._read_states
+        read_states.measure_callbacks = measure
+        if not measure:
+            read_states.update(in_report, self._hid_controller_device.connection_type)
+            return
+        start: int = time.perf_counter_ns()
+        in_report.snapshot
+        decoded: int = time.perf_counter_ns()
+        read_states.update(in_report, self._hid_controller_device.connection_type)
+        updated: int = time.perf_counter_ns()
+        histograms: PipelineHistograms = self._update_benchmark.histograms
+        histograms.decode.record(decoded - start)
+        histograms.update.record(updated - decoded - read_states.callback_duration)
+        histograms.callbacks.record(read_states.callback_duration)
+
     def _on_thread_exception(self, exception: Exception) -> None:
         self._exception_state.value = exception
         Log.error('An Exception in the loop thread occured:', format_exception(exception))
@@ -1,14 +1,21 @@
+from __future__ import annotations
+
 import threading
 from threading import Thread
-from typing import Final
+from typing import Final, TYPE_CHECKING
 
 import pyee
 from hidapi_py import HidDevice, HidDeviceInfo, get_all_device_infos
 
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.InReportRingBuffer import InReportRingBuffer, PipelineStats
 from dualsense_controller.core.core.Lockable import Lockable
-from dualsense_controller.core.enum import ConnectionType, EventType
+from dualsense_controller.core.enum import ConnectionType, EventType, PipelinePolicy
 from dualsense_controller.core.exception import InvalidDeviceIndexException, InvalidInReportLengthException
 from dualsense_controller.core.log import Log
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.recording.SessionRecorder import SessionRecorder
+from dualsense_controller.core.recording.enum import ReportDirection
 from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
 from dualsense_controller.core.report.in_report.Bt31InReport import Bt31InReport
 from dualsense_controller.core.report.in_report.InReport import InReport
@@ -21,6 +28,9 @@ from dualsense_controller.core.report.out_report.OutReport import OutReport
 from dualsense_controller.core.report.out_report.Usb01OutReport import Usb01OutReport
 from dualsense_controller.core.typedef import ExceptionCallback
 
+if TYPE_CHECKING:
+    from dualsense_controller.core.ControllerHub import ControllerHub, HubDeviceStats
+
 
 class HidControllerDevice:
     VENDOR_ID: Final[int] = 0x054c
@@ -34,6 +44,10 @@ class HidControllerDevice:
     def connection_type(self) -> ConnectionType:
         return self._connection_type
 
+    @property
+    def in_report(self) -> InReport | None:
+        return self._in_report_lockable.value
+
     @property
     def out_report(self) -> OutReport | None:
         return self._out_report_lockable.value
@@ -42,31 +56,74 @@ class HidControllerDevice:
     def is_opened(self) -> bool:
         return self._hid_device.is_opened()
 
-    def __init__(self, device_index_or_device_info: int | HidDeviceInfo | None = 0):
+    @property
+    def pipeline_stats(self) -> PipelineStats | None:
+        return self._ring_buffer.stats if self._ring_buffer is not None else None
+
+    @property
+    def hub_stats(self) -> HubDeviceStats | None:
+        return self._hub.stats(self) if self._hub is not None else None
+
+    @property
+    def recorder(self) -> SessionRecorder | None:
+        return self._recorder
+
+    @recorder.setter
+    def recorder(self, recorder: SessionRecorder | None) -> None:
+        self._recorder = recorder
+
+    def __init__(
+            self,
+            device_index_or_device_info: int | HidDeviceInfo | None = 0,
+            pipeline_policy: PipelinePolicy | None = None,
+            pipeline_capacity: int = 8,
+            hid_device: HidDevice | HidrawDevice | ReplayHidDevice | None = None,
+            hub: ControllerHub | None = None,
+    ):
+        assert hub is None or pipeline_policy is None, 'a hub reads and processes reports in its own threads'
+        # with a hub, the hub reads and handles the reports instead of an own reader thread
+        self._hub: Final[ControllerHub | None] = hub
         self._connection_type: ConnectionType = ConnectionType.UNDEFINED
         self._event_emitter: Final[pyee.EventEmitter] = pyee.EventEmitter()
+        # without a pipeline policy, reports are read and processed in the same thread
+        self._ring_buffer: InReportRingBuffer | None = (
+            InReportRingBuffer(pipeline_capacity, InReportLength.DUMMY, pipeline_policy)
+            if pipeline_policy is not None else None
+        )
         self._loop_thread = Thread(
-            target=self._loop,
+            target=self._loop if self._ring_buffer is None else self._process_loop,
             daemon=True,
         )
+        self._read_thread: Thread | None = Thread(
+            target=self._read_loop,
+            daemon=True,
+        ) if self._ring_buffer is not None else None
         self._stop_thread_event: threading.Event = threading.Event()
         self._thread_started_event: threading.Event = threading.Event()
+        self._recorder: SessionRecorder | None = None
 
-        device_info: HidDeviceInfo
-        if device_index_or_device_info is None or isinstance(device_index_or_device_info, int):
-            device_index: int = device_index_or_device_info if device_index_or_device_info is not None else 0
-            hid_device_infos: list[HidDeviceInfo] = HidControllerDevice.enumerate_devices()
-            num_hid_device_infos: int = len(hid_device_infos)
-            if num_hid_device_infos < device_index + 1:
-                raise InvalidDeviceIndexException(device_index)
-            device_info = hid_device_infos[device_index]
+        self._serial_number: str | None = None
+        self._path: str | None = None
+        self._hid_device: HidDevice | HidrawDevice | ReplayHidDevice
+        if hid_device is not None:
+            # a given device, i.e. a HidrawDevice or ReplayHidDevice, is used as is
+            self._hid_device = hid_device
         else:
-            device_info = device_index_or_device_info
+            device_info: HidDeviceInfo
+            if device_index_or_device_info is None or isinstance(device_index_or_device_info, int):
+                device_index: int = device_index_or_device_info if device_index_or_device_info is not None else 0
+                hid_device_infos: list[HidDeviceInfo] = HidControllerDevice.enumerate_devices()
+                num_hid_device_infos: int = len(hid_device_infos)
+                if num_hid_device_infos < device_index + 1:
+                    raise InvalidDeviceIndexException(device_index)
+                device_info = hid_device_infos[device_index]
+            else:
+                device_info = device_index_or_device_info
 
-        self._serial_number: Final[str] = device_info.serial_number
-        self._path: Final[str] = device_info.path
-        self._bus_type: HidDevice = HidDevice(path=self._path)
-        self._hid_device: HidDevice = HidDevice(path=self._path)
+            self._serial_number = device_info.serial_number
+            self._path = device_info.path
+            self._bus_type: HidDevice = HidDevice(path=self._path)
+            self._hid_device = HidDevice(path=self._path)
 
         self._in_report_length: int = InReportLength.DUMMY
         self._in_report_lockable: Final[Lockable[InReport]] = Lockable()
@@ -76,12 +133,49 @@ class HidControllerDevice:
         assert self._hid_device.is_opened() is False, "Device already opened"
         self._hid_device.open()
         self._detect()
-        self._start_loop_thread()
+        if self._hub is not None:
+            self._hub.register(self)
+        else:
+            self._start_loop_thread()
 
     def close(self) -> None:
         assert self._hid_device.is_opened() is True, "Device not opened"
-        self._stop_loop_thread()
-        self._hid_device.close()
+        if self._hub is not None:
+            self._hub.unregister(self)
+            self._hid_device.close()
+        elif self.fileno() is not None:
+            # closing a HidrawDevice wakes up the reader waiting for a report. a hidapi device must not be closed
+            # while it is read from, its reader only returns with the next report
+            self._stop_thread_event.set()
+            self._hid_device.close()
+            self._stop_loop_thread()
+        else:
+            self._stop_loop_thread()
+            self._hid_device.close()
+
+    def fileno(self) -> int | None:
+        # only devices with a descriptor, i.e. a HidrawDevice, can be waited for with epoll
+        fileno = getattr(self._hid_device, 'fileno', None)
+        return fileno() if fileno is not None else None
+
+    def read_in_report(self, timeout: float | None = None) -> bytes:
+        # with handle_in_report one iteration of the reader loop, called by a hub.
+        # empty when no report arrived within the timeout. hidapi waits in whole milliseconds and blocks with 0
+        if timeout is None:
+            return self._hid_device.read()
+        return self._hid_device.read(timeout_ms=max(1, round(timeout * 1000)))
+
+    def handle_in_report(self, buffer: bytes) -> None:
+        recorder: SessionRecorder | None = self._recorder
+        if recorder is not None:
+            recorder.record(ReportDirection.IN, buffer)
+        value = self._in_report_lockable.value
+        if value is not None:
+            value.update(buffer)
+        self._event_emitter.emit(EventType.IN_REPORT, value)
+
+    def emit_exception(self, exception: Exception) -> None:
+        self._event_emitter.emit(EventType.EXCEPTION, exception)
 
     def write(self) -> None:
         out_report_value = self._out_report_lockable.value
@@ -90,8 +184,12 @@ class HidControllerDevice:
             raise Exception("Out report not initialized")
 
         data = out_report_value.to_bytes()
-        Log.verbose(data.hex(' '))
+        if Log.verbose_enabled():
+            Log.verbose(data.hex(' '))
         self._hid_device.write(data)
+        recorder: SessionRecorder | None = self._recorder
+        if recorder is not None:
+            recorder.record(ReportDirection.OUT, data)
 
     def on_exception(self, callback: ExceptionCallback) -> None:
         self._event_emitter.on(EventType.EXCEPTION, callback)
@@ -120,19 +218,52 @@ class HidControllerDevice:
 
     def _start_loop_thread(self) -> None:
         self._loop_thread.start()
-        while not self._thread_started_event.is_set():
-            pass
+        self._thread_started_event.wait()
+        if self._read_thread is not None:
+            self._read_thread.start()
 
     def _stop_loop_thread(self) -> None:
         self._stop_thread_event.set()
+        if self._read_thread is not None:
+            self._read_thread.join()
+            self._ring_buffer.close()
         self._loop_thread.join()
 
     def _loop(self) -> None:
-        if not self._thread_started_event.is_set():
-            self._thread_started_event.set()
+        self._thread_started_event.set()
         try:
             while not self._stop_thread_event.is_set():
                 buffer: bytes = self._hid_device.read()
+                # empty when the device was closed while waiting
+                if buffer:
+                    self.handle_in_report(buffer)
+        except Exception as exception:
+            self._event_emitter.emit(EventType.EXCEPTION, exception)
+
+    def _read_loop(self) -> None:
+        try:
+            while not self._stop_thread_event.is_set():
+                slot: bytearray | None = self._ring_buffer.reserve()
+                if slot is None:
+                    break
+                length: int = self._hid_device.read(slot)
+                if length == 0:
+                    continue
+                recorder: SessionRecorder | None = self._recorder
+                if recorder is not None:
+                    recorder.record(ReportDirection.IN, slot, length)
+                self._ring_buffer.commit(length)
+        except Exception as exception:
+            self._ring_buffer.close()
+            self._event_emitter.emit(EventType.EXCEPTION, exception)
+
+    def _process_loop(self) -> None:
+        self._thread_started_event.set()
+        try:
+            while True:
+                buffer: bytes | None = self._ring_buffer.take()
+                if buffer is None:
+                    break
                 value = self._in_report_lockable.value
                 if value is not None:
                     value.update(buffer)
@@ -0,0 +1,127 @@
+import errno
+import glob
+import os
+import select
+import threading
+from typing import Final
+
+# hid reports are at most this long, the in reports of the controller up to 78 bytes
+_MAX_REPORT_LENGTH: Final[int] = 128
+_SYS_CLASS_HIDRAW: Final[str] = '/sys/class/hidraw'
+
+
+class HidrawDevice:
+    # stands in for a hidapi HidDevice on linux and reads and writes /dev/hidrawN directly.
+    # read() returns a view into a buffer that is reused by the next read, read(buffer) reads into the given buffer.
+    # like a blocking hidapi HidDevice, read waits at most timeout_ms milliseconds, without a timeout with 0
+    # fd takes an already opened descriptor instead of the path, i.e. one end of a socketpair in tests.
+    # close() may be called while another thread waits in read, that read wakes up and returns no report
+
+    @staticmethod
+    def enumerate_paths(
+            vendor_id: int = 0x054c,
+            product_id: int = 0x0ce6,
+            sys_class_hidraw: str = _SYS_CLASS_HIDRAW,
+    ) -> list[str]:
+        paths: list[str] = []
+        for hidraw_dir in sorted(glob.glob(os.path.join(sys_class_hidraw, 'hidraw*'))):
+            try:
+                with open(os.path.join(hidraw_dir, 'device', 'uevent')) as uevent:
+                    lines: list[str] = uevent.read().splitlines()
+            except OSError:
+                continue
+            for line in lines:
+                # HID_ID=<bus>:<vendor>:<product>, hex
+                if line.startswith('HID_ID='):
+                    _, vendor, product = line[len('HID_ID='):].split(':')
+                    if int(vendor, 16) == vendor_id and int(product, 16) == product_id:
+                        paths.append(os.path.join('/dev', os.path.basename(hidraw_dir)))
+                    break
+        return paths
+
+    def __init__(self, path: str | None = None, fd: int | None = None):
+        assert (path is None) != (fd is None), 'either path or fd'
+        self._path: Final[str | None] = path
+        self._given_fd: Final[int | None] = fd
+        self._fd: int | None = None
+        self._epoll: select.epoll | None = None
+        self._wakeup_fds: tuple[int, int] | None = None
+        # held while reading, so close() releases the descriptors only after a woken read returned
+        self._read_lock: Final[threading.Lock] = threading.Lock()
+        self._buffer: Final[bytearray] = bytearray(_MAX_REPORT_LENGTH)
+        # one view per report length, so read() allocates nothing once every length was seen
+        self._views: Final[dict[int, memoryview]] = {}
+
+    def open(self) -> None:
+        assert self._fd is None, 'Device already opened'
+        if not hasattr(select, 'epoll'):
+            raise OSError('hidraw devices are only available on linux')
+        fd: int
+        if self._given_fd is not None:
+            fd = self._given_fd
+            os.set_blocking(fd, False)
+        else:
+            fd = os.open(self._path, os.O_RDWR | os.O_NONBLOCK | os.O_CLOEXEC)
+        self._epoll = select.epoll()
+        self._epoll.register(fd, select.EPOLLIN)
+        self._wakeup_fds = os.pipe()
+        self._epoll.register(self._wakeup_fds[0], select.EPOLLIN)
+        self._fd = fd
+
+    def close(self) -> None:
+        fd: int | None = self._fd
+        if fd is None:
+            return
+        self._fd = None
+        # the byte is never read, every read still waiting wakes up
+        os.write(self._wakeup_fds[1], b'\x00')
+        with self._read_lock:
+            self._epoll.close()
+            self._epoll = None
+            for wakeup_fd in self._wakeup_fds:
+                os.close(wakeup_fd)
+            self._wakeup_fds = None
+            os.close(fd)
+
+    def is_opened(self) -> bool:
+        return self._fd is not None
+
+    def fileno(self) -> int:
+        if self._fd is None:
+            raise OSError('Device not opened')
+        return self._fd
+
+    def read(self, buffer: bytearray | None = None, timeout_ms: int = 0, blocking: bool = False) -> memoryview | int:
+        # 0 / an empty view when no report arrived in time
+        target: bytearray = self._buffer if buffer is None else buffer
+        length: int = self._read_into(target, timeout_ms)
+        if buffer is not None:
+            return length
+        view: memoryview | None = self._views.get(length)
+        if view is None:
+            view = self._views[length] = memoryview(self._buffer)[:length]
+        return view
+
+    def write(self, data: bytes | bytearray) -> int:
+        return os.write(self._fd, data)
+
+    def _read_into(self, target: bytearray, timeout_ms: int) -> int:
+        with self._read_lock:
+            fd: int | None = self._fd
+            if fd is None:
+                raise OSError('Device not opened')
+            return self._read_locked(fd, target, timeout_ms)
+
+    def _read_locked(self, fd: int, target: bytearray, timeout_ms: int) -> int:
+        while True:
+            try:
+                length: int = os.readv(fd, (target,))
+            except BlockingIOError:
+                if not self._epoll.poll(timeout_ms / 1000 if timeout_ms > 0 else -1) or self._fd is None:
+                    # timed out, or woken up by close()
+                    return 0
+                continue
+            if length == 0:
+                # hidraw never returns empty reports, the other end is gone
+                raise OSError(errno.ENODEV, 'device disconnected')
+            return length
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+from threading import Condition
+from typing import Final
+
+from dualsense_controller.core.enum import PipelinePolicy
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineStats:
+    received: int
+    processed: int
+    dropped: int
+    coalesced: int
+
+
+class InReportRingBuffer:
+    # single producer (hid reader thread), single consumer (processing thread).
+    # slots are allocated once, the producer reads directly into the slot it reserved.
+
+    @property
+    def stats(self) -> PipelineStats:
+        with self._condition:
+            return PipelineStats(
+                received=self._received,
+                processed=self._processed,
+                dropped=self._dropped,
+                coalesced=self._coalesced,
+            )
+
+    def __init__(self, capacity: int, slot_size: int, policy: PipelinePolicy = PipelinePolicy.PROCESS_ALL):
+        assert capacity > 1, 'capacity has to be greater than 1'
+        self._policy: Final[PipelinePolicy] = policy
+        self._capacity: Final[int] = capacity
+        self._slots: Final[list[bytearray]] = [bytearray(slot_size) for _ in range(capacity)]
+        self._lengths: Final[list[int]] = [0] * capacity
+        self._condition: Final[Condition] = Condition()
+        self._read_index: int = 0
+        self._count: int = 0
+        self._closed: bool = False
+
+        self._received: int = 0
+        self._processed: int = 0
+        self._dropped: int = 0
+        self._coalesced: int = 0
+
+    def reserve(self) -> bytearray | None:
+        # the reserved slot is not visible to the consumer until it is committed
+        with self._condition:
+            if self._count == self._capacity:
+                if self._policy == PipelinePolicy.PROCESS_ALL:
+                    self._condition.wait_for(lambda: self._count < self._capacity or self._closed)
+                else:
+                    self._read_index = (self._read_index + 1) % self._capacity
+                    self._count -= 1
+                    self._dropped += 1
+            if self._closed:
+                return None
+            return self._slots[(self._read_index + self._count) % self._capacity]
+
+    def commit(self, length: int) -> None:
+        with self._condition:
+            self._lengths[(self._read_index + self._count) % self._capacity] = length
+            self._count += 1
+            self._received += 1
+            self._condition.notify_all()
+
+    def take(self, timeout: float | None = None) -> bytes | None:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._count > 0 or self._closed, timeout) or self._count == 0:
+                return None
+            if self._policy == PipelinePolicy.COALESCE_LATEST and self._count > 1:
+                self._coalesced += self._count - 1
+                self._read_index = (self._read_index + self._count - 1) % self._capacity
+                self._count = 1
+            index: int = self._read_index
+            raw_bytes: bytes = bytes(memoryview(self._slots[index])[:self._lengths[index]])
+            self._read_index = (index + 1) % self._capacity
+            self._count -= 1
+            self._processed += 1
+            self._condition.notify_all()
+            return raw_bytes
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
@@ -0,0 +1,120 @@
+import math
+from dataclasses import dataclass
+from typing import Final
+
+# hdr style log linear buckets: values below 2 * _SUB_BUCKETS are exact,
+# above that every power of two range is split into _SUB_BUCKETS buckets (< 1% error with 128)
+_SUB_BUCKET_BITS: Final[int] = 7
+_SUB_BUCKETS: Final[int] = 1 << _SUB_BUCKET_BITS
+# values up to 2^42 ns (~73 min), larger ones land in the last bucket
+_MAX_SHIFT: Final[int] = 34
+_NUM_BUCKETS: Final[int] = (_MAX_SHIFT + 2) * _SUB_BUCKETS
+_PERCENTILES: Final[tuple[float, ...]] = (50.0, 90.0, 99.0, 99.9)
+
+
+@dataclass(frozen=True, slots=True)
+class LatencyStats:
+    # all values in ns
+    count: int
+    min: int
+    max: int
+    mean: float
+    jitter: float
+    p50: int
+    p90: int
+    p99: int
+    p999: int
+
+
+class LatencyHistogram:
+    # recording is constant time and memory, it is meant to be done by a single thread.
+    # reading from another thread may see a recording in progress, which is fine for statistics.
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def __init__(self):
+        self._counts: Final[list[int]] = [0] * _NUM_BUCKETS
+        self._count: int = 0
+        self._min: int = 0
+        self._max: int = 0
+        self._sum: int = 0
+        self._sum_squares: int = 0
+
+    def record(self, value: int) -> None:
+        if value < 0:
+            value = 0
+        shift: int = value.bit_length() - _SUB_BUCKET_BITS - 1
+        if shift <= 0:
+            index: int = value
+        elif shift <= _MAX_SHIFT:
+            index = shift * _SUB_BUCKETS + (value >> shift)
+        else:
+            index = _NUM_BUCKETS - 1
+        self._counts[index] += 1
+        if self._count == 0 or value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        self._count += 1
+        self._sum += value
+        self._sum_squares += value * value
+
+    def percentile(self, percentile: float) -> int:
+        return self._percentiles((percentile,))[0]
+
+    def stats(self) -> LatencyStats:
+        count: int = self._count
+        if count == 0:
+            return LatencyStats(0, 0, 0, 0.0, 0.0, 0, 0, 0, 0)
+        mean: float = self._sum / count
+        variance: float = max(0.0, self._sum_squares / count - mean * mean)
+        p50, p90, p99, p999 = self._percentiles(_PERCENTILES)
+        return LatencyStats(
+            count=count,
+            min=self._min,
+            max=self._max,
+            mean=mean,
+            jitter=math.sqrt(variance),
+            p50=p50,
+            p90=p90,
+            p99=p99,
+            p999=p999,
+        )
+
+    def reset(self) -> None:
+        for index in range(_NUM_BUCKETS):
+            self._counts[index] = 0
+        self._count = 0
+        self._min = 0
+        self._max = 0
+        self._sum = 0
+        self._sum_squares = 0
+
+    def _percentiles(self, percentiles: tuple[float, ...]) -> list[int]:
+        count: int = self._count
+        if count == 0:
+            return [0] * len(percentiles)
+        targets: list[int] = [max(1, math.ceil(percentile / 100 * count)) for percentile in percentiles]
+        values: list[int] = [self._max] * len(percentiles)
+        cumulative: int = 0
+        position: int = 0
+        for index, bucket_count in enumerate(self._counts):
+            if bucket_count == 0:
+                continue
+            cumulative += bucket_count
+            while position < len(targets) and cumulative >= targets[position]:
+                values[position] = min(self._max, max(self._min, self._highest_value_of(index)))
+                position += 1
+            if position == len(targets):
+                break
+        return values
+
+    @staticmethod
+    def _highest_value_of(index: int) -> int:
+        if index < 2 * _SUB_BUCKETS:
+            return index
+        shift: int = index // _SUB_BUCKETS - 1
+        top: int = index - shift * _SUB_BUCKETS
+        return ((top + 1) << shift) - 1
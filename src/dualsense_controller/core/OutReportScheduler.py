@@ -0,0 +1,91 @@
+import time
+from typing import Final, Mapping
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.state.write_state.enum import WritePriority
+
+# seconds between two out reports, bluetooth shares its link with the in reports
+DEFAULT_MIN_INTERVALS: Final[Mapping[ConnectionType, float]] = {
+    ConnectionType.USB_01: 0.004,
+    ConnectionType.BT_31: 0.010,
+    ConnectionType.BT_01: 0.010,
+}
+# seconds a change waits for further changes before it is written
+DEFAULT_COALESCE_WINDOWS: Final[Mapping[WritePriority, float]] = {
+    WritePriority.CRITICAL: 0,
+    WritePriority.NORMAL: 0.010,
+    WritePriority.COSMETIC: 0.050,
+}
+
+
+class OutReportScheduler:
+    # decides when pending write state changes go out. a change is written once it is older than the coalesce window
+    # of its priority and the last write is at least the min interval of the connection type ago.
+    # all changes pending at that time go out in the same report.
+
+    @property
+    def writes(self) -> int:
+        return self._writes
+
+    @property
+    def deferred(self) -> int:
+        # pending changes not written at once, counted once per change however often it is polled
+        return self._deferred
+
+    def __init__(
+            self,
+            min_interval: float | Mapping[ConnectionType, float] | None = None,
+            coalesce_window: Mapping[WritePriority, float] | None = None,
+    ):
+        min_intervals: dict[ConnectionType, float] = dict(DEFAULT_MIN_INTERVALS)
+        if isinstance(min_interval, (int, float)):
+            min_intervals = {connection_type: min_interval for connection_type in min_intervals}
+        elif min_interval is not None:
+            min_intervals.update(min_interval)
+        coalesce_windows: dict[WritePriority, float] = dict(DEFAULT_COALESCE_WINDOWS)
+        if coalesce_window is not None:
+            coalesce_windows.update(coalesce_window)
+
+        self._min_intervals_ns: Final[dict[ConnectionType, int]] = {
+            connection_type: int(interval * 1e9) for connection_type, interval in min_intervals.items()
+        }
+        self._coalesce_windows_ns: Final[dict[WritePriority, int]] = {
+            priority: int(window * 1e9) for priority, window in coalesce_windows.items()
+        }
+        self._last_write: int | None = None
+        self._writes: int = 0
+        self._deferred: int = 0
+        self._pending_deferred: bool = False
+
+    def due_at(self, priority: WritePriority, changed_timestamp: int, connection_type: ConnectionType) -> int:
+        due: int = changed_timestamp + self._coalesce_windows_ns[priority]
+        if self._last_write is not None:
+            due = max(due, self._last_write + self._min_intervals_ns.get(connection_type, 0))
+        return due
+
+    def is_due(
+            self,
+            priority: WritePriority,
+            changed_timestamp: int,
+            connection_type: ConnectionType,
+            now: int | None = None,
+    ) -> bool:
+        if now is None:
+            now = time.perf_counter_ns()
+        if now >= self.due_at(priority, changed_timestamp, connection_type):
+            return True
+        if not self._pending_deferred:
+            self._pending_deferred = True
+            self._deferred += 1
+        return False
+
+    def written(self, now: int | None = None) -> None:
+        self._last_write = time.perf_counter_ns() if now is None else now
+        self._writes += 1
+        self._pending_deferred = False
+
+    def reset(self) -> None:
+        self._last_write = None
+        self._writes = 0
+        self._deferred = 0
+        self._pending_deferred = False
@@ -0,0 +1,57 @@
+import time
+from threading import Event, Thread
+from typing import Callable, Final
+
+from dualsense_controller.core.typedef import EmptyCallback, ExceptionCallback
+
+
+class OutReportWriter:
+    # writes pending write state changes from its own thread, independent of incoming reports.
+    # due_at returns the perf_counter_ns at which the pending changes may be written, None if nothing is pending
+
+    def __init__(
+            self,
+            due_at: Callable[[], int | None],
+            write: EmptyCallback,
+            on_exception: ExceptionCallback,
+    ):
+        self._due_at: Final[Callable[[], int | None]] = due_at
+        self._write: Final[EmptyCallback] = write
+        self._on_exception: Final[ExceptionCallback] = on_exception
+        self._wake_event: Final[Event] = Event()
+        self._stopped: bool = False
+        self._thread: Final[Thread] = Thread(target=self._loop, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._wake_event.set()
+        self._thread.join()
+
+    def notify(self) -> None:
+        self._wake_event.set()
+
+    def _loop(self) -> None:
+        timeout: float | None = None
+        while True:
+            self._wake_event.wait(timeout)
+            if self._stopped:
+                return
+            # cleared before checking, a change notified meanwhile wakes the next wait right away
+            self._wake_event.clear()
+            due_at: int | None = self._due_at()
+            if due_at is None:
+                timeout = None
+                continue
+            remaining: int = due_at - time.perf_counter_ns()
+            if remaining > 0:
+                timeout = remaining / 1e9
+                continue
+            try:
+                self._write()
+            except Exception as exception:
+                self._on_exception(exception)
+            # check again for changes made during the write
+            timeout = 0
@@ -0,0 +1,88 @@
+from threading import Condition
+from typing import Final
+
+from dualsense_controller.core.report.in_report.InReport import InReport
+
+_BUTTON_KEYS: Final[tuple[str, ...]] = ('buttons_0', 'buttons_1', 'buttons_2')
+_DPAD_MASK: Final[int] = 0x0F
+
+
+class ReportCoalescer:
+    # collects the reports received between two ticks and hands out only the latest one,
+    # plus one synthesized report if a button was pressed and released (or the other way round) in between
+
+    @property
+    def coalesced(self) -> int:
+        return self._coalesced
+
+    def __init__(self):
+        self._condition: Final[Condition] = Condition()
+        self._button_indexes: tuple[int, ...] = ()
+        self._latest: bytes | None = None
+        self._applied: bytes | None = None
+        self._ever_set: list[int] = []
+        self._ever_cleared: list[int] = []
+        self._other_dpad: int | None = None
+        self._num_pending: int = 0
+        self._coalesced: int = 0
+
+    def push(self, in_report: InReport) -> None:
+        raw_bytes: bytes = bytes(in_report.raw_bytes)
+        with self._condition:
+            if not self._button_indexes:
+                self._button_indexes = in_report.get_raw_indexes(_BUTTON_KEYS)
+            if self._latest is None:
+                self._ever_set = [0] * len(self._button_indexes)
+                self._ever_cleared = [0] * len(self._button_indexes)
+                self._other_dpad = None
+            for position, index in enumerate(self._button_indexes):
+                self._ever_set[position] |= raw_bytes[index]
+                self._ever_cleared[position] |= ~raw_bytes[index] & 0xFF
+            if self._applied is not None and self._other_dpad is None and self._button_indexes:
+                dpad: int = raw_bytes[self._button_indexes[0]] & _DPAD_MASK
+                if dpad != self._applied[self._button_indexes[0]] & _DPAD_MASK:
+                    self._other_dpad = dpad
+            self._latest = raw_bytes
+            self._num_pending += 1
+            self._condition.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(lambda: self._latest is not None, timeout)
+
+    def pop(self) -> list[bytes]:
+        with self._condition:
+            latest: bytes | None = self._latest
+            if latest is None:
+                return []
+            applied: bytes | None = self._applied
+            ever_set: list[int] = self._ever_set
+            ever_cleared: list[int] = self._ever_cleared
+            other_dpad: int | None = self._other_dpad
+            self._coalesced += self._num_pending - 1
+            self._num_pending = 0
+            self._latest = None
+            self._applied = latest
+
+        if applied is None:
+            return [latest]
+
+        synthesized: bytearray | None = None
+        for position, index in enumerate(self._button_indexes):
+            before: int = applied[index]
+            after: int = latest[index]
+            # dpad is a hat value, not a bitfield
+            bitfield_mask: int = 0xFF if position > 0 else 0xFF & ~_DPAD_MASK
+            lost_press: int = ever_set[position] & ~before & ~after & bitfield_mask
+            lost_release: int = ever_cleared[position] & before & after & bitfield_mask
+            if lost_press or lost_release:
+                synthesized = synthesized if synthesized is not None else bytearray(latest)
+                synthesized[index] = (after | lost_press) & ~lost_release & 0xFF
+
+        if self._button_indexes and other_dpad is not None:
+            dpad_index: int = self._button_indexes[0]
+            if applied[dpad_index] & _DPAD_MASK == latest[dpad_index] & _DPAD_MASK:
+                synthesized = synthesized if synthesized is not None else bytearray(latest)
+                synthesized[dpad_index] = (synthesized[dpad_index] & ~_DPAD_MASK & 0xFF) | other_dpad
+
+        return [bytes(synthesized), latest] if synthesized is not None else [latest]
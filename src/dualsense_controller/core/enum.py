@@ -16,3 +16,12 @@ class ConnectionType(Enum):
 
     def __str__(self) -> str:
         return str(self.value[0]) if isinstance(self.value, tuple) else self.value
+
+
+class PipelinePolicy(Enum):
+    # every report is processed, the reader waits for a free slot when processing falls behind
+    PROCESS_ALL = 'PROCESS_ALL'
+    # only the latest report is processed, all reports received in between are skipped
+    COALESCE_LATEST = 'COALESCE_LATEST'
+    # when the buffer is full, the oldest not yet processed report is overwritten
+    DROP_OLDEST = 'DROP_OLDEST'
@@ -19,3 +19,18 @@ class InvalidDeviceIndexException(AbstractBaseException):
 class InvalidInReportLengthException(AbstractBaseException):
     def __init__(self):
         super().__init__(f'Invalid connection type')
+
+
+class SharedReaderException(AbstractBaseException):
+    def __init__(self, msg: str):
+        super().__init__(f'Shared reader process failed: {msg}')
+
+
+class SharedStateListenerException(AbstractBaseException):
+    def __init__(self, state_name: object):
+        super().__init__(f'{state_name} is read from shared memory and has no listeners, poll it instead')
+
+
+class SnapshotsNotEnabledException(AbstractBaseException):
+    def __init__(self):
+        super().__init__('Snapshots are not enabled, call enable_snapshots() first')
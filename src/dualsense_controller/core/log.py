@@ -19,6 +19,19 @@ class LogLevel(enum.IntEnum):
     NOTSET = logging.NOTSET
 
 
+# plain ints, enum member lookups are slow
+_CRITICAL: Final[int] = LogLevel.CRITICAL.value
+_ERROR: Final[int] = LogLevel.ERROR.value
+_WARNING: Final[int] = LogLevel.WARNING.value
+_INFO: Final[int] = LogLevel.INFO.value
+_VERBOSE: Final[int] = LogLevel.VERBOSE.value
+_DEBUG: Final[int] = LogLevel.DEBUG.value
+_TRACE: Final[int] = LogLevel.TRACE.value
+
+# the logger caches per level whether it is enabled, until a level is set anywhere
+_LOGGER: Final[logging.Logger] = logging.getLogger(NAME_LOGGER)
+
+
 class Log:
     __DEFAULT_FORMATTER: Final[logging.Formatter] = logging.Formatter('[%(asctime)s - %(levelname)s] %(message)s')
 
@@ -28,7 +41,7 @@ class Log:
         logging.addLevelName(LogLevel.TRACE, LogLevel.TRACE.name)
         logging.addLevelName(LogLevel.VERBOSE, LogLevel.VERBOSE.name)
 
-        self.__logger: logging.Logger = logging.getLogger(NAME_LOGGER)
+        self.__logger: logging.Logger = _LOGGER
         self.__logger.setLevel(LogLevel.INFO)
 
         stream_handler: logging.StreamHandler[Any] = logging.StreamHandler()
@@ -45,40 +58,84 @@ class Log:
     def set_level(cls, level: LogLevel):
         cls.__get_instance().__logger.setLevel(level)
 
+    @classmethod
+    def get_level(cls) -> int:
+        return cls.__get_instance().__logger.getEffectiveLevel()
+
+    # a disabled call returns before its args are formatted. the effective level of the logger decides, however it
+    # was set, the logger caches it per level. hot paths check before they build their args:
+    # if Log.verbose_enabled(): Log.verbose(data.hex(' '))
+    @classmethod
+    def is_enabled_for(cls, level: int) -> bool:
+        if cls.__instance is None:
+            cls.__get_instance()
+        return _LOGGER.isEnabledFor(level)
+
+    # guards of hot paths, without creating the instance. a passed guard is followed by a call which creates it
+    @staticmethod
+    def verbose_enabled() -> bool:
+        return _LOGGER.isEnabledFor(_VERBOSE)
+
+    @staticmethod
+    def debug_enabled() -> bool:
+        return _LOGGER.isEnabledFor(_DEBUG)
+
+    @staticmethod
+    def trace_enabled() -> bool:
+        return _LOGGER.isEnabledFor(_TRACE)
+
     @classmethod
     def critical(cls, msg: str, *args: Any):
+        if not cls.is_enabled_for(_CRITICAL):
+            return
         cls.__get_instance().__logger.critical(cls.__args_to_str(msg, *args))
 
     @classmethod
     def fatal(cls, msg: str, *args: Any):
+        if not cls.is_enabled_for(_CRITICAL):
+            return
         cls.__get_instance().__logger.fatal(cls.__args_to_str(msg, *args))
 
     @classmethod
     def error(cls, msg: str, *args: Any):
+        if not cls.is_enabled_for(_ERROR):
+            return
         cls.__get_instance().__logger.error(cls.__args_to_str(msg, *args))
 
     @classmethod
     def exception(cls, exception: BaseException, *args: Any):
+        if not cls.is_enabled_for(_ERROR):
+            return
         cls.__get_instance().__logger.exception(exception)
 
     @classmethod
     def warning(cls, msg: str, *args: Any):
+        if not cls.is_enabled_for(_WARNING):
+            return
         cls.__get_instance().__logger.warning(cls.__args_to_str(msg, *args))
 
     @classmethod
     def info(cls, msg: str, *args: Any):
+        if not cls.is_enabled_for(_INFO):
+            return
         cls.__get_instance().__logger.info(cls.__args_to_str(msg, *args))
 
     @classmethod
     def verbose(cls, msg: str, *args: Any):
+        if not cls.is_enabled_for(_VERBOSE):
+            return
         cls.__get_instance().__logger.log(LogLevel.VERBOSE, cls.__args_to_str(msg, *args))
 
     @classmethod
     def debug(cls, msg: str, *args: Any):
+        if not cls.is_enabled_for(_DEBUG):
+            return
         cls.__get_instance().__logger.debug(cls.__args_to_str(msg, *args))
 
     @classmethod
     def trace(cls, msg: str, *args: Any):
+        if not cls.is_enabled_for(_TRACE):
+            return
         cls.__get_instance().__logger.log(LogLevel.TRACE, cls.__args_to_str(msg, *args))
 
     @classmethod
@@ -0,0 +1,10 @@
+from typing import NamedTuple
+
+from dualsense_controller.core.recording.enum import ReportDirection
+
+
+class RecordedReport(NamedTuple):
+    # time.perf_counter_ns() of the recording process
+    timestamp: int
+    direction: ReportDirection
+    raw_bytes: bytes
@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+from collections import deque
+from typing import Final, Iterable, Iterator
+
+from dualsense_controller.core.recording.RecordedReport import RecordedReport
+from dualsense_controller.core.recording.SessionRecording import SessionRecording
+from dualsense_controller.core.recording.enum import ReportDirection
+
+
+class ReplayHidDevice:
+    # stands in for a hidapi HidDevice and returns the recorded in reports on read.
+    # speed 1.0 replays in real time, 2.0 twice as fast, None as fast as possible.
+    # like an idle controller, the last report is repeated every idle_interval seconds once the recording is through.
+    # the last max_out_reports written out reports are kept, none with 0
+
+    @property
+    def out_reports(self) -> deque[bytes]:
+        return self._out_reports
+
+    @property
+    def num_replayed(self) -> int:
+        return self._num_replayed
+
+    def __init__(
+            self,
+            source: str | os.PathLike | Iterable[RecordedReport],
+            speed: float | None = 1.0,
+            idle_interval: float = 0.004,
+            max_out_reports: int = 1000,
+    ):
+        assert speed is None or speed > 0, 'speed must be positive'
+        assert max_out_reports >= 0, 'max_out_reports must not be negative'
+        self._source: Final[str | os.PathLike | Iterable[RecordedReport]] = source
+        self._speed: Final[float | None] = speed
+        self._idle_interval: Final[float] = idle_interval
+        self._recording: SessionRecording | None = None
+        self._reports: Iterator[RecordedReport] | None = None
+        self._last_raw_bytes: bytes = b''
+        self._start: tuple[int, int] | None = None
+        self._num_replayed: int = 0
+        self._out_reports: Final[deque[bytes]] = deque(maxlen=max_out_reports)
+        self._closed_event: Final[threading.Event] = threading.Event()
+        self._finished_event: Final[threading.Event] = threading.Event()
+
+    def open(self) -> None:
+        assert self._reports is None, 'Replay device already opened'
+        if isinstance(self._source, (str, os.PathLike)):
+            self._recording = SessionRecording(self._source)
+            reports: Iterable[RecordedReport] = self._recording
+        else:
+            reports = self._source
+        self._reports = (report for report in reports if report.direction == ReportDirection.IN)
+        self._start = None
+        self._num_replayed = 0
+        self._closed_event.clear()
+        self._finished_event.clear()
+
+    def close(self) -> None:
+        self._closed_event.set()
+        self._reports = None
+        if self._recording is not None:
+            self._recording.close()
+            self._recording = None
+
+    def is_opened(self) -> bool:
+        return self._reports is not None
+
+    def wait_until_finished(self, timeout: float | None = None) -> bool:
+        return self._finished_event.wait(timeout)
+
+    def read(self, buffer: bytearray | None = None, timeout_ms: int = 0, blocking: bool = False) -> bytes | int:
+        raw_bytes: bytes = self._next_raw_bytes()
+        if buffer is None:
+            return raw_bytes
+        buffer[:len(raw_bytes)] = raw_bytes
+        return len(raw_bytes)
+
+    def write(self, data: bytes) -> int:
+        if self._out_reports.maxlen:
+            self._out_reports.append(bytes(data))
+        return len(data)
+
+    def _next_raw_bytes(self) -> bytes:
+        reports: Iterator[RecordedReport] | None = self._reports
+        report: RecordedReport | None = next(reports, None) if reports is not None else None
+        if report is None:
+            self._finished_event.set()
+            self._closed_event.wait(self._idle_interval)
+            return self._last_raw_bytes
+
+        if self._speed is not None:
+            now: int = time.perf_counter_ns()
+            if self._start is None:
+                self._start = (now, report.timestamp)
+            start, recorded_start = self._start
+            delay: float = (start + (report.timestamp - recorded_start) / self._speed - now) / 1e9
+            if delay > 0:
+                self._closed_event.wait(delay)
+
+        self._num_replayed += 1
+        self._last_raw_bytes = report.raw_bytes
+        return report.raw_bytes
@@ -0,0 +1,139 @@
+import mmap
+import os
+import struct
+import time
+from collections import deque
+from queue import SimpleQueue
+from threading import Lock, Thread
+from typing import BinaryIO, Final
+
+from dualsense_controller.core.recording.enum import ReportDirection
+
+# file layout: one header record, then fixed size records of (timestamp, direction, length, raw bytes padded)
+RECORD_SIZE: Final[int] = 128
+FILE_MAGIC: Final[bytes] = b'DSREC\x00\x00\x01'
+# magic, time.time_ns() and time.perf_counter_ns() at the start of the recording
+FILE_HEADER: Final[struct.Struct] = struct.Struct('<8sqq')
+# time.perf_counter_ns(), direction, length
+RECORD_HEADER: Final[struct.Struct] = struct.Struct('<qBxH')
+MAX_REPORT_LENGTH: Final[int] = RECORD_SIZE - RECORD_HEADER.size
+
+
+class SessionRecorder:
+    # records are packed into preallocated buffers in the calling thread,
+    # full buffers are written by a writer thread, or directly into a preallocated memory mapped file.
+    # when the writer cannot keep up (or the mapped file is full) records are dropped, never waited for.
+
+    @property
+    def records(self) -> int:
+        return self._records
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def __init__(
+            self,
+            path: str | os.PathLike,
+            buffer_records: int = 256,
+            num_buffers: int = 4,
+            mmap_records: int | None = None,
+    ):
+        self._lock: Final[Lock] = Lock()
+        self._file: Final[BinaryIO] = open(path, 'w+b')
+        self._records: int = 0
+        self._dropped: int = 0
+        self._offset: int = 0
+        self._closed: bool = False
+
+        header: bytearray = bytearray(RECORD_SIZE)
+        FILE_HEADER.pack_into(header, 0, FILE_MAGIC, time.time_ns(), time.perf_counter_ns())
+
+        self._mmap: mmap.mmap | None = None
+        self._pending: SimpleQueue[tuple[bytearray, int] | None] | None = None
+        self._free: deque[bytearray] = deque()
+        self._writer_thread: Thread | None = None
+        self._buffer: bytearray | mmap.mmap | None
+
+        if mmap_records is not None:
+            self._file.truncate(RECORD_SIZE * (mmap_records + 1))
+            self._mmap = mmap.mmap(self._file.fileno(), RECORD_SIZE * (mmap_records + 1))
+            self._mmap[:RECORD_SIZE] = header
+            self._buffer = self._mmap
+            self._offset = RECORD_SIZE
+        else:
+            self._file.write(header)
+            self._pending = SimpleQueue()
+            self._free.extend(bytearray(RECORD_SIZE * buffer_records) for _ in range(num_buffers - 1))
+            self._buffer = bytearray(RECORD_SIZE * buffer_records)
+            self._writer_thread = Thread(target=self._write_loop, daemon=True)
+            self._writer_thread.start()
+
+    def __enter__(self) -> 'SessionRecorder':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def record(
+            self, direction: ReportDirection, raw_bytes: bytes | bytearray, length: int | None = None
+    ) -> None:
+        timestamp: int = time.perf_counter_ns()
+        if length is None:
+            length = len(raw_bytes)
+        if length > MAX_REPORT_LENGTH:
+            length = MAX_REPORT_LENGTH
+        with self._lock:
+            buffer: bytearray | mmap.mmap | None = self._buffer
+            if buffer is None:
+                buffer = self._next_buffer()
+                if buffer is None:
+                    self._dropped += 1
+                    return
+            offset: int = self._offset
+            RECORD_HEADER.pack_into(buffer, offset, timestamp, direction, length)
+            start: int = offset + RECORD_HEADER.size
+            buffer[start:start + length] = raw_bytes if length == len(raw_bytes) else raw_bytes[:length]
+            offset += RECORD_SIZE
+            self._records += 1
+            if offset < len(buffer):
+                self._offset = offset
+            elif self._mmap is None:
+                self._pending.put((buffer, offset))
+                self._buffer = None
+                self._offset = 0
+            else:
+                # mapped file is full
+                self._buffer = None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            buffer: bytearray | mmap.mmap | None = self._buffer
+            self._buffer = None
+            self._free.clear()
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._file.truncate(RECORD_SIZE * (self._records + 1))
+        else:
+            if buffer is not None and self._offset > 0:
+                self._pending.put((buffer, self._offset))
+            self._pending.put(None)
+            self._writer_thread.join()
+        self._file.close()
+
+    def _next_buffer(self) -> bytearray | None:
+        if self._mmap is not None or self._closed or not self._free:
+            return None
+        self._buffer = self._free.popleft()
+        self._offset = 0
+        return self._buffer
+
+    def _write_loop(self) -> None:
+        while (item := self._pending.get()) is not None:
+            buffer, used = item
+            self._file.write(memoryview(buffer)[:used])
+            self._free.append(buffer)
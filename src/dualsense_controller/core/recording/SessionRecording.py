@@ -0,0 +1,48 @@
+import mmap
+import os
+from typing import BinaryIO, Final, Iterator
+
+from dualsense_controller.core.recording.RecordedReport import RecordedReport
+from dualsense_controller.core.recording.SessionRecorder import FILE_HEADER, FILE_MAGIC, RECORD_HEADER, RECORD_SIZE
+from dualsense_controller.core.recording.enum import ReportDirection
+
+
+class SessionRecording:
+
+    @property
+    def start_time_ns(self) -> int:
+        return self._start_time_ns
+
+    @property
+    def start_timestamp(self) -> int:
+        return self._start_timestamp
+
+    def __init__(self, path: str | os.PathLike):
+        self._file: Final[BinaryIO] = open(path, 'rb')
+        self._mmap: Final[mmap.mmap] = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, start_time_ns, start_timestamp = FILE_HEADER.unpack_from(self._mmap, 0)
+        if magic != FILE_MAGIC:
+            self.close()
+            raise ValueError(f'{path} is not a session recording')
+        self._start_time_ns: Final[int] = start_time_ns
+        self._start_timestamp: Final[int] = start_timestamp
+
+    def __enter__(self) -> 'SessionRecording':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._mmap) // RECORD_SIZE - 1
+
+    def __iter__(self) -> Iterator[RecordedReport]:
+        data: mmap.mmap = self._mmap
+        for offset in range(RECORD_SIZE, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+            timestamp, direction, length = RECORD_HEADER.unpack_from(data, offset)
+            start: int = offset + RECORD_HEADER.size
+            yield RecordedReport(timestamp, ReportDirection(direction), data[start:start + length])
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
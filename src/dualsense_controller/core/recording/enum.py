@@ -0,0 +1,6 @@
+from enum import IntEnum
+
+
+class ReportDirection(IntEnum):
+    IN = 0
+    OUT = 1
@@ -1,27 +1,61 @@
 from abc import ABC
 from typing import Final
 
+from dualsense_controller.core.report.in_report.InReportDecoder import InReportDecoder
+from dualsense_controller.core.report.in_report.InReportSnapshot import InReportSnapshot
+
 _IndexDict = dict[str, int]
 
 class InReport(ABC):
     _OFFSET: Final[int] = 1
+    _DECODERS: Final[dict[type, InReportDecoder]] = {}
 
     @property
     def raw_bytes(self) -> bytes | bytearray | None:
         return self._raw_bytes
 
+    @property
+    def snapshot(self) -> InReportSnapshot:
+        snapshot: InReportSnapshot | None = self._snapshot
+        if snapshot is None:
+            snapshot = self._snapshot = self._decoder.decode(self._raw_bytes)
+        return snapshot
+
     def __init__(self, index_dict: _IndexDict, raw_bytes: bytes | bytearray | None = None):
         self._index_dict: Final[_IndexDict] = index_dict
         self._raw_bytes: bytes | bytearray | None = raw_bytes
+        self._snapshot: InReportSnapshot | None = None
+        decoder: InReportDecoder | None = InReport._DECODERS.get(type(self))
+        if decoder is None:
+            decoder = InReport._DECODERS[type(self)] = InReportDecoder(index_dict, InReport._OFFSET)
+        self._decoder: Final[InReportDecoder] = decoder
+
+    @property
+    def fields(self) -> list[tuple[int, str, str]]:
+        return InReportDecoder.get_fields(self._index_dict, InReport._OFFSET)
+
+    def get_raw_indexes(self, keys: tuple[str, ...]) -> tuple[int, ...]:
+        return tuple(InReport._OFFSET + self._index_dict[key] for key in keys if key in self._index_dict)
+
+    def get_byte_mask(self, keys: tuple[str, ...]) -> int:
+        # mask over int.from_bytes(raw_bytes, 'little') covering the bytes of the given keys
+        mask: int = 0
+        for key in keys:
+            index: int | None = self._index_dict.get(key)
+            if index is not None:
+                mask |= 0xFF << (8 * (InReport._OFFSET + index))
+        return mask
 
     def update(self, raw_bytes: bytes) -> None:
         self._raw_bytes = raw_bytes
+        self._snapshot = None
 
     def _get_uint8(self, key: str) -> int:
         return self._raw_bytes[InReport._OFFSET + self._index_dict.get(key)]
 
     def _set_uint8(self, key: str, value: int) -> None:
         self._raw_bytes[InReport._OFFSET + self._index_dict.get(key)] = value
+        self._snapshot = None
 
     # ########################################## GET ##########################################
 
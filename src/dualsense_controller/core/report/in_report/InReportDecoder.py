@@ -0,0 +1,94 @@
+import struct
+from operator import itemgetter
+from typing import Final
+
+from dualsense_controller.core.report.in_report.InReportSnapshot import InReportSnapshot
+
+_IndexDict = dict[str, int]
+
+# (snapshot field, little endian struct format char, index dict keys the field is made of in byte order)
+_FIELD_SPECS: Final[tuple[tuple[str, str, tuple[str, ...]], ...]] = (
+    ('axes_0', 'B', ('axes_0',)),
+    ('axes_1', 'B', ('axes_1',)),
+    ('axes_2', 'B', ('axes_2',)),
+    ('axes_3', 'B', ('axes_3',)),
+    ('axes_4', 'B', ('axes_4',)),
+    ('axes_5', 'B', ('axes_5',)),
+    ('seq_num', 'B', ('seq_num',)),
+    ('buttons_0', 'B', ('buttons_0',)),
+    ('buttons_1', 'B', ('buttons_1',)),
+    ('buttons_2', 'B', ('buttons_2',)),
+    ('buttons_3', 'B', ('buttons_3',)),
+    ('timestamp', 'I', ('timestamp_0', 'timestamp_1', 'timestamp_2', 'timestamp_3')),
+    ('gyro_x', 'h', ('gyro_x_0', 'gyro_x_1')),
+    ('gyro_y', 'h', ('gyro_y_0', 'gyro_y_1')),
+    ('gyro_z', 'h', ('gyro_z_0', 'gyro_z_1')),
+    ('accel_x', 'h', ('accel_x_0', 'accel_x_1')),
+    ('accel_y', 'h', ('accel_y_0', 'accel_y_1')),
+    ('accel_z', 'h', ('accel_z_0', 'accel_z_1')),
+    ('sensor_timestamp', 'I', (
+        'sensor_timestamp_0', 'sensor_timestamp_1', 'sensor_timestamp_2', 'sensor_timestamp_3'
+    )),
+    ('touch_1_0', 'B', ('touch_1_0',)),
+    ('touch_1_1', 'B', ('touch_1_1',)),
+    ('touch_1_2', 'B', ('touch_1_2',)),
+    ('touch_1_3', 'B', ('touch_1_3',)),
+    ('touch_2_0', 'B', ('touch_2_0',)),
+    ('touch_2_1', 'B', ('touch_2_1',)),
+    ('touch_2_2', 'B', ('touch_2_2',)),
+    ('touch_2_3', 'B', ('touch_2_3',)),
+    ('right_trigger_feedback', 'B', ('right_trigger_feedback',)),
+    ('left_trigger_feedback', 'B', ('left_trigger_feedback',)),
+    ('battery_0', 'B', ('battery_0',)),
+    ('battery_1', 'B', ('battery_1',)),
+)
+
+
+class InReportDecoder:
+
+    @property
+    def size(self) -> int:
+        return self._struct.size
+
+    @staticmethod
+    def get_fields(index_dict: _IndexDict, offset: int = 0) -> list[tuple[int, str, str]]:
+        # (byte index, snapshot field, struct format char) of the fields contained in the report, in byte order
+        fields: list[tuple[int, str, str]] = []
+        for name, fmt, keys in _FIELD_SPECS:
+            indexes: list[int | None] = [index_dict.get(key) for key in keys]
+            if any(index is None for index in indexes):
+                continue
+            if indexes != list(range(indexes[0], indexes[0] + len(indexes))):
+                raise ValueError(f'Bytes of in report field "{name}" are not contiguous')
+            fields.append((indexes[0] + offset, name, fmt))
+        fields.sort()
+        return fields
+
+    def __init__(self, index_dict: _IndexDict, offset: int = 0):
+        fields: list[tuple[int, str, str]] = InReportDecoder.get_fields(index_dict, offset)
+
+        fmt: str = '<'
+        position: int = 0
+        for index, name, field_fmt in fields:
+            if index < position:
+                raise ValueError(f'In report field "{name}" overlaps its predecessor')
+            fmt += 'x' * (index - position) + field_fmt
+            position = index + struct.calcsize('<' + field_fmt)
+
+        # unpacked values come in byte order, snapshot fields are in declaration order.
+        # fields not contained in the report are picked from the appended defaults.
+        unpacked_names: list[str] = [name for _, name, _ in fields]
+        missing_names: list[str] = [name for name in InReportSnapshot._fields if name not in unpacked_names]
+        positions: list[int] = [
+            unpacked_names.index(name) if name in unpacked_names else len(fields) + missing_names.index(name)
+            for name in InReportSnapshot._fields
+        ]
+
+        self._struct: Final[struct.Struct] = struct.Struct(fmt)
+        self._defaults: Final[tuple[int, ...]] = tuple(
+            InReportSnapshot._field_defaults[name] for name in missing_names
+        )
+        self._reorder: Final[itemgetter] = itemgetter(*positions)
+
+    def decode(self, raw_bytes: bytes | bytearray | memoryview) -> InReportSnapshot:
+        return InReportSnapshot._make(self._reorder(self._struct.unpack_from(raw_bytes) + self._defaults))
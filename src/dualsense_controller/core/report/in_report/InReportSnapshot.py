@@ -0,0 +1,35 @@
+from typing import NamedTuple
+
+
+class InReportSnapshot(NamedTuple):
+    axes_0: int = 0
+    axes_1: int = 0
+    axes_2: int = 0
+    axes_3: int = 0
+    axes_4: int = 0
+    axes_5: int = 0
+    seq_num: int = 0
+    buttons_0: int = 0
+    buttons_1: int = 0
+    buttons_2: int = 0
+    buttons_3: int = 0
+    timestamp: int = 0
+    gyro_x: int = 0
+    gyro_y: int = 0
+    gyro_z: int = 0
+    accel_x: int = 0
+    accel_y: int = 0
+    accel_z: int = 0
+    sensor_timestamp: int = 0
+    touch_1_0: int = 0
+    touch_1_1: int = 0
+    touch_1_2: int = 0
+    touch_1_3: int = 0
+    touch_2_0: int = 0
+    touch_2_1: int = 0
+    touch_2_2: int = 0
+    touch_2_3: int = 0
+    right_trigger_feedback: int = 0
+    left_trigger_feedback: int = 0
+    battery_0: int = 0
+    battery_1: int = 0
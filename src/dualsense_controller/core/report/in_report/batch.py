@@ -0,0 +1,129 @@
+from typing import Any, Final
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
+from dualsense_controller.core.report.in_report.Bt31InReport import Bt31InReport
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+
+try:
+    import numpy as np
+except ImportError:  # optional, pip install dualsense-controller[numpy]
+    np = None
+
+_IN_REPORTS: Final[dict[ConnectionType, tuple[type[InReport], InReportLength]]] = {
+    ConnectionType.USB_01: (Usb01InReport, InReportLength.USB_01),
+    ConnectionType.BT_31: (Bt31InReport, InReportLength.BT_31),
+    ConnectionType.BT_01: (Bt01InReport, InReportLength.BT_01),
+}
+_DTYPE_FORMATS: Final[dict[str, str]] = {'B': 'u1', 'I': '<u4', 'h': '<i2'}
+
+# same decoding as ValueCalc, one column per state
+_VALUES: Final[tuple[tuple[ReadStateName, str], ...]] = (
+    (ReadStateName.LEFT_STICK_X, 'axes_0'),
+    (ReadStateName.LEFT_STICK_Y, 'axes_1'),
+    (ReadStateName.RIGHT_STICK_X, 'axes_2'),
+    (ReadStateName.RIGHT_STICK_Y, 'axes_3'),
+    (ReadStateName.LEFT_TRIGGER_VALUE, 'axes_4'),
+    (ReadStateName.RIGHT_TRIGGER_VALUE, 'axes_5'),
+    (ReadStateName.GYROSCOPE_X, 'gyro_x'),
+    (ReadStateName.GYROSCOPE_Y, 'gyro_y'),
+    (ReadStateName.GYROSCOPE_Z, 'gyro_z'),
+    (ReadStateName.ACCELEROMETER_X, 'accel_x'),
+    (ReadStateName.ACCELEROMETER_Y, 'accel_y'),
+    (ReadStateName.ACCELEROMETER_Z, 'accel_z'),
+    (ReadStateName.LEFT_TRIGGER_FEEDBACK_VALUE, 'left_trigger_feedback'),
+    (ReadStateName.RIGHT_TRIGGER_FEEDBACK_VALUE, 'right_trigger_feedback'),
+)
+_FLAGS: Final[tuple[tuple[ReadStateName, str, int], ...]] = (
+    (ReadStateName.BTN_SQUARE, 'buttons_0', 0x10),
+    (ReadStateName.BTN_CROSS, 'buttons_0', 0x20),
+    (ReadStateName.BTN_CIRCLE, 'buttons_0', 0x40),
+    (ReadStateName.BTN_TRIANGLE, 'buttons_0', 0x80),
+    (ReadStateName.BTN_L1, 'buttons_1', 0x01),
+    (ReadStateName.BTN_R1, 'buttons_1', 0x02),
+    (ReadStateName.BTN_L2, 'buttons_1', 0x04),
+    (ReadStateName.BTN_R2, 'buttons_1', 0x08),
+    (ReadStateName.BTN_CREATE, 'buttons_1', 0x10),
+    (ReadStateName.BTN_OPTIONS, 'buttons_1', 0x20),
+    (ReadStateName.BTN_L3, 'buttons_1', 0x40),
+    (ReadStateName.BTN_R3, 'buttons_1', 0x80),
+    (ReadStateName.BTN_PS, 'buttons_2', 0x01),
+    (ReadStateName.BTN_TOUCHPAD, 'buttons_2', 0x02),
+    (ReadStateName.BTN_MUTE, 'buttons_2', 0x04),
+    (ReadStateName.LEFT_TRIGGER_FEEDBACK_ACTIVE, 'left_trigger_feedback', 0x10),
+    (ReadStateName.RIGHT_TRIGGER_FEEDBACK_ACTIVE, 'right_trigger_feedback', 0x10),
+    (ReadStateName.BATTERY_FULL, 'battery_0', 0x20),
+    (ReadStateName.BATTERY_CHARGING, 'battery_1', 0x08),
+)
+_DPAD_DIRECTIONS: Final[tuple[tuple[ReadStateName, tuple[int, ...]], ...]] = (
+    (ReadStateName.BTN_UP, (0, 1, 7)),
+    (ReadStateName.BTN_RIGHT, (1, 2, 3)),
+    (ReadStateName.BTN_DOWN, (3, 4, 5)),
+    (ReadStateName.BTN_LEFT, (5, 6, 7)),
+)
+_TOUCH_FINGERS: Final[tuple[tuple[str, ReadStateName, ReadStateName, ReadStateName, ReadStateName], ...]] = (
+    ('touch_1', ReadStateName.TOUCH_FINGER_1_ACTIVE, ReadStateName.TOUCH_FINGER_1_ID,
+     ReadStateName.TOUCH_FINGER_1_X, ReadStateName.TOUCH_FINGER_1_Y),
+    ('touch_2', ReadStateName.TOUCH_FINGER_2_ACTIVE, ReadStateName.TOUCH_FINGER_2_ID,
+     ReadStateName.TOUCH_FINGER_2_X, ReadStateName.TOUCH_FINGER_2_Y),
+)
+
+
+def decode_reports(buffer: Any, connection_type: ConnectionType) -> dict[ReadStateName, Any]:
+    # buffer: N raw reports as read from the device, as bytes like object or uint8 array of shape (N, report length).
+    # returns one numpy array of N raw (unmapped) values per read state contained in the report type.
+    if np is None:
+        raise ImportError('decode_reports requires numpy, install dualsense-controller[numpy]')
+    if connection_type not in _IN_REPORTS:
+        raise ValueError(f'No in report for connection type {connection_type}')
+    in_report_type, length = _IN_REPORTS[connection_type]
+
+    fields: list[tuple[int, str, str]] = in_report_type().fields
+    dtype: np.dtype = np.dtype({
+        'names': [name for _, name, _ in fields],
+        'formats': [_DTYPE_FORMATS[fmt] for _, _, fmt in fields],
+        'offsets': [index for index, _, _ in fields],
+        'itemsize': int(length),
+    })
+    if isinstance(buffer, np.ndarray):
+        data: np.ndarray = np.ascontiguousarray(buffer, dtype=np.uint8).reshape(-1)
+    else:
+        data = np.frombuffer(buffer, dtype=np.uint8)
+    if data.size % length != 0:
+        raise ValueError(f'Buffer size {data.size} is not a multiple of the report length {int(length)}')
+    reports: np.ndarray = data.view(dtype)
+    names: set[str] = set(dtype.names)
+
+    decoded: dict[ReadStateName, np.ndarray] = {}
+    for state_name, field in _VALUES:
+        if field in names:
+            decoded[state_name] = reports[field].copy()
+    for state_name, field, mask in _FLAGS:
+        if field in names:
+            decoded[state_name] = (reports[field] & mask) != 0
+
+    if 'buttons_0' in names:
+        dpad: np.ndarray = reports['buttons_0'] & 0x0F
+        decoded[ReadStateName.DPAD] = dpad
+        for state_name, values in _DPAD_DIRECTIONS:
+            decoded[state_name] = np.isin(dpad, values)
+
+    for prefix, active_name, id_name, x_name, y_name in _TOUCH_FINGERS:
+        if f'{prefix}_0' not in names:
+            continue
+        t_0: np.ndarray = reports[f'{prefix}_0']
+        t_1: np.ndarray = reports[f'{prefix}_1'].astype(np.uint16)
+        t_2: np.ndarray = reports[f'{prefix}_2'].astype(np.uint16)
+        t_3: np.ndarray = reports[f'{prefix}_3'].astype(np.uint16)
+        decoded[active_name] = (t_0 & 0x80) == 0
+        decoded[id_name] = t_0 & 0x7F
+        decoded[x_name] = ((t_2 & 0x0F) << 8) | t_1
+        decoded[y_name] = (t_3 << 4) | ((t_2 & 0xF0) >> 4)
+
+    if 'battery_0' in names:
+        decoded[ReadStateName.BATTERY_LEVEL_PERCENT] = np.minimum(reports['battery_0'] & 0x0F, 8) / 8 * 100
+
+    return decoded
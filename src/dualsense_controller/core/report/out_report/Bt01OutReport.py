@@ -3,6 +3,7 @@ from dualsense_controller.core.report.out_report.enum import OutReportLength
 
 
 class Bt01OutReport(OutReport):
-    def to_bytes(self) -> bytes:
-        out_report_bytes: bytes = bytearray(OutReportLength.BT_31)
-        return out_report_bytes
+    _LENGTH = OutReportLength.BT_31
+
+    def to_bytes(self) -> bytearray:
+        return self._buffer
@@ -1,15 +1,26 @@
+import struct
+from typing import Final
+
 from dualsense_controller.core.report.out_report.OutReport import OutReport
-from dualsense_controller.core.report.out_report.crc32 import compute_crc32_checksum
+from dualsense_controller.core.report.out_report.crc32 import BT_31_CRC32_REPORT_LEN, compute_crc32_checksum
 from dualsense_controller.core.report.out_report.enum import OutReportLength
 from dualsense_controller.core.report.out_report.util import clamp_byte
 from dualsense_controller.core.state.write_state.enum import LightbarMode
 
+# enum member lookups are slow, to_bytes uses plain ints
+_LIGHT_ON: Final[int] = LightbarMode.LIGHT_ON.value
+_LIGHT_OFF: Final[int] = LightbarMode.LIGHT_OFF.value
+_CRC32_STRUCT: Final[struct.Struct] = struct.Struct('<I')
+
 
 class Bt31OutReport(OutReport):
-    def to_bytes(self) -> bytes:
+    _LENGTH = OutReportLength.BT_31
+
+    def to_bytes(self) -> bytearray:
         # print("-----------> BT31")
 
-        out_report_bytes: bytearray = bytearray(OutReportLength.BT_31)
+        # every call writes the same indexes, the others stay 0
+        out_report_bytes: bytearray = self._buffer
 
         # report type
         out_report_bytes[0] = 0x31
@@ -51,7 +62,7 @@ class Bt31OutReport(OutReport):
         out_report_bytes[33] = self.left_trigger_effect_param10
 
         out_report_bytes[40] = self.led_options
-        out_report_bytes[41] = LightbarMode.LIGHT_ON if self.lightbar_on_off else LightbarMode.LIGHT_OFF
+        out_report_bytes[41] = _LIGHT_ON if self.lightbar_on_off else _LIGHT_OFF
 
         out_report_bytes[43] = self.lightbar_pulse_options
         out_report_bytes[44] = self.player_leds_brightness
@@ -61,11 +72,7 @@ class Bt31OutReport(OutReport):
         out_report_bytes[47] = self.lightbar_green
         out_report_bytes[48] = self.lightbar_blue
 
-        crc32_checksum_result: int = compute_crc32_checksum(out_report_bytes)
-
-        out_report_bytes[74] = (crc32_checksum_result & 0x000000FF)
-        out_report_bytes[75] = (crc32_checksum_result & 0x0000FF00) >> 8
-        out_report_bytes[76] = (crc32_checksum_result & 0x00FF0000) >> 16
-        out_report_bytes[77] = (crc32_checksum_result & 0xFF000000) >> 24
+        # little endian behind the checksummed bytes
+        _CRC32_STRUCT.pack_into(out_report_bytes, BT_31_CRC32_REPORT_LEN, compute_crc32_checksum(out_report_bytes))
 
         return out_report_bytes
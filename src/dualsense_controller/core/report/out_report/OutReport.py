@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import ClassVar
 
 from dualsense_controller.core.state.write_state.enum import FlagsPhysics, FlagsControls, LedOptions, \
     LightbarPulseOptions, OperatingMode, PlayerLedsBrightness, PlayerLedsEnable
@@ -7,11 +8,16 @@ from dualsense_controller.core.state.write_state.enum import FlagsPhysics, Flags
 
 @dataclass(slots=True)
 class OutReport(ABC):
+    _LENGTH: ClassVar[int] = 0
 
+    # to_bytes encodes into this buffer and returns it, it is overwritten by the next call
     @abstractmethod
-    def to_bytes(self) -> bytes:
+    def to_bytes(self) -> bytearray:
         pass
 
+    def __post_init__(self) -> None:
+        self._buffer = bytearray(self._LENGTH)
+
     operating_mode: int = OperatingMode.DS5_MODE
     flags_physics: int = FlagsPhysics.ALL
     flags_controls: int = FlagsControls.ALL
@@ -56,3 +62,5 @@ class OutReport(ABC):
     lightbar_pulse_options: LightbarPulseOptions = LightbarPulseOptions.OFF
     player_leds_brightness: PlayerLedsBrightness = PlayerLedsBrightness.HIGH
     player_leds_enable: int = PlayerLedsEnable.OFF
+
+    _buffer: bytearray = field(default_factory=bytearray, init=False, repr=False, compare=False)
@@ -1,16 +1,25 @@
+from typing import Final
+
 from dualsense_controller.core.report.out_report.OutReport import OutReport
 from dualsense_controller.core.report.out_report.enum import OutReportLength
 from dualsense_controller.core.report.out_report.util import clamp_byte
 from dualsense_controller.core.state.write_state.enum import LightbarMode
 
+# enum member lookups are slow, to_bytes uses plain ints
+_LIGHT_ON: Final[int] = LightbarMode.LIGHT_ON.value
+_LIGHT_OFF: Final[int] = LightbarMode.LIGHT_OFF.value
+
 
 class Usb01OutReport(OutReport):
-    def to_bytes(self) -> bytes:
+    _LENGTH = OutReportLength.USB_01
+
+    def to_bytes(self) -> bytearray:
         # print("-----------> usb")
 
         # reportId = 0x02
 
-        out_report_bytes: bytearray = bytearray(OutReportLength.USB_01)
+        # every call writes the same indexes, the others stay 0
+        out_report_bytes: bytearray = self._buffer
 
         # report type
         out_report_bytes[0] = self.operating_mode
@@ -83,7 +92,7 @@ class Usb01OutReport(OutReport):
         out_report_bytes[39] = self.led_options
 
         # Lightbar on/off
-        out_report_bytes[41] = LightbarMode.LIGHT_ON if self.lightbar_on_off else LightbarMode.LIGHT_OFF
+        out_report_bytes[41] = _LIGHT_ON if self.lightbar_on_off else _LIGHT_OFF
 
         # Disable/Endable LEDs or Pulse/Fade-Options?
         out_report_bytes[42] = self.lightbar_pulse_options
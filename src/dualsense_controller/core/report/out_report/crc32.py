@@ -1,4 +1,5 @@
 import array
+import zlib
 from typing import Final
 
 _CRC32_HASH_TABLE: Final[array.array] = array.array('I', [
@@ -35,13 +36,20 @@ _CRC32_HASH_TABLE: Final[array.array] = array.array('I', [
     0x6fbf1d91, 0x18b82d07, 0x81b17cbd, 0xf6b64c2b, 0x68d2d988, 0x1fd5e91e, 0x86dcb8a4, 0xf1db8832,
     0x616495a3, 0x1663a535, 0x8f6af48f, 0xf86dc419, 0x660951ba, 0x110e612c, 0x88073096, 0xff000000
 ])
+# the checksum covers the bt output report header 0xa2 followed by the report, the seed is the crc32 of 0xa2
 _CRC32_SEED: Final[int] = 0xeada2d49
 
 BT_31_CRC32_REPORT_LEN: Final[int] = 74
 
 
-def compute_crc32_checksum(out_report_bytes: bytes):
-    checksum: int = 0xeada2d49
+def compute_crc32_checksum(out_report_bytes: bytes | bytearray) -> int:
+    # the standard crc32, zlib continues it from the seed, the memoryview slice copies nothing
+    return zlib.crc32(memoryview(out_report_bytes)[:BT_31_CRC32_REPORT_LEN], _CRC32_SEED)
+
+
+def _compute_crc32_checksum_table(out_report_bytes: bytes | bytearray) -> int:
+    # byte by byte with the table, the reference for compute_crc32_checksum
+    checksum: int = _CRC32_SEED
 
     for i in range(0, BT_31_CRC32_REPORT_LEN):
         checksum = _CRC32_HASH_TABLE[(checksum & 0xFF) ^ (out_report_bytes[i] & 0xFF)] ^ (checksum >> 8)
@@ -0,0 +1,34 @@
+from typing import Callable, Final, Generic
+
+from dualsense_controller.core.exception import SharedStateListenerException
+from dualsense_controller.core.state.typedef import StateChangeCallback, StateName, StateValue
+
+
+class SharedReadState(Generic[StateValue]):
+    # stands in for a ReadState on the client side of a shared reader process, so the api properties can be reused.
+    # read only, there is no thread on this side to call listeners
+
+    @property
+    def value(self) -> StateValue:
+        return self._read_value()
+
+    @property
+    def has_changed_since_last_set_value(self) -> bool:
+        return self._read_changed()
+
+    def __init__(self, name: StateName, read_value: Callable[[], StateValue], read_changed: Callable[[], bool]):
+        self.name: Final[StateName] = name
+        self._read_value: Final[Callable[[], StateValue]] = read_value
+        self._read_changed: Final[Callable[[], bool]] = read_changed
+
+    def on_change(self, callback: StateChangeCallback) -> None:
+        self._no_listeners()
+
+    def once_change(self, callback: StateChangeCallback) -> None:
+        self._no_listeners()
+
+    def remove_change_listener(self, callback: StateChangeCallback | None = None) -> None:
+        self._no_listeners()
+
+    def _no_listeners(self) -> None:
+        raise SharedStateListenerException(self.name)
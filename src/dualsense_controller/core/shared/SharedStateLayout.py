@@ -0,0 +1,116 @@
+import struct
+from dataclasses import dataclass, fields
+from typing import Any, Final
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from dualsense_controller.core.state.read_state.value_type import Accelerometer, Battery, Gyroscope, JoyStick, \
+    Orientation, TouchFinger, TriggerFeedback
+
+# memory layout: header, one change sequence per state, one kind byte per slot, one double per slot.
+# every plain value takes one slot, a dataclass value one slot telling whether it is None and one per field
+
+# version, 8 bytes at the start. odd while the writer publishes, readers retry when it is odd or changed meanwhile
+VERSION: Final[struct.Struct] = struct.Struct('<Q')
+# crc32 of everything from the header on. the version alone relies on the stores of the writer becoming visible
+# in order, as on x86-64. weakly ordered cpus like arm may show a copy with the new version but old values,
+# readers retry until the checksum matches as well
+CHECKSUM: Final[struct.Struct] = struct.Struct('<I')
+CHECKSUM_OFFSET: Final[int] = VERSION.size
+# report sequence, time.perf_counter_ns() of the update, connection type index, status,
+# then the sequence number, number of states, timestamp and sensor timestamp the controller wrote into the report
+HEADER: Final[struct.Struct] = struct.Struct('<QqBBBxIII')
+HEADER_OFFSET: Final[int] = 16
+HEADER_SIZE: Final[int] = 64
+# the report sequence a state changed with last
+CHANGE_SEQUENCE: Final[struct.Struct] = struct.Struct('<Q')
+VALUE: Final[struct.Struct] = struct.Struct('<d')
+
+CONNECTION_TYPES: Final[tuple[ConnectionType, ...]] = tuple(ConnectionType)
+
+# the kind is kept beside the value, so bools and ints come back as such
+KIND_NONE: Final[int] = 0
+KIND_BOOL: Final[int] = 1
+KIND_INT: Final[int] = 2
+KIND_FLOAT: Final[int] = 3
+# a dataclass value which is not None, its fields follow
+KIND_PRESENT: Final[int] = 4
+
+_DATACLASS_VALUE_TYPES: Final[dict[ReadStateName, type]] = {
+    ReadStateName.LEFT_STICK: JoyStick,
+    ReadStateName.RIGHT_STICK: JoyStick,
+    ReadStateName.GYROSCOPE: Gyroscope,
+    ReadStateName.ACCELEROMETER: Accelerometer,
+    ReadStateName.ORIENTATION: Orientation,
+    ReadStateName.TOUCH_FINGER_1: TouchFinger,
+    ReadStateName.TOUCH_FINGER_2: TouchFinger,
+    ReadStateName.LEFT_TRIGGER_FEEDBACK: TriggerFeedback,
+    ReadStateName.RIGHT_TRIGGER_FEEDBACK: TriggerFeedback,
+    ReadStateName.BATTERY: Battery,
+}
+# names without a read state of their own
+_WITHOUT_STATE: Final[tuple[ReadStateName, ...]] = (ReadStateName.LEFT_TRIGGER, ReadStateName.RIGHT_TRIGGER)
+
+
+def encode_value(value: Any) -> tuple[int, float]:
+    if value is None:
+        return KIND_NONE, 0.0
+    if value is True or value is False:
+        return KIND_BOOL, float(value)
+    if isinstance(value, int):
+        return KIND_INT, float(value)
+    return KIND_FLOAT, float(value)
+
+
+def decode_value(kind: int, value: float) -> Any:
+    if kind == KIND_FLOAT:
+        return value
+    if kind == KIND_INT:
+        return int(value)
+    if kind == KIND_BOOL:
+        return value != 0.0
+    return None
+
+
+@dataclass(frozen=True, slots=True)
+class SharedStateEntry:
+    name: ReadStateName
+    # of the change sequence
+    index: int
+    first_slot: int
+    num_slots: int
+    # None for plain values
+    value_type: type | None
+    field_names: tuple[str, ...]
+
+
+class SharedStateLayout:
+
+    @property
+    def entries(self) -> tuple[SharedStateEntry, ...]:
+        return self._entries
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __init__(self):
+        entries: list[SharedStateEntry] = []
+        num_slots: int = 0
+        for index, name in enumerate(name for name in ReadStateName if name not in _WITHOUT_STATE):
+            value_type: type | None = _DATACLASS_VALUE_TYPES.get(name)
+            field_names: tuple[str, ...] = tuple(field.name for field in fields(value_type)) if value_type else ()
+            entries.append(SharedStateEntry(name, index, num_slots, 1 + len(field_names), value_type, field_names))
+            num_slots += 1 + len(field_names)
+
+        self._entries: Final[tuple[SharedStateEntry, ...]] = tuple(entries)
+        self._entries_by_name: Final[dict[ReadStateName, SharedStateEntry]] = {entry.name: entry for entry in entries}
+        self.num_slots: Final[int] = num_slots
+        self.change_sequences_offset: Final[int] = HEADER_SIZE
+        self.kinds_offset: Final[int] = HEADER_SIZE + CHANGE_SEQUENCE.size * len(entries)
+        # doubles aligned to 8 bytes
+        self.values_offset: Final[int] = (self.kinds_offset + num_slots + 7) // 8 * 8
+        self._size: Final[int] = self.values_offset + VALUE.size * num_slots
+
+    def get_entry(self, name: ReadStateName) -> SharedStateEntry:
+        return self._entries_by_name[name]
@@ -0,0 +1,145 @@
+import struct
+import time
+import zlib
+from typing import Any, Final
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.shared.SharedStateLayout import CHANGE_SEQUENCE, CHECKSUM, CHECKSUM_OFFSET, \
+    CONNECTION_TYPES, HEADER, HEADER_OFFSET, KIND_NONE, SharedStateEntry, SharedStateLayout, VALUE, VERSION, decode_value
+from dualsense_controller.core.shared.enum import SharedReaderStatus
+from dualsense_controller.core.state.read_state.ControllerSnapshot import ControllerSnapshot, SNAPSHOT_STATE_NAMES
+
+# retries spin first, the writer holds an odd version only for a few microseconds
+_SPIN_RETRIES: Final[int] = 100
+_POLL_INTERVAL: Final[float] = 0.0005
+
+
+class SharedStateReader:
+    # reads states published by a SharedStateWriter in another process, without locks and without pickling.
+    # the whole block is copied between two reads of the version and decoded once both versions are equal and even
+    # and the checksum matches the copy, so a copy torn by stores becoming visible out of order (arm) is retried too
+
+    @property
+    def layout(self) -> SharedStateLayout:
+        return self._layout
+
+    @property
+    def sequence(self) -> int:
+        return self._read_header()[0]
+
+    @property
+    def timestamp(self) -> int:
+        return self._read_header()[1]
+
+    @property
+    def connection_type(self) -> ConnectionType:
+        return CONNECTION_TYPES[self._read_header()[2]]
+
+    @property
+    def status(self) -> SharedReaderStatus:
+        return SharedReaderStatus(self._read_header()[3])
+
+    def __init__(self, buffer: memoryview, layout: SharedStateLayout | None = None):
+        self._layout: Final[SharedStateLayout] = layout if layout is not None else SharedStateLayout()
+        assert len(buffer) >= self._layout.size, 'shared memory too small'
+        # a snapshot takes the states in layout order
+        assert tuple(entry.name for entry in self._layout.entries) == SNAPSHOT_STATE_NAMES, 'layout out of date'
+        self._buffer: Final[memoryview] = buffer
+        # (version, copy) of the last consistent copy, valid as long as the version is unchanged
+        self._copy: tuple[int, bytes] = (-1, b'')
+        self._values_struct: Final[struct.Struct] = struct.Struct(f'<{self._layout.num_slots}d')
+        # per state: (kinds start, kinds end, values offset, struct of its doubles)
+        self._slots: Final[dict[SharedStateEntry, tuple[int, int, int, struct.Struct]]] = {
+            entry: (
+                self._layout.kinds_offset + entry.first_slot,
+                self._layout.kinds_offset + entry.first_slot + entry.num_slots,
+                self._layout.values_offset + VALUE.size * entry.first_slot,
+                struct.Struct(f'<{entry.num_slots}d'),
+            ) for entry in self._layout.entries
+        }
+
+    def read_value(self, entry: SharedStateEntry) -> Any:
+        kinds_start, kinds_end, values_offset, values_struct = self._slots[entry]
+        data: bytes = self._read_consistent()
+        return self._decode(entry, data[kinds_start:kinds_end], values_struct.unpack_from(data, values_offset))
+
+    def read_snapshot(self) -> ControllerSnapshot | None:
+        # header and all slots of one consistent copy, None until the first report is published
+        data: bytes = self._read_consistent()
+        kinds_offset: int = self._layout.kinds_offset
+        header: tuple[int, ...] = HEADER.unpack_from(data, HEADER_OFFSET)
+        kinds: bytes = data[kinds_offset:kinds_offset + self._layout.num_slots]
+        values: tuple[float, ...] = self._values_struct.unpack_from(data, self._layout.values_offset)
+        sequence, timestamp, _, _, controller_sequence, _, controller_timestamp, sensor_timestamp = header
+        if sequence == 0:
+            return None
+        return ControllerSnapshot(
+            sequence,
+            controller_sequence,
+            timestamp,
+            controller_timestamp,
+            sensor_timestamp,
+            *(
+                self._decode(
+                    entry,
+                    kinds[entry.first_slot:entry.first_slot + entry.num_slots],
+                    values[entry.first_slot:entry.first_slot + entry.num_slots],
+                ) for entry in self._layout.entries
+            ),
+        )
+
+    def read_changed(self, entry: SharedStateEntry) -> bool:
+        # changed with the last published report
+        offset: int = self._layout.change_sequences_offset + CHANGE_SEQUENCE.size * entry.index
+        data: bytes = self._read_consistent()
+        change_sequence: int = CHANGE_SEQUENCE.unpack_from(data, offset)[0]
+        sequence: int = HEADER.unpack_from(data, HEADER_OFFSET)[0]
+        return sequence != 0 and change_sequence == sequence
+
+    def wait_for_sequence(self, sequence: int, timeout: float | None = None) -> bool:
+        # polls, waiting for the writer would cost it a syscall per report
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        while self.sequence <= sequence:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(_POLL_INTERVAL)
+        return True
+
+    @staticmethod
+    def _decode(entry: SharedStateEntry, kinds: bytes, values: tuple[float, ...]) -> Any:
+        if entry.value_type is None:
+            return decode_value(kinds[0], values[0])
+        if kinds[0] == KIND_NONE:
+            return None
+        return entry.value_type(*(decode_value(kind, value) for kind, value in zip(kinds[1:], values[1:])))
+
+    def _read_header(self) -> tuple[int, ...]:
+        return HEADER.unpack_from(self._read_consistent(), HEADER_OFFSET)
+
+    @staticmethod
+    def _has_valid_checksum(data: bytes) -> bool:
+        return CHECKSUM.unpack_from(data, CHECKSUM_OFFSET)[0] == zlib.crc32(memoryview(data)[HEADER_OFFSET:])
+
+    def _read_consistent(self) -> bytes:
+        # a copy of the whole block, the checksum covers all of it. at version 0 nothing is written yet, all zeros.
+        # copied and checked once per published version, polling many states of one report reuses the copy
+        buffer: memoryview = self._buffer
+        size: int = self._layout.size
+        retries: int = 0
+        while True:
+            version: int = VERSION.unpack_from(buffer, 0)[0]
+            copy: tuple[int, bytes] = self._copy
+            if copy[0] == version:
+                return copy[1]
+            if not version & 1:
+                data: bytes = bytes(buffer[:size])
+                if (
+                        VERSION.unpack_from(buffer, 0)[0] == version
+                        and VERSION.unpack_from(data, 0)[0] == version
+                        and (version == 0 or self._has_valid_checksum(data))
+                ):
+                    self._copy = (version, data)
+                    return data
+            retries += 1
+            if retries > _SPIN_RETRIES:
+                time.sleep(0)
@@ -0,0 +1,109 @@
+import zlib
+from typing import Any, Final
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.InReportSnapshot import InReportSnapshot
+from dualsense_controller.core.shared.SharedStateLayout import CHANGE_SEQUENCE, CHECKSUM, CHECKSUM_OFFSET, \
+    CONNECTION_TYPES, HEADER, HEADER_OFFSET, KIND_NONE, KIND_PRESENT, SharedStateEntry, SharedStateLayout, VALUE, VERSION, encode_value
+from dualsense_controller.core.shared.enum import SharedReaderStatus
+from dualsense_controller.core.state.State import State
+from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+
+_UNPUBLISHED: Final[object] = object()
+
+
+class SharedStateWriter:
+    # publishes the read states into shared memory after every update, only the states changed since the last one.
+    # readers copy without locks and retry when the version was odd or changed meanwhile (seqlock),
+    # or the checksum does not match the copy.
+    # there is exactly one writer, the thread updating the read states
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    @property
+    def status(self) -> SharedReaderStatus:
+        return self._status
+
+    def __init__(self, buffer: memoryview, read_states: ReadStates, layout: SharedStateLayout | None = None):
+        self._layout: Final[SharedStateLayout] = layout if layout is not None else SharedStateLayout()
+        assert len(buffer) >= self._layout.size, 'shared memory too small'
+        self._buffer: Final[memoryview] = buffer
+        self._read_states: Final[ReadStates] = read_states
+        self._states: Final[tuple[tuple[SharedStateEntry, State[Any]], ...]] = tuple(
+            (entry, read_states.get_state(entry.name)) for entry in self._layout.entries
+        )
+        # raw values published last, compared by identity, a changed state always has a new value object
+        self._published: Final[list[Any]] = [_UNPUBLISHED] * len(self._states)
+        self._version: int = 0
+        self._sequence: int = 0
+        self._timestamp: int = 0
+        self._connection_index: int = 0
+        self._controller_sequence: int = 0
+        self._controller_timestamp: int = 0
+        self._sensor_timestamp: int = 0
+        self._status: SharedReaderStatus = SharedReaderStatus.STARTING
+        self._begin()
+        self._end()
+
+    def set_status(self, status: SharedReaderStatus, connection_type: ConnectionType | None = None) -> None:
+        self._begin()
+        self._status = status
+        if connection_type is not None:
+            self._connection_index = CONNECTION_TYPES.index(connection_type)
+        self._end()
+
+    def publish(self) -> None:
+        buffer: memoryview = self._buffer
+        change_sequences_offset: int = self._layout.change_sequences_offset
+        published: list[Any] = self._published
+        sequence: int = self._sequence + 1
+
+        self._begin()
+        for index, (entry, state) in enumerate(self._states):
+            value_raw: Any = state.value_raw
+            if value_raw is published[index]:
+                continue
+            published[index] = value_raw
+            self._write_value(entry, state.value)
+            CHANGE_SEQUENCE.pack_into(buffer, change_sequences_offset + CHANGE_SEQUENCE.size * index, sequence)
+        self._sequence = sequence
+        self._timestamp = self._read_states.timestamp
+        in_report: InReport | None = self._read_states.in_report
+        if in_report is not None:
+            in_report_snapshot: InReportSnapshot = in_report.snapshot
+            self._controller_sequence = in_report_snapshot.seq_num
+            self._controller_timestamp = in_report_snapshot.timestamp
+            self._sensor_timestamp = in_report_snapshot.sensor_timestamp
+        self._end()
+
+    def _write_value(self, entry: SharedStateEntry, value: Any) -> None:
+        if entry.value_type is None:
+            self._write_slot(entry.first_slot, *encode_value(value))
+            return
+        if value is None:
+            self._write_slot(entry.first_slot, KIND_NONE, 0.0)
+            return
+        self._write_slot(entry.first_slot, KIND_PRESENT, 0.0)
+        for slot, field_name in enumerate(entry.field_names, entry.first_slot + 1):
+            self._write_slot(slot, *encode_value(getattr(value, field_name)))
+
+    def _write_slot(self, slot: int, kind: int, value: float) -> None:
+        self._buffer[self._layout.kinds_offset + slot] = kind
+        VALUE.pack_into(self._buffer, self._layout.values_offset + VALUE.size * slot, value)
+
+    def _begin(self) -> None:
+        self._version += 1
+        VERSION.pack_into(self._buffer, 0, self._version)
+
+    def _end(self) -> None:
+        HEADER.pack_into(
+            self._buffer, HEADER_OFFSET,
+            self._sequence, self._timestamp, self._connection_index, self._status,
+            self._controller_sequence, len(self._states), self._controller_timestamp, self._sensor_timestamp,
+        )
+        CHECKSUM.pack_into(self._buffer, CHECKSUM_OFFSET, zlib.crc32(self._buffer[HEADER_OFFSET:self._layout.size]))
+        self._version += 1
+        VERSION.pack_into(self._buffer, 0, self._version)
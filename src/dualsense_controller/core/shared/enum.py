@@ -0,0 +1,8 @@
+from enum import IntEnum
+
+
+class SharedReaderStatus(IntEnum):
+    STARTING = 0
+    RUNNING = 1
+    STOPPED = 2
+    FAILED = 3
@@ -0,0 +1,42 @@
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Event
+from typing import Any
+
+from dualsense_controller.core.DualSenseControllerCore import DualSenseControllerCore
+from dualsense_controller.core.shared.SharedStateWriter import SharedStateWriter
+from dualsense_controller.core.shared.enum import SharedReaderStatus
+from dualsense_controller.core.util import format_exception
+
+
+def run_reader_process(shared_memory_name: str, stop: Event, messages: Connection, core_kwargs: dict[str, Any]) -> None:
+    # entry of the child process: reads the controller, updates all read states and publishes them after every report.
+    # sends None once running, the formatted exception when starting or reading fails
+    shared_memory: SharedMemory = SharedMemory(shared_memory_name)
+    writer: SharedStateWriter | None = None
+    try:
+        # every state is calculated, nobody on this side asks for them
+        core: DualSenseControllerCore = DualSenseControllerCore(
+            enforce_update=True, can_update_itself=False, **core_kwargs
+        )
+        writer = SharedStateWriter(shared_memory.buf, core.read_states)
+        core.on_updated(writer.publish)
+
+        def on_exception(exception: Exception) -> None:
+            writer.set_status(SharedReaderStatus.FAILED)
+            messages.send(format_exception(exception))
+
+        core.exception_state.on_change(on_exception)
+        core.init()
+        writer.set_status(SharedReaderStatus.RUNNING, core.connection_type)
+        messages.send(None)
+        stop.wait()
+        core.deinit()
+        if writer.status is not SharedReaderStatus.FAILED:
+            writer.set_status(SharedReaderStatus.STOPPED)
+    except Exception as exception:
+        if writer is not None:
+            writer.set_status(SharedReaderStatus.FAILED)
+        messages.send(format_exception(exception))
+    finally:
+        shared_memory.close()
@@ -1,5 +1,7 @@
-from typing import Final, Any
+from typing import Callable, Final, Any
 
+from dualsense_controller.core.state.CallbackDispatcher import CallbackDispatcher
+from dualsense_controller.core.state.CallbackProfiler import CallbackProfiler
 from dualsense_controller.core.state.State import State
 from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
 from dualsense_controller.core.state.typedef import StateChangeCallback, StateName
@@ -57,6 +59,20 @@ class BaseStates:
         for state_name, state in self._states_dict.items():
             state.remove_change_listener(callback)
 
+    def set_callback_profiler(self, profiler: CallbackProfiler | None) -> None:
+        for state_name, state in self._states_dict.items():
+            state.set_callback_profiler(profiler)
+
+    def set_callback_dispatcher(self, dispatcher: CallbackDispatcher | None) -> None:
+        for state_name, state in self._states_dict.items():
+            state.set_callback_dispatcher(dispatcher)
+
+    def wait_for(self, name: StateName, predicate: Callable[[Any], bool], timeout: float | None = None) -> bool:
+        return self._get_state_by_name(name).wait_for(predicate, timeout)
+
+    def get_state(self, name: StateName) -> State[Any]:
+        return self._get_state_by_name(name)
+
     def _register_state(self, state: State[Any]) -> None:
         self._states_dict[state.name] = state
 
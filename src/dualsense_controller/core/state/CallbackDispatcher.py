@@ -0,0 +1,111 @@
+from collections import deque
+from concurrent.futures import Executor
+from threading import Condition, Lock, Thread
+from typing import Any, Callable, Final, Hashable
+
+from dualsense_controller.core.typedef import ExceptionCallback
+
+# calls of one key drained before the key goes to the back of the line again
+_BATCH_SIZE: Final[int] = 16
+
+
+class CallbackDispatcher:
+    # runs callbacks outside the hid thread, either on an executor or, without one, on a dedicated thread.
+    # calls with the same key (one state) run one after another in dispatch order, different keys run concurrently
+    # on an executor. each key queues at most maxsize calls, a full queue drops its oldest call.
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
+
+    def __init__(self, executor: Executor | None = None, maxsize: int = 256):
+        assert maxsize > 0, 'maxsize must be positive'
+        self._executor: Final[Executor | None] = executor
+        self._maxsize: Final[int] = maxsize
+        self._lock: Final[Lock] = Lock()
+        self._idle: Final[Condition] = Condition(self._lock)
+        self._queues: Final[dict[Hashable, deque[tuple[Callable[..., None], tuple[Any, ...]]]]] = {}
+        self._scheduled: Final[set[Hashable]] = set()
+        self._dropped: int = 0
+        self._exception_callbacks: list[ExceptionCallback] = []
+
+        self._ready: Final[deque[Hashable]] = deque()
+        self._ready_condition: Final[Condition] = Condition()
+        self._closed: bool = False
+        self._thread: Thread | None = None
+        if executor is None:
+            self._thread = Thread(target=self._thread_loop, daemon=True)
+            self._thread.start()
+
+    def on_exception(self, callback: ExceptionCallback) -> None:
+        self._exception_callbacks.append(callback)
+
+    def dispatch(self, key: Hashable, fn: Callable[..., None], args: tuple[Any, ...]) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            queue: deque | None = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+            if len(queue) >= self._maxsize:
+                queue.popleft()
+                self._dropped += 1
+            queue.append((fn, args))
+            if key in self._scheduled:
+                return
+            self._scheduled.add(key)
+        self._schedule(key)
+
+    def wait_until_idle(self, timeout: float | None = None) -> bool:
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._scheduled, timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        self.wait_until_idle(timeout)
+        with self._lock:
+            self._closed = True
+        if self._thread is not None:
+            with self._ready_condition:
+                self._ready_condition.notify_all()
+            self._thread.join(timeout)
+
+    def _schedule(self, key: Hashable) -> None:
+        if self._executor is not None:
+            self._executor.submit(self._drain, key)
+            return
+        with self._ready_condition:
+            self._ready.append(key)
+            self._ready_condition.notify()
+
+    def _drain(self, key: Hashable) -> None:
+        for _ in range(_BATCH_SIZE):
+            with self._lock:
+                queue: deque = self._queues[key]
+                if not queue:
+                    self._scheduled.discard(key)
+                    if not self._scheduled:
+                        self._idle.notify_all()
+                    return
+                fn, args = queue.popleft()
+            try:
+                fn(*args)
+            except Exception as exception:
+                for exception_callback in self._exception_callbacks:
+                    exception_callback(exception)
+        # more calls pending, let other keys run in between
+        self._schedule(key)
+
+    def _thread_loop(self) -> None:
+        while True:
+            with self._ready_condition:
+                while not self._ready:
+                    if self._closed:
+                        return
+                    self._ready_condition.wait()
+                key: Hashable = self._ready.popleft()
+            self._drain(key)
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Final
+
+from dualsense_controller.core.log import Log
+from dualsense_controller.core.state.typedef import StateChangeCallback, StateName
+
+# (state name, callback, duration in ns)
+OverBudgetCallback = Callable[[StateName, StateChangeCallback, int], None]
+
+
+@dataclass(frozen=True, slots=True)
+class CallbackProfile:
+    state_name: StateName
+    callback: StateChangeCallback
+    calls: int
+    total_ns: int
+    max_ns: int
+    over_budget: int
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.calls if self.calls > 0 else 0.0
+
+
+class CallbackProfiler:
+    # aggregates the duration of each change callback per state.
+    # a callback exceeding the budget is logged once and reported to the over budget listeners every time.
+
+    @property
+    def budget_ns(self) -> int:
+        return self._budget_ns
+
+    @property
+    def profiles(self) -> list[CallbackProfile]:
+        with self._lock:
+            profiles: list[CallbackProfile] = [
+                CallbackProfile(state_name, callback, *entry)
+                for (state_name, callback), entry in self._entries.items()
+            ]
+        return sorted(profiles, key=lambda profile: profile.total_ns, reverse=True)
+
+    def __init__(self, budget_ns: int = 1_000_000, warn: bool = True):
+        self._budget_ns: Final[int] = budget_ns
+        self._warn: Final[bool] = warn
+        self._lock: Final[Lock] = Lock()
+        # (state name, callback) -> [calls, total ns, max ns, over budget]
+        self._entries: Final[dict[tuple[StateName, StateChangeCallback], list[int]]] = {}
+        self._over_budget_callbacks: list[OverBudgetCallback] = []
+
+    def on_over_budget(self, callback: OverBudgetCallback) -> None:
+        self._over_budget_callbacks.append(callback)
+
+    def record(self, state_name: StateName, callback: StateChangeCallback, duration_ns: int) -> None:
+        key: tuple[StateName, StateChangeCallback] = (state_name, callback)
+        with self._lock:
+            entry: list[int] | None = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = [0, 0, 0, 0]
+            entry[0] += 1
+            entry[1] += duration_ns
+            if duration_ns > entry[2]:
+                entry[2] = duration_ns
+            over_budget: bool = duration_ns > self._budget_ns
+            if over_budget:
+                entry[3] += 1
+            first_over_budget: bool = over_budget and entry[3] == 1
+        if not over_budget:
+            return
+        if self._warn and first_over_budget:
+            Log.warning(
+                f'change callback {getattr(callback, "__qualname__", callback)} of {state_name} took '
+                f'{duration_ns / 1e6:.3f} ms, budget is {self._budget_ns / 1e6:.3f} ms'
+            )
+        for over_budget_callback in self._over_budget_callbacks:
+            over_budget_callback(state_name, callback, duration_ns)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
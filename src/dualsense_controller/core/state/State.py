@@ -1,19 +1,26 @@
 from __future__ import annotations
 
 import time
-from threading import Lock
-from typing import Final, Generic, Any
+from threading import Event
+from typing import Callable, Final, Generic, Any
 
-from dualsense_controller.core.core.Lockable import Lockable
+from dualsense_controller.core.state.StateRecord import StateRecord
+from dualsense_controller.core.state.CallbackDispatcher import CallbackDispatcher
+from dualsense_controller.core.state.CallbackProfiler import CallbackProfiler
 from dualsense_controller.core.state.StateValueCallbackManager import StateValueCallbackManager
 from dualsense_controller.core.state.mapping.typedef import MapFn, empty_map_fn
 from dualsense_controller.core.state.typedef import CompareFn, CompareResult, StateChangeCallback, StateName, \
     StateValue, default_compare_fn
+from dualsense_controller.core.typedef import EmptyCallback
 
 class State(Generic[StateValue]):
     def __repr__(self) -> str:
         return f'State[{type(self._value_raw).__name__}]({self.name}: {self._value_raw} -> {self.value})'
 
+    @property
+    def record(self) -> StateRecord[StateValue]:
+        return self._record
+
     @property
     def value(self) -> StateValue:
         value_raw: StateValue = self.value_raw
@@ -30,55 +37,32 @@ class State(Generic[StateValue]):
 
     @property
     def value_raw(self) -> StateValue:
-        return self._value_raw
+        return self._record.value
 
     @property
     def last_value_raw(self) -> StateValue:
-        return self._last_value_raw
+        return self._record.last_value
 
     @property
     def has_changed_since_last_set_value(self) -> bool:
         if self._disable_change_detection:
             return False
-        return self._changed_since_last_set_value
+        return self._record.changed
 
     @property
     def has_listeners(self) -> bool:
         return self._callback_manager.has_listeners
 
-    # LOCKED GETTERS AND SETTERS
+    # every change is published as one immutable record by a single reference assignment,
+    # which is atomic, so readers on other threads always see a consistent record without locking
 
     @property
     def _value_raw(self) -> StateValue:
-        return self.__value.value
-
-    @_value_raw.setter
-    def _value_raw(self, _value: StateValue) -> None:
-        self.__value.value = _value
-
-    @property
-    def _last_value_raw(self) -> StateValue:
-        return self.__last_value.value
-
-    @_last_value_raw.setter
-    def _last_value_raw(self, _last_value: StateValue) -> None:
-        self.__last_value.value = _last_value
+        return self._record.value
 
     @property
     def _change_timestamp(self) -> int:
-        return self.__change_timestamp.value
-
-    @_change_timestamp.setter
-    def _change_timestamp(self, _change_timestamp: int) -> None:
-        self.__change_timestamp.value = _change_timestamp
-
-    @property
-    def _changed_since_last_set_value(self) -> bool:
-        return self.__changed_since_last_update.value
-
-    @_changed_since_last_set_value.setter
-    def _changed_since_last_set_value(self, _changed_since_last_update: bool) -> None:
-        self.__changed_since_last_update.value = _changed_since_last_update
+        return self._record.change_timestamp
 
     def __init__(
             self,
@@ -93,7 +77,6 @@ class State(Generic[StateValue]):
     ):
         # CONST
         self.name: Final[StateName] = name
-        self._lock: Final[Lock] = Lock()
         self._callback_manager: Final[StateValueCallbackManager[StateValue]] = StateValueCallbackManager(name)
         self._compare_fn: Final[CompareFn[StateValue]] = compare_fn
         self._mapped_to_raw_fn: Final[MapFn] = mapped_to_raw_fn
@@ -101,24 +84,19 @@ class State(Generic[StateValue]):
         self._ignore_none: Final[bool] = ignore_none
         self._default_value: Final[StateValue | None] = default_value
         self._disable_change_detection: Final[bool] = disable_change_detection
+        self._listeners_change_callbacks: list[EmptyCallback] = []
+        # set with the first value. ignoring None, the first value is set without a change
+        self._has_value: Final[Event] = Event()
 
         # VAR
-        self.__value: Lockable[StateValue | None] = Lockable(
-            lock=self._lock,
-            value=value if value is not None else default_value
-        )
-        self.__last_value: Lockable[StateValue | None] = Lockable(
-            lock=self._lock,
-            value=None
-        )
-        self.__change_timestamp: Lockable[int] = Lockable(
-            lock=self._lock,
-            value=0
-        )
-        self.__changed_since_last_update: Lockable[bool] = Lockable(
-            lock=self._lock,
-            value=False
+        self._record: StateRecord[StateValue] = StateRecord(
+            value=value if value is not None else default_value,
+            last_value=None,
+            change_timestamp=0,
+            changed=False,
         )
+        if self._record.value is not None:
+            self._has_value.set()
 
     def set_value_raw_without_triggering_change(self, new_value: StateValue | None):
         self._set_value_raw(new_value, trigger_change_on_changed=False)
@@ -137,21 +115,59 @@ class State(Generic[StateValue]):
         # print(f'{self.name}: {value_mapped} -> {raw_val}')
         self._set_value_raw(value_raw, trigger_change_on_changed=trigger_change_on_changed)
 
+    def set_unchanged(self) -> None:
+        record: StateRecord[StateValue] = self._record
+        if record.changed:
+            self._record = record._replace(changed=False)
+
     def trigger_change_if_changed(self) -> None:
         if self.has_changed_since_last_set_value:
             self._trigger_change()
 
     def on_change(self, callback: StateChangeCallback) -> None:
         self._callback_manager.on_change(callback)
+        self._listeners_changed()
 
     def once_change(self, callback: StateChangeCallback) -> None:
         self._callback_manager.once_change(callback)
+        self._listeners_changed()
 
     def remove_change_listener(self, callback: StateChangeCallback | None = None) -> None:
         self._callback_manager.remove_change_listener(callback)
+        self._listeners_changed()
 
     def remove_all_change_listeners(self) -> None:
         self._callback_manager.remove_all_change_listeners()
+        self._listeners_changed()
+
+    def set_callback_profiler(self, profiler: CallbackProfiler | None) -> None:
+        self._callback_manager.set_profiler(profiler)
+
+    def set_callback_dispatcher(self, dispatcher: CallbackDispatcher | None) -> None:
+        self._callback_manager.set_dispatcher(dispatcher)
+
+    def on_listeners_change(self, callback: EmptyCallback) -> None:
+        self._listeners_change_callbacks.append(callback)
+
+    def wait_for(self, predicate: Callable[[StateValue], bool], timeout: float | None = None) -> bool:
+        # the predicate only gets values, a state is None until the first report set it
+        event: Final[Event] = Event()
+
+        def on_change(value: StateValue) -> None:
+            if value is not None and predicate(value):
+                event.set()
+
+        self.on_change(on_change)
+        try:
+            deadline: float | None = None if timeout is None else time.perf_counter() + timeout
+            # reading a read state may calculate its value
+            if self.value_raw is None and not self._has_value.wait(timeout):
+                return False
+            if self.value_raw is not None and predicate(self.value):
+                return True
+            return event.wait(None if deadline is None else max(0.0, deadline - time.perf_counter()))
+        finally:
+            self.remove_change_listener(on_change)
 
     # ################# GETTERS AND SETTERS ###############
 
@@ -169,6 +185,8 @@ class State(Generic[StateValue]):
                 changed=False,
                 trigger_change=False,
             )
+            if new_value is not None:
+                self._has_value.set()
             return
         changed, new_value = self._compare_fn(old_value, new_value)
         self._change_value(
@@ -177,6 +195,8 @@ class State(Generic[StateValue]):
             changed=changed,
             trigger_change=(changed if trigger_change_on_changed else False),
         )
+        if old_value is None and new_value is not None:
+            self._has_value.set()
 
     def _change_value(
             self,
@@ -185,12 +205,24 @@ class State(Generic[StateValue]):
             changed: bool,
             trigger_change: bool = True,
     ) -> None:
-        self._last_value_raw = old_value
-        self._value_raw = new_value
-        self._change_timestamp = time.perf_counter_ns()
-        self._changed_since_last_set_value = changed
+        self._record = StateRecord(new_value, old_value, time.perf_counter_ns(), changed)
         if not self._disable_change_detection and trigger_change:
             self._trigger_change()
 
     def _trigger_change(self):
-        self._callback_manager.emit_change(self.last_value, self.value, self._change_timestamp)
+        had_once_listeners: bool = self._callback_manager.has_once_listeners
+        record: StateRecord[StateValue] = self._record
+        raw_to_mapped_fn: MapFn = self._raw_to_mapped_fn
+        if callable(raw_to_mapped_fn):
+            self._callback_manager.emit_change(
+                raw_to_mapped_fn(record.last_value), raw_to_mapped_fn(record.value), record.change_timestamp
+            )
+        else:
+            self._callback_manager.emit_change(record.last_value, record.value, record.change_timestamp)
+        if had_once_listeners:
+            # once listeners have been removed while emitting
+            self._listeners_changed()
+
+    def _listeners_changed(self) -> None:
+        for callback in self._listeners_change_callbacks:
+            callback()
@@ -0,0 +1,10 @@
+from typing import Generic, NamedTuple
+
+from dualsense_controller.core.state.typedef import StateValue
+
+
+class StateRecord(NamedTuple, Generic[StateValue]):
+    value: StateValue | None
+    last_value: StateValue | None
+    change_timestamp: int
+    changed: bool
@@ -1,68 +1,171 @@
 import inspect
+import time
+from threading import Lock
 from typing import Final, Generic
 
-import pyee
-
+from dualsense_controller.core.state.CallbackDispatcher import CallbackDispatcher
+from dualsense_controller.core.state.CallbackProfiler import CallbackProfiler
 from dualsense_controller.core.state.typedef import StateChangeCallback, StateName, StateValue
 
+# one tuple of callbacks per number of callback args 0-4
+_CallbackEntries = tuple[
+    tuple[StateChangeCallback, ...],
+    tuple[StateChangeCallback, ...],
+    tuple[StateChangeCallback, ...],
+    tuple[StateChangeCallback, ...],
+    tuple[StateChangeCallback, ...],
+]
+_NO_CALLBACKS: Final[_CallbackEntries] = ((), (), (), (), ())
+
 
 class StateValueCallbackManager(Generic[StateValue]):
 
     @property
     def has_listeners(self) -> bool:
-        return len(self._event_emitter.event_names()) > 0
+        return self._num_listeners > 0
+
+    @property
+    def has_once_listeners(self) -> bool:
+        return self._num_once_listeners > 0
 
     def __init__(self, name: StateName):
         self._name: Final[StateName] = name
-        self._event_emitter: Final[pyee.EventEmitter] = pyee.EventEmitter()
+        # registration and removal replace the entries, emitting only reads them
+        self._lock: Final[Lock] = Lock()
+        self._callbacks: _CallbackEntries = _NO_CALLBACKS
+        # kept apart, so emitting takes all of them in one step
+        self._once_callbacks: _CallbackEntries = _NO_CALLBACKS
+        self._num_listeners: int = 0
+        self._num_once_listeners: int = 0
+        # opt in, times every callback when set
+        self._profiler: CallbackProfiler | None = None
+        # opt in, callbacks run on the dispatcher instead of the emitting thread
+        self._dispatcher: CallbackDispatcher | None = None
 
-        self._event_name_0_args: Final[str] = f'{name}_0'
-        self._event_name_1_args: Final[str] = f'{name}_1'
-        self._event_name_2_args: Final[str] = f'{name}_2'
-        self._event_name_3_args: Final[str] = f'{name}_3'
-        self._event_name_4_args: Final[str] = f'{name}_4'
+    def set_profiler(self, profiler: CallbackProfiler | None) -> None:
+        self._profiler = profiler
+
+    def set_dispatcher(self, dispatcher: CallbackDispatcher | None) -> None:
+        self._dispatcher = dispatcher
 
     def on_change(self, callback: StateChangeCallback) -> None:
-        self._event_emitter.on(self._get_event_name_by_callable(callback), callback)
+        self._add_listener(callback, once=False)
 
     def once_change(self, callback: StateChangeCallback) -> None:
-        self._event_emitter.once(self._get_event_name_by_callable(callback), callback)
+        self._add_listener(callback, once=True)
 
     def remove_change_listener(self, callback: StateChangeCallback | None = None) -> None:
         if callback is None:
             self.remove_all_change_listeners()
-        else:
-            self._event_emitter.remove_listener(
-                self._get_event_name_by_callable(callback),
-                callback
-            )
+            return
+        num_args: int = self._get_num_args(callback)
+        with self._lock:
+            if self._remove_entry(num_args, callback, once=False):
+                self._num_listeners -= 1
+            elif self._remove_entry(num_args, callback, once=True):
+                self._num_listeners -= 1
+                self._num_once_listeners -= 1
 
     def remove_all_change_listeners(self) -> None:
-        self._event_emitter.remove_all_listeners()
+        with self._lock:
+            self._callbacks = _NO_CALLBACKS
+            self._once_callbacks = _NO_CALLBACKS
+            self._num_listeners = 0
+            self._num_once_listeners = 0
 
     def emit_change(self, old_value: StateValue, new_value: StateValue, timestamp: int):
-        if self._event_name_0_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_0_args)
-        if self._event_name_1_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_1_args, new_value)
-        if self._event_name_2_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_2_args, new_value, timestamp)
-        if self._event_name_3_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_3_args, old_value, new_value, timestamp)
-        if self._event_name_4_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_4_args, self._name, old_value, new_value, timestamp)
-
-    def _get_event_name_by_callable(self, callable_: StateChangeCallback) -> str:
+        if self._num_listeners == 0:
+            return
+        callbacks: _CallbackEntries = self._callbacks
+        once_callbacks: _CallbackEntries = _NO_CALLBACKS
+        if self._num_once_listeners > 0:
+            # like pyee, once listeners are removed before they get called. they are called after the others
+            with self._lock:
+                once_callbacks = self._once_callbacks
+                self._once_callbacks = _NO_CALLBACKS
+                self._num_listeners -= self._num_once_listeners
+                self._num_once_listeners = 0
+
+        if self._dispatcher is not None:
+            # keyed by this manager, so the callbacks of one state keep their order
+            self._dispatcher.dispatch(self, self._call, (callbacks, old_value, new_value, timestamp))
+            if once_callbacks is not _NO_CALLBACKS:
+                self._dispatcher.dispatch(self, self._call, (once_callbacks, old_value, new_value, timestamp))
+            return
+        self._call(callbacks, old_value, new_value, timestamp)
+        if once_callbacks is not _NO_CALLBACKS:
+            self._call(once_callbacks, old_value, new_value, timestamp)
+
+    def _call(self, callbacks: _CallbackEntries, old_value: StateValue, new_value: StateValue, timestamp: int) -> None:
+        if self._profiler is not None:
+            self._emit_profiled(callbacks, old_value, new_value, timestamp)
+            return
+
+        callbacks_0, callbacks_1, callbacks_2, callbacks_3, callbacks_4 = callbacks
+        for callback in callbacks_0:
+            callback()
+        for callback in callbacks_1:
+            callback(new_value)
+        for callback in callbacks_2:
+            callback(new_value, timestamp)
+        for callback in callbacks_3:
+            callback(old_value, new_value, timestamp)
+        for callback in callbacks_4:
+            callback(self._name, old_value, new_value, timestamp)
+
+    def _emit_profiled(
+            self, callbacks: _CallbackEntries, old_value: StateValue, new_value: StateValue, timestamp: int
+    ) -> None:
+        profiler: CallbackProfiler = self._profiler
+        args: tuple[tuple, ...] = (
+            (),
+            (new_value,),
+            (new_value, timestamp),
+            (old_value, new_value, timestamp),
+            (self._name, old_value, new_value, timestamp),
+        )
+        for num_args, entries in enumerate(callbacks):
+            for callback in entries:
+                start: int = time.perf_counter_ns()
+                callback(*args[num_args])
+                profiler.record(self._name, callback, time.perf_counter_ns() - start)
+
+    def _add_listener(self, callback: StateChangeCallback, once: bool) -> None:
+        num_args: int = self._get_num_args(callback)
+        with self._lock:
+            entries: tuple[StateChangeCallback, ...] = (self._once_callbacks if once else self._callbacks)[num_args]
+            # like pyee, a callback is registered only once. registering it again keeps it or moves it to the other
+            # kind of listeners
+            if callback in entries:
+                return
+            if self._remove_entry(num_args, callback, once=not once):
+                # moved, still the same number of listeners
+                self._num_once_listeners += 1 if once else -1
+            else:
+                self._num_listeners += 1
+                if once:
+                    self._num_once_listeners += 1
+            self._set_entries(num_args, entries + (callback,), once)
+
+    def _remove_entry(self, num_args: int, callback: StateChangeCallback, once: bool) -> bool:
+        entries: tuple[StateChangeCallback, ...] = (self._once_callbacks if once else self._callbacks)[num_args]
+        if callback not in entries:
+            return False
+        index: int = entries.index(callback)
+        self._set_entries(num_args, entries[:index] + entries[index + 1:], once)
+        return True
+
+    def _set_entries(self, num_args: int, entries: tuple[StateChangeCallback, ...], once: bool) -> None:
+        callbacks: list[tuple[StateChangeCallback, ...]] = list(self._once_callbacks if once else self._callbacks)
+        callbacks[num_args] = entries
+        if once:
+            self._once_callbacks = tuple(callbacks)  # type: ignore[assignment]
+        else:
+            self._callbacks = tuple(callbacks)  # type: ignore[assignment]
+
+    @staticmethod
+    def _get_num_args(callable_: StateChangeCallback) -> int:
         num_params: int = len(inspect.signature(callable_).parameters)
-        match num_params:
-            case 0:
-                return self._event_name_0_args
-            case 1:
-                return self._event_name_1_args
-            case 2:
-                return self._event_name_2_args
-            case 3:
-                return self._event_name_3_args
-            case 4:
-                return self._event_name_4_args
+        if 0 <= num_params <= 4:
+            return num_params
         raise Exception(f'invalid arg count {callable_}')
@@ -0,0 +1,93 @@
+from typing import Final, NamedTuple
+
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from dualsense_controller.core.state.read_state.value_type import Accelerometer, Battery, Gyroscope, JoyStick, \
+    Orientation, TouchFinger, TriggerFeedback
+from dualsense_controller.core.state.typedef import Number
+
+
+class ControllerSnapshot(NamedTuple):
+    # the mapped values of all read states after one report, states the report type does not contain are None.
+    # a named tuple, it is created with every report and a dataclass of this size is several times slower to create
+
+    # number of the report since the states were created, counted on the host
+    sequence: int
+    # sequence number the controller wrote into the report, wraps at 256
+    controller_sequence: int
+    # time.perf_counter_ns() when the report was processed
+    host_timestamp: int
+    # timestamps the controller wrote into the report, wrap at 2**32
+    controller_timestamp: int
+    sensor_timestamp: int
+
+    dpad: int
+    btn_up: bool
+    btn_left: bool
+    btn_down: bool
+    btn_right: bool
+    btn_square: bool
+    btn_cross: bool
+    btn_circle: bool
+    btn_triangle: bool
+    btn_l1: bool
+    btn_r1: bool
+    btn_l2: bool
+    btn_r2: bool
+    btn_create: bool
+    btn_options: bool
+    btn_l3: bool
+    btn_r3: bool
+    btn_ps: bool
+    btn_touchpad: bool
+    btn_mute: bool
+
+    left_stick: JoyStick
+    left_stick_x: Number
+    left_stick_y: Number
+    right_stick: JoyStick
+    right_stick_x: Number
+    right_stick_y: Number
+
+    gyroscope: Gyroscope
+    gyroscope_x: int
+    gyroscope_y: int
+    gyroscope_z: int
+    accelerometer: Accelerometer
+    accelerometer_x: int
+    accelerometer_y: int
+    accelerometer_z: int
+    orientation: Orientation
+
+    touch_finger_1: TouchFinger
+    touch_finger_1_active: bool
+    touch_finger_1_id: int
+    touch_finger_1_x: int
+    touch_finger_1_y: int
+    touch_finger_2: TouchFinger
+    touch_finger_2_active: bool
+    touch_finger_2_id: int
+    touch_finger_2_x: int
+    touch_finger_2_y: int
+
+    left_trigger_value: Number
+    left_trigger_feedback: TriggerFeedback
+    left_trigger_feedback_active: bool
+    left_trigger_feedback_value: int
+    right_trigger_value: Number
+    right_trigger_feedback: TriggerFeedback
+    right_trigger_feedback_active: bool
+    right_trigger_feedback_value: int
+
+    battery: Battery
+    battery_level_percent: float
+    battery_full: bool
+    battery_charging: bool
+
+
+_REPORT_FIELDS: Final[tuple[str, ...]] = (
+    'sequence', 'controller_sequence', 'host_timestamp', 'controller_timestamp', 'sensor_timestamp'
+)
+# read states in the order of the fields following the report fields
+SNAPSHOT_STATE_NAMES: Final[tuple[ReadStateName, ...]] = tuple(
+    ReadStateName(name.upper()) for name in ControllerSnapshot._fields if name not in _REPORT_FIELDS
+)
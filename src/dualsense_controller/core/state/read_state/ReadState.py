@@ -12,6 +12,22 @@ from dualsense_controller.core.state.typedef import CompareFn, StateValue, State
 
 class ReadState(State[StateValue], Generic[StateValue]):
 
+    @property
+    def depends_on(self) -> tuple[ReadState[Any], ...]:
+        return self._depends_on
+
+    @property
+    def is_dependency_of(self) -> tuple[ReadState[Any], ...]:
+        return self._is_dependency_of
+
+    @property
+    def enforce_update(self) -> bool:
+        return self._enforce_update
+
+    @property
+    def can_update_itself(self) -> bool:
+        return self._can_update_itself
+
     @property
     def has_changed_dependencies(self) -> bool:
         return any(state.has_changed_since_last_set_value for state in self._depends_on)
@@ -94,10 +110,10 @@ class ReadState(State[StateValue], Generic[StateValue]):
         # CONST
         self._depends_on: tuple[ReadState[Any], ...] = depends_on if depends_on is not None else tuple()
         self._is_dependency_of: tuple[ReadState[Any], ...] = is_dependency_of if is_dependency_of is not None else tuple()
-        self._enforce_update: Final[bool] = enforce_update
+        self._enforce_update: bool = enforce_update
         self._value_calc_fn: Final[StateValueFn[Any, StateValue]] = value_calc_fn
         self._in_report_lockable: Final[Lockable[InReport]] = in_report_lockable
-        self._can_update_itself: Final[bool] = can_update_itself
+        self._can_update_itself: bool = can_update_itself
 
         # VAR
         self._cycle_timestamp: int = 0
@@ -109,17 +125,21 @@ class ReadState(State[StateValue], Generic[StateValue]):
             is_dependency_of_state.add_depends_on(self)
 
     def calc_value(self, trigger_change_on_changed: bool = True) -> StateValue | None:
-        value = self._in_report_lockable.value
-        if value is None:
+        in_report: InReport | None = self._in_report_lockable.value
+        if in_report is None:
             return None
 
         value_raw: StateValue | None = self._value_calc_fn(
-            value,
+            in_report.snapshot,
             *self._depends_on
         )
         self._set_value_raw(value_raw, trigger_change_on_changed)
         return self._value_raw
 
+    def set_update_level(self, enforce_update: bool, can_update_itself: bool) -> None:
+        self._enforce_update = enforce_update
+        self._can_update_itself = can_update_itself
+
     def set_cycle_timestamp(self, timestamp: int):
         self._cycle_timestamp = timestamp
 
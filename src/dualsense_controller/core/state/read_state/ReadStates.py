@@ -1,3 +1,4 @@
+import threading
 import time
 from typing import Any, Final, Callable
 
@@ -6,10 +7,13 @@ import pyee
 from dualsense_controller.core.core.Lockable import Lockable
 from dualsense_controller.core.enum import ConnectionType
 from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.InReportSnapshot import InReportSnapshot
 from dualsense_controller.core.state.BaseStates import BaseStates
 from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.read_state.ControllerSnapshot import ControllerSnapshot, SNAPSHOT_STATE_NAMES
 from dualsense_controller.core.state.read_state.ReadState import ReadState
-from dualsense_controller.core.state.typedef import StateValue
+from dualsense_controller.core.state.read_state.UpdatePlan import UpdatePlan
+from dualsense_controller.core.state.read_state.enum import ReadStateName
 from dualsense_controller.core.state.read_state.more_read_states import (
     LeftJoystickReadState,
     LeftJoystickXReadState,
@@ -70,9 +74,52 @@ from dualsense_controller.core.state.read_state.more_read_states import (
     BatteryReadState
 )
 
+# index of the first state value in a ControllerSnapshot
+_SNAPSHOT_STATES_START: Final[int] = len(ControllerSnapshot._fields) - len(SNAPSHOT_STATE_NAMES)
+
 
 class ReadStates(BaseStates):
     _EVENT_UPDATE: Final[str] = '_EVENT_UPDATE'
+    # in report keys a state is calculated from. states not listed here are only calculated from their dependencies
+    _SOURCE_KEYS: Final[dict[ReadStateName, tuple[str, ...]]] = {
+        ReadStateName.LEFT_STICK: ('axes_0', 'axes_1'),
+        ReadStateName.RIGHT_STICK: ('axes_2', 'axes_3'),
+        ReadStateName.LEFT_TRIGGER_VALUE: ('axes_4',),
+        ReadStateName.RIGHT_TRIGGER_VALUE: ('axes_5',),
+        ReadStateName.DPAD: ('buttons_0',),
+        ReadStateName.BTN_CROSS: ('buttons_0',),
+        ReadStateName.BTN_SQUARE: ('buttons_0',),
+        ReadStateName.BTN_CIRCLE: ('buttons_0',),
+        ReadStateName.BTN_TRIANGLE: ('buttons_0',),
+        ReadStateName.BTN_L1: ('buttons_1',),
+        ReadStateName.BTN_R1: ('buttons_1',),
+        ReadStateName.BTN_L2: ('buttons_1',),
+        ReadStateName.BTN_R2: ('buttons_1',),
+        ReadStateName.BTN_CREATE: ('buttons_1',),
+        ReadStateName.BTN_OPTIONS: ('buttons_1',),
+        ReadStateName.BTN_L3: ('buttons_1',),
+        ReadStateName.BTN_R3: ('buttons_1',),
+        ReadStateName.BTN_PS: ('buttons_2',),
+        ReadStateName.BTN_MUTE: ('buttons_2',),
+        ReadStateName.BTN_TOUCHPAD: ('buttons_2',),
+        ReadStateName.GYROSCOPE: ('gyro_x_0', 'gyro_x_1', 'gyro_y_0', 'gyro_y_1', 'gyro_z_0', 'gyro_z_1'),
+        ReadStateName.ACCELEROMETER: ('accel_x_0', 'accel_x_1', 'accel_y_0', 'accel_y_1', 'accel_z_0', 'accel_z_1'),
+        ReadStateName.TOUCH_FINGER_1_ACTIVE: ('touch_1_0',),
+        ReadStateName.TOUCH_FINGER_1_ID: ('touch_1_0',),
+        ReadStateName.TOUCH_FINGER_1_X: ('touch_1_1', 'touch_1_2'),
+        ReadStateName.TOUCH_FINGER_1_Y: ('touch_1_2', 'touch_1_3'),
+        ReadStateName.TOUCH_FINGER_2_ACTIVE: ('touch_2_0',),
+        ReadStateName.TOUCH_FINGER_2_ID: ('touch_2_0',),
+        ReadStateName.TOUCH_FINGER_2_X: ('touch_2_1', 'touch_2_2'),
+        ReadStateName.TOUCH_FINGER_2_Y: ('touch_2_2', 'touch_2_3'),
+        ReadStateName.LEFT_TRIGGER_FEEDBACK_ACTIVE: ('left_trigger_feedback',),
+        ReadStateName.LEFT_TRIGGER_FEEDBACK_VALUE: ('left_trigger_feedback',),
+        ReadStateName.RIGHT_TRIGGER_FEEDBACK_ACTIVE: ('right_trigger_feedback',),
+        ReadStateName.RIGHT_TRIGGER_FEEDBACK_VALUE: ('right_trigger_feedback',),
+        ReadStateName.BATTERY_LEVEL_PERCENT: ('battery_0',),
+        ReadStateName.BATTERY_FULL: ('battery_0',),
+        ReadStateName.BATTERY_CHARGING: ('battery_1',),
+    }
 
     def __init__(
             self,
@@ -87,6 +134,28 @@ class ReadStates(BaseStates):
         # VAR
         self._timestamp: int = time.perf_counter_ns()
         self._update_emitter: Final[pyee.EventEmitter] = pyee.EventEmitter()
+        self._update_condition: Final[threading.Condition] = threading.Condition()
+        self._update_count: int = 0
+        self._source_masks: list[tuple[ReadState[Any], int]] = []
+        self._source_masks_report_type: type[InReport] | None = None
+        self._update_plan: UpdatePlan | None = None
+        # listeners may change on another thread while a plan is created, a plan of an older generation is stale
+        self._update_plan_generation: int = 0
+        self._planned_generation: int = -1
+        self._last_raw_int: int | None = None
+        # dirty bits states not in the update plan may have missed, applied once the plan is recreated
+        self._unplanned_dirty: int = 0
+        # ns spent in the callbacks of the last update, only measured on demand
+        self._measure_callbacks: bool = False
+        self._callback_duration: int = 0
+        self._changed_states: list[ReadState[Any]] = []
+        # snapshots are only created once asked for
+        self._snapshots_enabled: bool = False
+        self._snapshot: ControllerSnapshot | None = None
+        self._snapshot_states: tuple[ReadState[Any], ...] = ()
+        self._snapshot_indexes: dict[ReadState[Any], int] = {}
+        # report fields followed by the state values of the last snapshot, only calculated states are read again
+        self._snapshot_values: list[Any] = []
 
         # INIT STICKS
         self.left_stick: Final[LeftJoystickReadState] = LeftJoystickReadState(
@@ -499,22 +568,132 @@ class ReadStates(BaseStates):
         self._register_state(self.battery_charging)
         self._register_state(self.battery)
 
+        # dependencies before their dependents
+        self._update_order: Final[tuple[ReadState[Any], ...]] = (
+            self.left_stick, self.left_stick_x, self.left_stick_y,
+            self.right_stick, self.right_stick_x, self.right_stick_y,
+            self.left_trigger_value, self.right_trigger_value,
+            self.dpad, self.btn_up, self.btn_down, self.btn_left, self.btn_right,
+            self.btn_cross, self.btn_r1, self.btn_square, self.btn_circle, self.btn_triangle, self.btn_l1,
+            self.btn_l2, self.btn_r2, self.btn_create, self.btn_options, self.btn_l3, self.btn_r3, self.btn_ps,
+            self.btn_mute, self.btn_touchpad,
+            self.gyroscope, self.gyroscope_x, self.gyroscope_y, self.gyroscope_z,
+            self.accelerometer, self.accelerometer_x, self.accelerometer_y, self.accelerometer_z,
+            self.orientation,
+            self.touch_finger_1_active, self.touch_finger_1_id, self.touch_finger_1_x, self.touch_finger_1_y,
+            self.touch_finger_1,
+            self.touch_finger_2_active, self.touch_finger_2_id, self.touch_finger_2_x, self.touch_finger_2_y,
+            self.touch_finger_2,
+            self.left_trigger_feedback_active, self.left_trigger_feedback_value, self.left_trigger_feedback,
+            self.right_trigger_feedback_active, self.right_trigger_feedback_value, self.right_trigger_feedback,
+            self.battery_level_percentage, self.battery_full, self.battery_charging, self.battery,
+        )
+        for state in self._update_order:
+            state.on_listeners_change(self._invalidate_update_plan)
+
+    @property
+    def in_report(self) -> InReport | None:
+        return self._in_report_lockable.value
+
+    @property
+    def timestamp(self) -> int:
+        # time.perf_counter_ns() of the last update
+        return self._timestamp
+
+    @property
+    def snapshot(self) -> ControllerSnapshot | None:
+        # of the last update, None while snapshots are disabled and until the next report arrived after enabling
+        return self._snapshot if self._snapshots_enabled else None
+
+    @property
+    def snapshots_enabled(self) -> bool:
+        return self._snapshots_enabled
+
+    @property
+    def callback_duration(self) -> int:
+        return self._callback_duration
+
+    @property
+    def measure_callbacks(self) -> bool:
+        return self._measure_callbacks
+
+    @measure_callbacks.setter
+    def measure_callbacks(self, measure_callbacks: bool) -> None:
+        self._measure_callbacks = measure_callbacks
+
     # #################### PRIVATE #######################
 
-    def _handle_state(
-            self,
-            state: ReadState[StateValue],
-    ) -> None:
-        state.set_cycle_timestamp(self._timestamp)
-        if state.is_updatable_from_outside:
-            state.calc_value(trigger_change_on_changed=False)
-            self._states_to_trigger_after_all_states_set.append(state)
+    def _invalidate_update_plan(self) -> None:
+        self._update_plan_generation += 1
+        self._update_plan = None
+
+    def _create_update_plan(self) -> UpdatePlan:
+        # a state is planned if it is enforced, listened or needed by a planned dependent, all with snapshots enabled
+        with_snapshot: bool = self._snapshots_enabled
+        planned: set[ReadState[Any]] = set()
+        for state, _ in reversed(self._source_masks):
+            if (
+                    with_snapshot
+                    or state.enforce_update
+                    or state.has_listeners
+                    or any(dependent in planned for dependent in state.is_dependency_of)
+            ):
+                planned.add(state)
+
+        steps: list[tuple[ReadState[Any], int, bool]] = []
+        lazy_steps: list[tuple[ReadState[Any], int]] = []
+        for state, mask in self._source_masks:
+            if state in planned:
+                steps.append((state, mask, False))
+            elif any(depends_on_state in planned for depends_on_state in state.depends_on):
+                steps.append((state, mask, True))
+            elif state.can_update_itself:
+                lazy_steps.append((state, mask))
+        return UpdatePlan(steps=tuple(steps), lazy_steps=tuple(lazy_steps), with_snapshot=with_snapshot)
+
+    def _create_snapshot(self, in_report: InReport, timestamp: int, read_all: bool) -> ControllerSnapshot:
+        values: list[Any] = self._snapshot_values
+        if read_all:
+            for index, state in enumerate(self._snapshot_states, _SNAPSHOT_STATES_START):
+                values[index] = state.value
+        else:
+            indexes: dict[ReadState[Any], int] = self._snapshot_indexes
+            for state in self._states_to_trigger_after_all_states_set:
+                index: int | None = indexes.get(state)
+                if index is not None:
+                    values[index] = state.value
+        in_report_snapshot: InReportSnapshot = in_report.snapshot
+        values[0] = self._update_count + 1
+        values[1] = in_report_snapshot.seq_num
+        values[2] = timestamp
+        values[3] = in_report_snapshot.timestamp
+        values[4] = in_report_snapshot.sensor_timestamp
+        return tuple.__new__(ControllerSnapshot, values)
 
     def _post_update(self):
+        start: int = time.perf_counter_ns() if self._measure_callbacks else 0
         self._update_emitter.emit(self._EVENT_UPDATE)
         for state in self._states_to_trigger_after_all_states_set:
             state.trigger_change_if_changed()
+        if self._measure_callbacks:
+            self._callback_duration = time.perf_counter_ns() - start
+        self._changed_states = [
+            state for state in self._states_to_trigger_after_all_states_set if state.has_changed_since_last_set_value
+        ]
         self._states_to_trigger_after_all_states_set.clear()
+        with self._update_condition:
+            self._update_count += 1
+            self._update_condition.notify_all()
+
+    def _create_source_masks(self, in_report: InReport) -> list[tuple[ReadState[Any], int]]:
+        masks: dict[ReadState[Any], int] = {}
+        for state in self._update_order:
+            mask: int = in_report.get_byte_mask(self._SOURCE_KEYS.get(state.name, ()))
+            for depends_on_state in state.depends_on:
+                mask |= masks[depends_on_state]
+            masks[state] = mask
+        # states without any source in this report type are never calculated
+        return [(state, mask) for state, mask in masks.items() if mask != 0]
 
     # #################### PUBLIC #######################
 
@@ -524,6 +703,42 @@ class ReadStates(BaseStates):
     def once_updated(self, callback: Callable[[], None]) -> None:
         self._update_emitter.once(self._EVENT_UPDATE, callback) # type: ignore
 
+    def remove_updated_listener(self, callback: Callable[[], None]) -> None:
+        self._update_emitter.remove_listener(self._EVENT_UPDATE, callback)
+
+    def set_update_level(self, enforce_update: bool, can_update_itself: bool) -> None:
+        for state in self._update_order:
+            state.set_update_level(enforce_update, can_update_itself)
+        self._invalidate_update_plan()
+
+    def enable_snapshots(self) -> None:
+        # from now on every state is calculated with every report, to create a snapshot of all of them
+        if self._snapshots_enabled:
+            return
+        # kept when disabled, an update running meanwhile may still create a snapshot with the previous plan
+        if not self._snapshot_states:
+            self._snapshot_states = tuple(self._get_state_by_name(name) for name in SNAPSHOT_STATE_NAMES)
+            self._snapshot_indexes = {
+                state: index for index, state in enumerate(self._snapshot_states, _SNAPSHOT_STATES_START)
+            }
+            self._snapshot_values = [None] * len(ControllerSnapshot._fields)
+        self._snapshot = None
+        self._snapshots_enabled = True
+        self._invalidate_update_plan()
+
+    def disable_snapshots(self) -> None:
+        # back to the plan of the update level, states are only calculated when enforced or listened to
+        if not self._snapshots_enabled:
+            return
+        self._snapshots_enabled = False
+        self._snapshot = None
+        self._invalidate_update_plan()
+
+    def wait_until_updated(self, timeout: float | None = None) -> bool:
+        with self._update_condition:
+            update_count: int = self._update_count
+            return self._update_condition.wait_for(lambda: self._update_count != update_count, timeout)
+
     def update(self, in_report: InReport, connection_type: ConnectionType) -> None:
 
         now_timestamp: int = time.perf_counter_ns()
@@ -531,90 +746,45 @@ class ReadStates(BaseStates):
         self._timestamp = now_timestamp
         self._in_report_lockable.value = in_report
 
-        # #### ANALOG STICKS #####
-
-        self._handle_state(self.left_stick)
-        # use values from stick because deadzone_raw calc is done there
-        self._handle_state(self.left_stick_x)
-        self._handle_state(self.left_stick_y)
-
-        self._handle_state(self.right_stick)
-        # use values from stick because deadzone_raw calc is done there
-        self._handle_state(self.right_stick_x)
-        self._handle_state(self.right_stick_y)
-
-        # # ##### TRIGGERS #####
-        self._handle_state(self.left_trigger_value)
-        self._handle_state(self.right_trigger_value)
-        #
-        # # ##### BUTTONS #####
-        self._handle_state(self.dpad)
-        self._handle_state(self.btn_up)
-        self._handle_state(self.btn_down)
-        self._handle_state(self.btn_left)
-        self._handle_state(self.btn_right)
-
-        self._handle_state(self.btn_cross)
-        self._handle_state(self.btn_r1)
-        self._handle_state(self.btn_square)
-        self._handle_state(self.btn_circle)
-        self._handle_state(self.btn_triangle)
-        self._handle_state(self.btn_l1)
-        self._handle_state(self.btn_l2)
-        self._handle_state(self.btn_r2)
-        self._handle_state(self.btn_create)
-        self._handle_state(self.btn_options)
-        self._handle_state(self.btn_l3)
-        self._handle_state(self.btn_r3)
-        self._handle_state(self.btn_ps)
-        self._handle_state(self.btn_mute)
-        self._handle_state(self.btn_touchpad)
-
-        # following not supported for BT01
-        if connection_type == ConnectionType.BT_01:
-            self._post_update()
-            return
+        if type(in_report) is not self._source_masks_report_type:
+            self._source_masks = self._create_source_masks(in_report)
+            self._source_masks_report_type = type(in_report)
+            self._update_plan = None
+            self._last_raw_int = None
+
+        # bitwise diff against the previous report, everything is dirty on the first one
+        raw_int: int = int.from_bytes(in_report.raw_bytes, 'little')
+        dirty: int = -1 if self._last_raw_int is None else raw_int ^ self._last_raw_int
+        self._last_raw_int = raw_int
+
+        update_plan: UpdatePlan | None = self._update_plan
+        generation: int = self._update_plan_generation
+        plan_created: bool = update_plan is None or self._planned_generation != generation
+        if plan_created:
+            update_plan = self._update_plan = self._create_update_plan()
+            self._planned_generation = generation
+            dirty |= self._unplanned_dirty
+            self._unplanned_dirty = 0
+        self._unplanned_dirty |= dirty
+
+        # states not calculated again in this cycle did not change compared to the previous report
+        for state in self._changed_states:
+            state.set_unchanged()
+
+        states_to_trigger: list[ReadState[Any]] = self._states_to_trigger_after_all_states_set
+        for state, mask, only_on_changed_dependencies in update_plan.steps:
+            if dirty & mask:
+                state.set_cycle_timestamp(now_timestamp)
+                if not only_on_changed_dependencies or state.has_changed_dependencies:
+                    state.calc_value(trigger_change_on_changed=False)
+                    states_to_trigger.append(state)
+        for state, mask in update_plan.lazy_steps:
+            if dirty & mask:
+                state.set_cycle_timestamp(now_timestamp)
+
+        # before the callbacks, so they get the snapshot of this report. with a new plan states not calculated in
+        # this update may not have been calculated before either, otherwise they did not change since the last one
+        if update_plan.with_snapshot:
+            self._snapshot = self._create_snapshot(in_report, now_timestamp, read_all=plan_created)
 
-        # ##### GYRO #####
-
-        self._handle_state(self.gyroscope)
-        self._handle_state(self.gyroscope_x)
-        self._handle_state(self.gyroscope_y)
-        self._handle_state(self.gyroscope_z)
-        #
-        # ##### ACCEL #####
-        self._handle_state(self.accelerometer)
-        self._handle_state(self.accelerometer_x)
-        self._handle_state(self.accelerometer_y)
-        self._handle_state(self.accelerometer_z)
-        #
-        # ##### ORIENTATION #####
-        self._handle_state(self.orientation)
-        #
-        # ##### TOUCH 1 #####
-        self._handle_state(self.touch_finger_1_active)
-        self._handle_state(self.touch_finger_1_id)
-        self._handle_state(self.touch_finger_1_x)
-        self._handle_state(self.touch_finger_1_y)
-        self._handle_state(self.touch_finger_1)
-
-        # ##### TOUCH 2 #####
-        self._handle_state(self.touch_finger_2_active)
-        self._handle_state(self.touch_finger_2_id)
-        self._handle_state(self.touch_finger_2_x)
-        self._handle_state(self.touch_finger_2_y)
-        self._handle_state(self.touch_finger_2)
-
-        # ##### TRIGGER FEEDBACK INFO #####
-        self._handle_state(self.left_trigger_feedback_active)
-        self._handle_state(self.left_trigger_feedback_value)
-        self._handle_state(self.left_trigger_feedback)
-        self._handle_state(self.right_trigger_feedback_active)
-        self._handle_state(self.right_trigger_feedback_value)
-        self._handle_state(self.right_trigger_feedback)
-        # ##### BATTERY #####
-        self._handle_state(self.battery_level_percentage)
-        self._handle_state(self.battery_full)
-        self._handle_state(self.battery_charging)
-        self._handle_state(self.battery)
         self._post_update()
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from dualsense_controller.core.state.read_state.ReadState import ReadState
+
+
+@dataclass(frozen=True, slots=True)
+class UpdatePlan:
+    # (state, source byte mask, only calculate if a dependency changed), dependencies before dependents
+    steps: tuple[tuple[ReadState[Any], int, bool], ...]
+    # not planned but self updatable states, only their cycle timestamp is set
+    lazy_steps: tuple[tuple[ReadState[Any], int], ...]
+    # all states are planned, a snapshot is created after every update
+    with_snapshot: bool = False
@@ -432,7 +432,7 @@ class ButtonR1ReadState(ReadState[bool]):
     def __init__(self, in_report_lockable: Lockable[InReport], enforce_update: bool = ENFORCE_UPDATE_DEFAULT, can_update_itself: bool = CAN_UPDATE_ITSELF_DEFAULT):
         super().__init__(
             name=ReadStateName.BTN_R1,
-            value_calc_fn=ValueCalc.get_btn_l1,
+            value_calc_fn=ValueCalc.get_btn_r1,
             in_report_lockable=in_report_lockable,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself
@@ -454,7 +454,7 @@ class ButtonR2ReadState(ReadState[bool]):
     def __init__(self, in_report_lockable: Lockable[InReport], enforce_update: bool = ENFORCE_UPDATE_DEFAULT, can_update_itself: bool = CAN_UPDATE_ITSELF_DEFAULT):
         super().__init__(
             name=ReadStateName.BTN_R2,
-            value_calc_fn=ValueCalc.get_btn_l2,
+            value_calc_fn=ValueCalc.get_btn_r2,
             in_report_lockable=in_report_lockable,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself
@@ -476,7 +476,7 @@ class ButtonR3ReadState(ReadState[bool]):
     def __init__(self, in_report_lockable: Lockable[InReport], enforce_update: bool = ENFORCE_UPDATE_DEFAULT, can_update_itself: bool = CAN_UPDATE_ITSELF_DEFAULT):
         super().__init__(
             name=ReadStateName.BTN_R3,
-            value_calc_fn=ValueCalc.get_btn_l3,
+            value_calc_fn=ValueCalc.get_btn_r3,
             in_report_lockable=in_report_lockable,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Callable, TypeVar, TypeAlias, Unpack, TypeVarTuple
 
-from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.InReportSnapshot import InReportSnapshot
 from dualsense_controller.core.state.enum import MixedStateName
 from dualsense_controller.core.state.read_state.enum import ReadStateName
 from dualsense_controller.core.state.write_state.enum import WriteStateName
@@ -26,7 +26,7 @@ _CompareFn: TypeAlias = Callable[[StateValue, StateValue], CompareResult[StateVa
 Ts = TypeVarTuple("Ts")
 WrappedCompareFn: TypeAlias = Callable[[StateValue, StateValue, *Ts], CompareResult[StateValue]]
 CompareFn: TypeAlias = _WrappedCompareFn[StateValue] | _CompareFn[StateValue]
-StateValueFn: TypeAlias = Callable[[InReport, Unpack[AdditionalArgs]], StateValue]
+StateValueFn: TypeAlias = Callable[[InReportSnapshot, Unpack[AdditionalArgs]], StateValue]
 
 def default_compare_fn(before: StateValue, after: StateValue) -> CompareResult[StateValue]:
     return (True, after) if before != after else (False, after)
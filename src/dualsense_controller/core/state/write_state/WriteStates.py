@@ -1,3 +1,5 @@
+import threading
+import time
 from typing import Final
 
 from dualsense_controller.core.log import Log
@@ -7,12 +9,14 @@ from dualsense_controller.core.state.State import State
 from dualsense_controller.core.state.ValueCompare import ValueCompare
 from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
 from dualsense_controller.core.state.mapping.typedef import MapFn, empty_map_fn
-from dualsense_controller.core.state.typedef import CompareFn, StateChangeCallback, StateValue, default_compare_fn
+from dualsense_controller.core.state.typedef import CompareFn, StateChangeCallback, StateName, StateValue, \
+    default_compare_fn
 from dualsense_controller.core.state.write_state.enum import TriggerEffectMode, WriteStateName, LightbarPulseOptions, \
     PlayerLedsEnable, \
-    FlagsPhysics, FlagsControls, LedOptions
+    FlagsPhysics, FlagsControls, LedOptions, WritePriority
 from dualsense_controller.core.state.write_state.value_type import Lightbar, Microphone, PlayerLeds, \
     TriggerEffect
+from dualsense_controller.core.typedef import EmptyCallback
 
 
 class WriteStates(BaseStates):
@@ -24,16 +28,25 @@ class WriteStates(BaseStates):
         super().__init__(state_value_mapper)
 
         self._has_changed: bool = False
+        # highest priority of the changes since the last write and the time of the first of them
+        self._changed_priority: WritePriority | None = None
+        self._changed_timestamp: int = 0
+        # changes are marked by the setting thread and taken by the writing one, possibly the write thread
+        self._changed_lock: Final[threading.Lock] = threading.Lock()
+        self._priorities: Final[dict[StateName, WritePriority]] = {}
+        self._changed_callbacks: list[EmptyCallback] = []
 
         # ################## MOTORS/RUMBLE
         self.left_motor: Final[State[int]] = self._create_and_register_state(
             WriteStateName.MOTOR_LEFT,
+            priority=WritePriority.CRITICAL,
             value=0x00,
             mapped_to_raw_fn=self._state_value_mapper.set_left_motor_mapped_to_raw,
             raw_to_mapped_fn=self._state_value_mapper.set_left_motor_raw_to_mapped,
         )
         self.right_motor: Final[State[int]] = self._create_and_register_state(
             WriteStateName.MOTOR_RIGHT,
+            priority=WritePriority.CRITICAL,
             value=0x00,
             mapped_to_raw_fn=self._state_value_mapper.set_right_motor_mapped_to_raw,
             raw_to_mapped_fn=self._state_value_mapper.set_right_motor_raw_to_mapped,
@@ -42,50 +55,60 @@ class WriteStates(BaseStates):
         # ################## LIGHTBAR
         self.lightbar: Final[State[Lightbar]] = self._create_and_register_state(
             WriteStateName.LIGHTBAR,
+            priority=WritePriority.COSMETIC,
             value=Lightbar(0, 0, 0),
             compare_fn=ValueCompare.compare_lightbar,
             on_state_change_cb=self._on_lightbar_changed,
         )
         self.lightbar_red: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LIGHTBAR_RED,
+            priority=WritePriority.COSMETIC,
             value=self.lightbar.value.red
         )
         self.lightbar_green: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LIGHTBAR_GREEN,
+            priority=WritePriority.COSMETIC,
             value=self.lightbar.value.green
         )
         self.lightbar_blue: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LIGHTBAR_BLUE,
+            priority=WritePriority.COSMETIC,
             value=self.lightbar.value.blue
         )
         self.lightbar_on_off: Final[State[bool]] = self._create_and_register_state(
             WriteStateName.LIGHTBAR_ON_OFF,
+            priority=WritePriority.COSMETIC,
             value=self.lightbar.value.is_on
         )
         self.lightbar_pulse_options: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LIGHTBAR_PULSE_OPTIONS,
+            priority=WritePriority.COSMETIC,
             value=LightbarPulseOptions.OFF
         )
 
         # ################## PLAYER LEDS
         self.player_leds: Final[State[PlayerLeds]] = self._create_and_register_state(
             name=WriteStateName.PLAYER_LEDS,
+            priority=WritePriority.COSMETIC,
             compare_fn=ValueCompare.compare_player_leds,
             on_state_change_cb=self._on_player_leds_changed,
             value=PlayerLeds(),
         )
         self.player_leds_enable: Final[State[PlayerLedsEnable]] = self._create_and_register_state(
             name=WriteStateName.PLAYER_LEDS_ENABLE,
+            priority=WritePriority.COSMETIC,
             value=self.player_leds.value.enable,
         )
         self.player_leds_brightness: Final[State[int]] = self._create_and_register_state(
             WriteStateName.PLAYER_LEDS_BRIGHTNESS,
+            priority=WritePriority.COSMETIC,
             value=self.player_leds.value.brightness,
         )
 
         # ################## MICROPHONE
         self.microphone: Final[State[Microphone]] = self._create_and_register_state(
             name=WriteStateName.MICROPHONE,
+            priority=WritePriority.NORMAL,
             value=Microphone(),
             compare_fn=ValueCompare.compare_microphone,
             on_state_change_cb=self._on_microphone_changed,
@@ -93,11 +116,13 @@ class WriteStates(BaseStates):
         )
         self.microphone_mute: Final[State[bool]] = self._create_and_register_state(
             WriteStateName.MICROPHONE_MUTE,
+            priority=WritePriority.NORMAL,
             value=self.microphone.value.mute,
             ignore_none=False,
         )
         self.microphone_led: Final[State[bool]] = self._create_and_register_state(
             name=WriteStateName.MICROPHONE_LED,
+            priority=WritePriority.NORMAL,
             value=self.microphone.value.led,
             on_state_change_cb=self._on_microphone_led_changed,
             ignore_none=False,
@@ -106,96 +131,117 @@ class WriteStates(BaseStates):
         # ################## FLAGS
         self.flags_physics: Final[State[int]] = self._create_and_register_state(
             WriteStateName.FLAGS_PHYSICS,
+            priority=WritePriority.NORMAL,
             value=FlagsPhysics.ALL,
             disable_change_detection=True,
         )
         self.flags_controls: Final[State[int]] = self._create_and_register_state(
             WriteStateName.FLAGS_CONTROLS,
+            priority=WritePriority.NORMAL,
             value=FlagsControls.ALL_BUT_MUTE_LED,
             disable_change_detection=True,
         )
         self.led_options: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LED_OPTIONS,
+            priority=WritePriority.COSMETIC,
             value=LedOptions.ALL
         )
 
         # ################## LEFT TRIGGER
         self.left_trigger_effect: Final[State[TriggerEffect]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT,
+            priority=WritePriority.CRITICAL,
             value=TriggerEffect(),
             compare_fn=ValueCompare.compare_trigger_effect,
             on_state_change_cb=self._on_left_trigger_effect_changed,
         )
         self.left_trigger_effect_mode: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT_MODE,
+            priority=WritePriority.CRITICAL,
             value=TriggerEffectMode.NO_RESISTANCE
         )
         self.left_trigger_effect_param1: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT_PARAM1,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.left_trigger_effect_param2: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT_PARAM2,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.left_trigger_effect_param3: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT_PARAM3,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.left_trigger_effect_param4: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT_PARAM4,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.left_trigger_effect_param5: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT_PARAM5,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.left_trigger_effect_param6: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT_PARAM6,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.left_trigger_effect_param7: Final[State[int]] = self._create_and_register_state(
             WriteStateName.LEFT_TRIGGER_EFFECT_PARAM7,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
 
         # ################## RIGHT TRIGGER
         self.right_trigger_effect: Final[State[TriggerEffect]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT,
+            priority=WritePriority.CRITICAL,
             value=TriggerEffect(),
             compare_fn=ValueCompare.compare_trigger_effect,
             on_state_change_cb=self._on_right_trigger_effect_changed,
         )
         self.right_trigger_effect_mode: Final[State[int]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT_MODE,
+            priority=WritePriority.CRITICAL,
             value=TriggerEffectMode.NO_RESISTANCE
         )
         self.right_trigger_effect_param1: Final[State[int]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM1,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.right_trigger_effect_param2: Final[State[int]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM2,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.right_trigger_effect_param3: Final[State[int]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM3,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.right_trigger_effect_param4: Final[State[int]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM4,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.right_trigger_effect_param5: Final[State[int]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM5,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.right_trigger_effect_param6: Final[State[int]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM6,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
         self.right_trigger_effect_param7: Final[State[int]] = self._create_and_register_state(
             WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM7,
+            priority=WritePriority.CRITICAL,
             value=0x00
         )
 
@@ -203,6 +249,17 @@ class WriteStates(BaseStates):
     def has_changed(self) -> bool:
         return self._has_changed
 
+    @property
+    def changed_priority(self) -> WritePriority | None:
+        return self._changed_priority
+
+    @property
+    def changed_timestamp(self) -> int:
+        return self._changed_timestamp
+
+    def on_changed(self, callback: EmptyCallback) -> None:
+        self._changed_callbacks.append(callback)
+
     def set_value(self, name: WriteStateName, value: StateValue) -> None:
         state: State[StateValue] = self._get_state_by_name(name)
         state.value = value
@@ -212,10 +269,24 @@ class WriteStates(BaseStates):
         state.set_value_without_triggering_change(value)
 
     def set_unchanged(self):
+        self.take_changed()
+        self.reset_flags_controls()
+
+    def take_changed(self) -> int | None:
+        # call before the states are read into an out report, a change meanwhile marks them as changed again.
+        # the changed_timestamp of the taken change, None when nothing changed
+        with self._changed_lock:
+            if not self._has_changed:
+                return None
+            self._has_changed = False
+            self._changed_priority = None
+            return self._changed_timestamp
+
+    def reset_flags_controls(self) -> None:
+        # after an out report is written
         self._get_state_by_name(WriteStateName.FLAGS_CONTROLS).set_value_without_triggering_change(
             FlagsControls.ALL_BUT_MUTE_LED
         )
-        self._has_changed = False
 
     def update_out_report(self, out_report: OutReport):
         out_report.flags_physics = self.flags_physics.value_raw
@@ -238,41 +309,27 @@ class WriteStates(BaseStates):
         out_report.player_leds_enable = self.player_leds_enable.value_raw
         out_report.player_leds_brightness = self.player_leds_brightness.value_raw
 
-        out_report.left_trigger_effect_mode = self._get_state_by_name(WriteStateName.LEFT_TRIGGER_EFFECT_MODE).value_raw
-        out_report.left_trigger_effect_param1 = self._get_state_by_name(
-            WriteStateName.LEFT_TRIGGER_EFFECT_PARAM1).value_raw
-        out_report.left_trigger_effect_param2 = self._get_state_by_name(
-            WriteStateName.LEFT_TRIGGER_EFFECT_PARAM2).value_raw
-        out_report.left_trigger_effect_param3 = self._get_state_by_name(
-            WriteStateName.LEFT_TRIGGER_EFFECT_PARAM3).value_raw
-        out_report.left_trigger_effect_param4 = self._get_state_by_name(
-            WriteStateName.LEFT_TRIGGER_EFFECT_PARAM4).value_raw
-        out_report.left_trigger_effect_param5 = self._get_state_by_name(
-            WriteStateName.LEFT_TRIGGER_EFFECT_PARAM5).value_raw
-        out_report.left_trigger_effect_param6 = self._get_state_by_name(
-            WriteStateName.LEFT_TRIGGER_EFFECT_PARAM6).value_raw
-        out_report.left_trigger_effect_param7 = self._get_state_by_name(
-            WriteStateName.LEFT_TRIGGER_EFFECT_PARAM7).value_raw
-        out_report.right_trigger_effect_mode = self._get_state_by_name(
-            WriteStateName.RIGHT_TRIGGER_EFFECT_MODE).value_raw
-        out_report.right_trigger_effect_param1 = self._get_state_by_name(
-            WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM1).value_raw
-        out_report.right_trigger_effect_param2 = self._get_state_by_name(
-            WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM2).value_raw
-        out_report.right_trigger_effect_param3 = self._get_state_by_name(
-            WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM3).value_raw
-        out_report.right_trigger_effect_param4 = self._get_state_by_name(
-            WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM4).value_raw
-        out_report.right_trigger_effect_param5 = self._get_state_by_name(
-            WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM5).value_raw
-        out_report.right_trigger_effect_param6 = self._get_state_by_name(
-            WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM6).value_raw
-        out_report.right_trigger_effect_param7 = self._get_state_by_name(
-            WriteStateName.RIGHT_TRIGGER_EFFECT_PARAM7).value_raw
+        out_report.left_trigger_effect_mode = self.left_trigger_effect_mode.value_raw
+        out_report.left_trigger_effect_param1 = self.left_trigger_effect_param1.value_raw
+        out_report.left_trigger_effect_param2 = self.left_trigger_effect_param2.value_raw
+        out_report.left_trigger_effect_param3 = self.left_trigger_effect_param3.value_raw
+        out_report.left_trigger_effect_param4 = self.left_trigger_effect_param4.value_raw
+        out_report.left_trigger_effect_param5 = self.left_trigger_effect_param5.value_raw
+        out_report.left_trigger_effect_param6 = self.left_trigger_effect_param6.value_raw
+        out_report.left_trigger_effect_param7 = self.left_trigger_effect_param7.value_raw
+        out_report.right_trigger_effect_mode = self.right_trigger_effect_mode.value_raw
+        out_report.right_trigger_effect_param1 = self.right_trigger_effect_param1.value_raw
+        out_report.right_trigger_effect_param2 = self.right_trigger_effect_param2.value_raw
+        out_report.right_trigger_effect_param3 = self.right_trigger_effect_param3.value_raw
+        out_report.right_trigger_effect_param4 = self.right_trigger_effect_param4.value_raw
+        out_report.right_trigger_effect_param5 = self.right_trigger_effect_param5.value_raw
+        out_report.right_trigger_effect_param6 = self.right_trigger_effect_param6.value_raw
+        out_report.right_trigger_effect_param7 = self.right_trigger_effect_param7.value_raw
 
     def _create_and_register_state(
             self,
             name: WriteStateName,
+            priority: WritePriority,
             value: StateValue = None,
             default_value: StateValue = None,
             on_state_change_cb: StateChangeCallback = None,
@@ -293,21 +350,33 @@ class WriteStates(BaseStates):
             disable_change_detection=disable_change_detection,
         )
         self._register_state(state)
+        self._priorities[name] = priority
         state.on_change(on_state_change_cb if on_state_change_cb is not None else self._on_state_change)
         return state
 
-    def _on_state_change(self) -> None:
-        self._has_changed = True
+    def _on_state_change(self, name: StateName, old_value: StateValue, new_value: StateValue, timestamp: int) -> None:
+        self._set_changed(self._priorities[name])
+
+    def _set_changed(self, priority: WritePriority) -> None:
+        with self._changed_lock:
+            if self._changed_priority is None:
+                self._changed_priority = priority
+                self._changed_timestamp = time.perf_counter_ns()
+            elif priority > self._changed_priority:
+                self._changed_priority = priority
+            self._has_changed = True
+        for callback in self._changed_callbacks:
+            callback()
 
     def _on_microphone_changed(self, mic: Microphone) -> None:
         self.microphone_mute.value = mic.mute
         self.microphone_led.value = mic.led
-        self._has_changed = True
+        self._set_changed(WritePriority.NORMAL)
 
     def _on_player_leds_changed(self, leds: PlayerLeds) -> None:
         self.player_leds_enable.value = leds.enable
         self.player_leds_brightness.value = leds.brightness
-        self._has_changed = True
+        self._set_changed(WritePriority.COSMETIC)
 
     def _on_lightbar_changed(self, lb: Lightbar) -> None:
         self.lightbar_red.value = lb.red
@@ -315,15 +384,16 @@ class WriteStates(BaseStates):
         self.lightbar_blue.value = lb.blue
         self.lightbar_on_off.value = lb.is_on
         self.lightbar_pulse_options.value = lb.pulse_options
-        self._has_changed = True
+        self._set_changed(WritePriority.COSMETIC)
 
     def _on_microphone_led_changed(self) -> None:
         # Remove mic control flag to allow setting brightness
         self.flags_controls.set_value_without_triggering_change(FlagsControls.ALL)
-        self._has_changed = True
+        self._set_changed(WritePriority.NORMAL)
 
     def _on_left_trigger_effect_changed(self, left_trigger_effect: TriggerEffect) -> None:
-        Log.verbose('_on_left_trigger_effect_changed', left_trigger_effect)
+        if Log.verbose_enabled():
+            Log.verbose('_on_left_trigger_effect_changed', left_trigger_effect)
         self.left_trigger_effect_mode.value = left_trigger_effect.mode
         self.left_trigger_effect_param1.value = left_trigger_effect.param1
         self.left_trigger_effect_param2.value = left_trigger_effect.param2
@@ -332,10 +402,11 @@ class WriteStates(BaseStates):
         self.left_trigger_effect_param5.value = left_trigger_effect.param5
         self.left_trigger_effect_param6.value = left_trigger_effect.param6
         self.left_trigger_effect_param7.value = left_trigger_effect.param7
-        self._has_changed = True
+        self._set_changed(WritePriority.CRITICAL)
 
     def _on_right_trigger_effect_changed(self, right_trigger_effect: TriggerEffect) -> None:
-        Log.verbose('_on_right_trigger_effect_changed', right_trigger_effect)
+        if Log.verbose_enabled():
+            Log.verbose('_on_right_trigger_effect_changed', right_trigger_effect)
         self.right_trigger_effect_mode.value = right_trigger_effect.mode
         self.right_trigger_effect_param1.value = right_trigger_effect.param1
         self.right_trigger_effect_param2.value = right_trigger_effect.param2
@@ -344,4 +415,4 @@ class WriteStates(BaseStates):
         self.right_trigger_effect_param5.value = right_trigger_effect.param5
         self.right_trigger_effect_param6.value = right_trigger_effect.param6
         self.right_trigger_effect_param7.value = right_trigger_effect.param7
-        self._has_changed = True
+        self._set_changed(WritePriority.CRITICAL)
@@ -180,3 +180,12 @@ class TriggerEffectMode(int, Enum):
     SEMI_AUTOMATIC_GUN = WEAPON
 
 
+
+
+class WritePriority(int, Enum):
+    # lightbar, player leds
+    COSMETIC = 0
+    # microphone, flags
+    NORMAL = 1
+    # rumble, trigger effects
+    CRITICAL = 2
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from dualsense_controller.api.DualSenseController import DualSenseController, Mapping
 from dualsense_controller.api.enum import UpdateLevel
+from dualsense_controller.core.enum import PipelinePolicy
 from dualsense_controller.core.state.typedef import Number
 from tests.mock.MockedHidapiMockedHidapiDevice import MockedHidapiMockedHidapiDevice
 
@@ -17,6 +18,9 @@ class ControllerInstanceParams:
     gyroscope_threshold: int = 0
     orientation_threshold: int = 0
     accelerometer_threshold: int = 0
+    pipeline_policy: PipelinePolicy | None = None
+    latest_only: bool = False
+    write_thread: bool = False
 
 
 @dataclass
@@ -43,8 +43,7 @@ def fixture_mocked_hidapi_device(
 ) -> MockedHidapiMockedHidapiDevice:
     conn_type: ConnectionType = request.param if hasattr(request, 'param') else fixture_params_for_mocked_hidapi_device
     mocked_hidapi_device: MockedHidapiMockedHidapiDevice = MockedHidapiMockedHidapiDevice(conn_type=conn_type)
-    create_mock: Mock = mocker.patch('dualsense_controller.core.HidControllerDevice.HidControllerDevice._create')
-    create_mock.return_value = mocked_hidapi_device
+    mocker.patch('dualsense_controller.core.HidControllerDevice.HidDevice', return_value=mocked_hidapi_device)
     return mocked_hidapi_device
 
 
@@ -77,6 +76,9 @@ def fixture_controller_instance(
             gyroscope_threshold=params.gyroscope_threshold,
             orientation_threshold=params.orientation_threshold,
             accelerometer_threshold=params.accelerometer_threshold,
+            pipeline_policy=params.pipeline_policy,
+            latest_only=params.latest_only,
+            write_thread=params.write_thread,
         ),
 
         mocked_hidapi_device=fixture_mocked_hidapi_device
@@ -1,3 +1,5 @@
+import time
+
 from dualsense_controller.core.enum import ConnectionType
 from dualsense_controller.core.report.in_report.InReport import InReport
 from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
@@ -8,8 +10,11 @@ from dualsense_controller.core.state.read_state.value_type import JoyStick
 
 
 class _BaseMockedHidapiDevice:
+    # like a controller, a report is read every report_interval seconds
+    report_interval: float = 0.001
 
     def __init__(self, conn_type: ConnectionType = ConnectionType.USB_01):
+        self._opened: bool = False
         self._in_report: InReport | None = None
         match conn_type:
             case ConnectionType.USB_01:
@@ -31,14 +36,25 @@ class _BaseMockedHidapiDevice:
                     b'\x01\x80\x80\x82\x83\x00\x00\x9c\x08\x00'
                 ))
 
+    def open(self):
+        self._opened = True
+
+    def is_opened(self) -> bool:
+        return self._opened
+
     def write(self, data: bytes):
         pass
 
-    def read(self, _: int, **kwargs) -> bytes:
-        return self._in_report.raw_bytes
+    def read(self, buffer: bytearray | None = None, timeout_ms: int = 0, blocking: bool = False) -> bytes | int:
+        time.sleep(self.report_interval)
+        raw_bytes: bytes = bytes(self._in_report.raw_bytes)
+        if buffer is None:
+            return raw_bytes
+        buffer[:len(raw_bytes)] = raw_bytes
+        return len(raw_bytes)
 
     def close(self):
-        pass
+        self._opened = False
 
 
 class MockedHidapiMockedHidapiDevice(_BaseMockedHidapiDevice):
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
+from dualsense_controller.core.report.in_report.Bt31InReport import Bt31InReport
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+
+np = pytest.importorskip('numpy')
+from dualsense_controller.core.report.in_report.batch import decode_reports  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    'connection_type,in_report_type,length',
+    [
+        [ConnectionType.USB_01, Usb01InReport, InReportLength.USB_01],
+        [ConnectionType.BT_31, Bt31InReport, InReportLength.BT_31],
+        [ConnectionType.BT_01, Bt01InReport, InReportLength.BT_01],
+    ]
+)
+def test_decode_reports_matches_read_states(
+        connection_type: ConnectionType, in_report_type: type[InReport], length: int
+) -> None:
+    rnd: random.Random = random.Random(length)
+    raw_reports: list[bytes] = [bytes(rnd.getrandbits(8) for _ in range(length)) for _ in range(20)]
+    decoded: dict[ReadStateName, np.ndarray] = decode_reports(b''.join(raw_reports), connection_type)
+    assert all(len(column) == len(raw_reports) for column in decoded.values())
+
+    read_states: ReadStates = ReadStates(
+        state_value_mapper=StateValueMapper(mapping=StateValueMapping.RAW),
+        enforce_update=True,
+        can_update_itself=False,
+    )
+    in_report: InReport = in_report_type()
+    for row, raw_bytes in enumerate(raw_reports):
+        in_report.update(raw_bytes)
+        read_states.update(in_report, connection_type)
+        for state_name, column in decoded.items():
+            assert column[row] == read_states._get_state_by_name(state_name).value_raw, state_name
+
+
+def test_decode_reports_accepts_2d_array() -> None:
+    data: np.ndarray = np.zeros((3, InReportLength.USB_01), dtype=np.uint8)
+    data[:, 1] = [1, 2, 3]
+    decoded: dict[ReadStateName, np.ndarray] = decode_reports(data, ConnectionType.USB_01)
+    assert decoded[ReadStateName.LEFT_STICK_X].tolist() == [1, 2, 3]
+
+
+def test_decode_reports_rejects_truncated_buffer() -> None:
+    with pytest.raises(ValueError):
+        decode_reports(bytes(InReportLength.USB_01 + 1), ConnectionType.USB_01)
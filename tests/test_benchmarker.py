@@ -0,0 +1,13 @@
+import time
+
+from dualsense_controller.core.Benchmarker import Benchmark, Benchmarker
+
+
+def test_benchmark_measures_duration_between_updates() -> None:
+    benchmarker: Benchmarker = Benchmarker()
+    assert benchmarker.update() is None
+    time.sleep(0.01)
+    benchmark: Benchmark | None = benchmarker.update()
+    assert benchmark is not None
+    assert benchmark.duration >= 10_000_000
+    assert benchmark.per_second <= 100
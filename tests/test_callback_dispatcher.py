@@ -0,0 +1,75 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Thread, current_thread
+
+from dualsense_controller.core.state.CallbackDispatcher import CallbackDispatcher
+from dualsense_controller.core.state.State import State
+
+
+def test_dispatched_callbacks_keep_order_per_state() -> None:
+    with ThreadPoolExecutor(4) as executor:
+        dispatcher: CallbackDispatcher = CallbackDispatcher(executor)
+        states: list[State[int]] = [State(name=f'state_{index}', ignore_none=False) for index in range(4)]
+        received: dict[str, list[int]] = {state.name: [] for state in states}
+        for state in states:
+            state.set_callback_dispatcher(dispatcher)
+            state.on_change(lambda name, old, new, timestamp: received[name].append(new))
+        for value in range(200):
+            for state in states:
+                state.value = value
+        assert dispatcher.wait_until_idle(timeout=5) is True
+        dispatcher.close()
+    assert all(values == list(range(200)) for values in received.values())
+    assert dispatcher.dropped == 0
+
+
+def test_callbacks_run_on_dispatcher_thread() -> None:
+    dispatcher: CallbackDispatcher = CallbackDispatcher()
+    state: State[int] = State(name='state', ignore_none=False)
+    state.set_callback_dispatcher(dispatcher)
+    threads: list[Thread] = []
+    state.on_change(lambda: threads.append(current_thread()))
+    state.value = 1
+    assert dispatcher.wait_until_idle(timeout=1) is True
+    dispatcher.close()
+    assert threads and threads[0] is not current_thread()
+
+
+def test_full_queue_drops_oldest_change() -> None:
+    dispatcher: CallbackDispatcher = CallbackDispatcher(maxsize=2)
+    state: State[int] = State(name='state', ignore_none=False)
+    state.set_callback_dispatcher(dispatcher)
+    release: Event = Event()
+    received: list[int] = []
+
+    def on_change(value: int) -> None:
+        release.wait(1)
+        received.append(value)
+
+    state.on_change(on_change)
+    state.value = 0
+    # wait until the first change is taken from the queue and blocks the dispatcher thread
+    deadline: float = time.monotonic() + 1
+    while dispatcher.pending and time.monotonic() < deadline:
+        time.sleep(0.001)
+    for value in range(1, 6):
+        state.value = value
+    release.set()
+    assert dispatcher.wait_until_idle(timeout=1) is True
+    dispatcher.close()
+    assert received == [0, 4, 5]
+    assert dispatcher.dropped == 3
+
+
+def test_callback_exception_is_reported() -> None:
+    dispatcher: CallbackDispatcher = CallbackDispatcher()
+    exceptions: list[Exception] = []
+    dispatcher.on_exception(exceptions.append)
+    state: State[int] = State(name='state', ignore_none=False)
+    state.set_callback_dispatcher(dispatcher)
+    state.on_change(lambda: 1 / 0)
+    state.value = 1
+    state.value = 2
+    assert dispatcher.wait_until_idle(timeout=1) is True
+    dispatcher.close()
+    assert len(exceptions) == 2 and isinstance(exceptions[0], ZeroDivisionError)
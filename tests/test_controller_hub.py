@@ -0,0 +1,227 @@
+import socket
+import sys
+import threading
+import time
+from typing import Generator
+
+import pytest
+
+from dualsense_controller.api.DualSenseController import DualSenseController, Mapping
+from dualsense_controller.core.ControllerHub import ControllerHub, HubDeviceStats
+from dualsense_controller.core.HidControllerDevice import HidControllerDevice
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.recording.RecordedReport import RecordedReport
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.recording.enum import ReportDirection
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
+from dualsense_controller.core.state.read_state.value_type import JoyStick
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith('linux'), reason='epoll is linux only')
+
+
+def _report(left_stick_x: int) -> bytes:
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    in_report.raw_bytes[0] = 0x01
+    ValueCalc.set_left_stick(in_report, JoyStick(left_stick_x, 0))
+    return bytes(in_report.raw_bytes)
+
+
+@pytest.fixture
+def fixture_socketpairs() -> Generator[list[tuple[socket.socket, socket.socket]], None, None]:
+    pairs: list[tuple[socket.socket, socket.socket]] = [
+        socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET) for _ in range(3)
+    ]
+    yield pairs
+    for _, controller_end in pairs:
+        controller_end.close()
+
+
+def _wait_for(predicate, timeout: float = 1) -> bool:
+    deadline: float = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.002)
+    return True
+
+
+@linux_only
+def test_hub_services_hidraw_controllers(fixture_socketpairs: list[tuple[socket.socket, socket.socket]]) -> None:
+    left_stick_xs: list[int] = [0, 0, 0]
+    stop: threading.Event = threading.Event()
+
+    def emit_reports() -> None:
+        while not stop.is_set():
+            for index, (_, controller_end) in enumerate(fixture_socketpairs):
+                controller_end.send(_report(left_stick_xs[index]))
+            time.sleep(0.002)
+
+    emitter: threading.Thread = threading.Thread(target=emit_reports, daemon=True)
+    emitter.start()
+    with ControllerHub() as hub:
+        controllers: list[DualSenseController] = []
+        values: list[list[int]] = []
+        for device_end, _ in fixture_socketpairs:
+            controller: DualSenseController = DualSenseController(
+                hid_device=HidrawDevice(fd=device_end.detach()), mapping=Mapping.RAW, left_joystick_deadzone=0, hub=hub
+            )
+            controller.activate()
+            controller_values: list[int] = []
+            controller.left_stick_x.on_change(controller_values.append)
+            # the first value after listening is not emitted, let it be a 0
+            controller.wait_until_updated()
+            controller.wait_until_updated()
+            controllers.append(controller)
+            values.append(controller_values)
+        assert hub.num_devices == 3
+
+        left_stick_xs[:] = [10, 11, 12]
+        assert _wait_for(lambda: all(controller_values for controller_values in values))
+        assert values == [[10], [11], [12]]
+
+        stats: HubDeviceStats = controllers[0].hub_stats
+        assert stats.polled is True
+        assert stats.reports > 1
+        assert stats.busy_time_ns > 0
+
+        for controller in controllers:
+            controller.deactivate()
+        assert hub.num_devices == 0
+        assert controllers[0].hub_stats is None
+    stop.set()
+    emitter.join()
+
+
+@linux_only
+def test_hub_services_devices_in_turn(fixture_socketpairs: list[tuple[socket.socket, socket.socket]]) -> None:
+    (busy_end, busy_controller_end), (quiet_end, quiet_controller_end), _ = fixture_socketpairs
+    handled: list[str] = []
+    with ControllerHub() as hub:
+        devices: list[HidControllerDevice] = []
+        for name, device_end, controller_end in (
+                ('busy', busy_end, busy_controller_end),
+                ('quiet', quiet_end, quiet_controller_end),
+        ):
+            controller_end.send(_report(0))
+            device: HidControllerDevice = HidControllerDevice(hid_device=HidrawDevice(fd=device_end.detach()), hub=hub)
+
+            def on_in_report(_: InReport, name_: str = name) -> None:
+                handled.append(name_)
+
+            device.on_in_report(on_in_report)
+            device.open()
+            devices.append(device)
+
+        # the hub waits until both queues are filled
+        locks = [hub._entries[device].lock for device in devices]
+        for lock in locks:
+            lock.acquire()
+        for value in range(50):
+            busy_controller_end.send(_report(value))
+        for value in range(5):
+            quiet_controller_end.send(_report(value))
+        for lock in locks:
+            lock.release()
+
+        assert _wait_for(lambda: len(handled) == 55)
+        # the queued reports of the busy device do not hold back the quiet one
+        assert len(handled) - 1 - handled[::-1].index('quiet') < 20
+        for device in devices:
+            device.close()
+
+
+def test_hub_worker_pool() -> None:
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    recorded: list[RecordedReport] = [
+        RecordedReport(i * 1_000_000, ReportDirection.IN, bytes(in_report.raw_bytes)) for i in range(100)
+    ]
+    with ControllerHub(num_workers=2) as hub:
+        controllers: list[DualSenseController] = [
+            DualSenseController(hid_device=ReplayHidDevice(recorded, speed=None), hub=hub) for _ in range(3)
+        ]
+        for controller in controllers:
+            controller.activate()
+        assert _wait_for(lambda: all(controller.hub_stats.reports >= 50 for controller in controllers))
+        assert controllers[0].hub_stats.polled is False
+        for controller in controllers:
+            controller.deactivate()
+        assert hub.num_devices == 0
+
+
+class _SilentHidDevice:
+    # sends the one report needed to open it, then nothing. a read without timeout would block forever
+
+    def __init__(self):
+        self._opened: bool = False
+        self._detected: bool = False
+        self._closed_event: threading.Event = threading.Event()
+        self.timeouts_ms: list[int] = []
+
+    def open(self) -> None:
+        self._opened = True
+
+    def is_opened(self) -> bool:
+        return self._opened
+
+    def close(self) -> None:
+        self._opened = False
+        self._closed_event.set()
+
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+    def read(self, buffer: bytearray | None = None, timeout_ms: int = 0, blocking: bool = False) -> bytes | int:
+        if not self._detected:
+            self._detected = True
+            raw_bytes: bytes = _report(0)
+            buffer[:len(raw_bytes)] = raw_bytes
+            return len(raw_bytes)
+        self.timeouts_ms.append(timeout_ms)
+        # like hidapi, 0 waits until a report arrives
+        self._closed_event.wait(timeout_ms / 1000 if timeout_ms > 0 else None)
+        return b'' if buffer is None else 0
+
+
+def test_hub_worker_does_not_wait_for_silent_device() -> None:
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    recorded: list[RecordedReport] = [
+        RecordedReport(i * 1_000_000, ReportDirection.IN, bytes(in_report.raw_bytes)) for i in range(100)
+    ]
+    silent_device: _SilentHidDevice = _SilentHidDevice()
+    with ControllerHub(num_workers=1, poll_timeout=0.2) as hub:
+        silent: HidControllerDevice = HidControllerDevice(hid_device=silent_device, hub=hub)
+        silent.open()
+        active: DualSenseController = DualSenseController(hid_device=ReplayHidDevice(recorded, speed=1.0), hub=hub)
+        active.activate()
+        # about one report per millisecond, not one per poll_timeout
+        assert _wait_for(lambda: active.hub_stats.reports >= 50, timeout=0.5)
+        active.deactivate()
+        # alone on the worker, the silent device is waited for at most poll_timeout
+        start: float = time.monotonic()
+        silent.close()
+        assert time.monotonic() - start < 0.5
+        assert hub.num_devices == 0
+    # hidapi waits whole milliseconds, and without a timeout with 0
+    assert silent_device.timeouts_ms and all(isinstance(ms, int) and ms >= 1 for ms in silent_device.timeouts_ms)
+    assert 200 in silent_device.timeouts_ms
+    silent_device.close()
+
+
+@linux_only
+def test_hub_drops_failing_device(fixture_socketpairs: list[tuple[socket.socket, socket.socket]]) -> None:
+    device_end, controller_end = fixture_socketpairs[0]
+    controller_end.send(_report(0))
+    exceptions: list[Exception] = []
+    with ControllerHub() as hub:
+        device: HidControllerDevice = HidControllerDevice(hid_device=HidrawDevice(fd=device_end.detach()), hub=hub)
+        device.on_exception(exceptions.append)
+        device.open()
+        controller_end.shutdown(socket.SHUT_RDWR)
+        assert _wait_for(lambda: len(exceptions) == 1)
+        assert isinstance(exceptions[0], OSError)
+        assert device.hub_stats is not None
+        device.close()
+        assert hub.num_devices == 0
@@ -0,0 +1,39 @@
+import random
+import zlib
+from dataclasses import fields
+
+import pytest
+
+from dualsense_controller.core.report.out_report.Bt31OutReport import Bt31OutReport
+from dualsense_controller.core.report.out_report.crc32 import BT_31_CRC32_REPORT_LEN, \
+    _compute_crc32_checksum_table, compute_crc32_checksum
+from dualsense_controller.core.report.out_report.enum import OutReportLength
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_crc32_matches_table(seed: int) -> None:
+    rnd: random.Random = random.Random(seed)
+    for raw_bytes in (
+            bytes(OutReportLength.BT_31),
+            b'\xff' * OutReportLength.BT_31,
+            bytes(rnd.getrandbits(8) for _ in range(OutReportLength.BT_31)),
+    ):
+        assert compute_crc32_checksum(raw_bytes) == _compute_crc32_checksum_table(raw_bytes)
+        assert compute_crc32_checksum(bytearray(raw_bytes)) == _compute_crc32_checksum_table(raw_bytes)
+
+
+def test_crc32_covers_bt_header() -> None:
+    raw_bytes: bytes = bytes(range(OutReportLength.BT_31))
+    assert compute_crc32_checksum(raw_bytes) == zlib.crc32(b'\xa2' + raw_bytes[:BT_31_CRC32_REPORT_LEN])
+
+
+def test_bt31_out_report_checksum() -> None:
+    rnd: random.Random = random.Random(0)
+    out_report: Bt31OutReport = Bt31OutReport()
+    for _ in range(50):
+        for field in fields(out_report):
+            if not field.name.startswith('_'):
+                setattr(out_report, field.name, rnd.getrandbits(8))
+        raw_bytes: bytearray = out_report.to_bytes()
+        checksum: int = _compute_crc32_checksum_table(raw_bytes)
+        assert raw_bytes[BT_31_CRC32_REPORT_LEN:] == checksum.to_bytes(4, 'little')
@@ -0,0 +1,145 @@
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Generator
+
+import pytest
+
+from dualsense_controller.api.DualSenseController import DualSenseController, Mapping
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
+from dualsense_controller.core.state.read_state.value_type import JoyStick
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith('linux'), reason='hidraw is linux only')
+
+
+@pytest.fixture
+def fixture_socketpair() -> Generator[tuple[socket.socket, socket.socket], None, None]:
+    # seqpacket keeps the report boundaries like a hidraw node
+    device_end, controller_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    yield device_end, controller_end
+    controller_end.close()
+
+
+def _report(left_stick: JoyStick) -> bytes:
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    in_report.raw_bytes[0] = 0x01
+    ValueCalc.set_left_stick(in_report, left_stick)
+    return bytes(in_report.raw_bytes)
+
+
+def test_read_write(fixture_socketpair: tuple[socket.socket, socket.socket]) -> None:
+    device_end, controller_end = fixture_socketpair
+    device: HidrawDevice = HidrawDevice(fd=device_end.detach())
+    device.open()
+    assert device.is_opened() is True
+
+    controller_end.send(b'\x01' * 64)
+    controller_end.send(b'\x31' * 78)
+    first: memoryview = device.read()
+    assert bytes(first) == b'\x01' * 64
+    buffer: bytearray = bytearray(100)
+    assert device.read(buffer) == 78
+    assert buffer[:78] == b'\x31' * 78
+
+    controller_end.send(b'\x02' * 64)
+    second: memoryview = device.read()
+    # same length, same reused view
+    assert second is first
+    assert bytes(second) == b'\x02' * 64
+
+    assert device.read(timeout_ms=10) == b''
+    assert device.read(buffer, timeout_ms=10) == 0
+
+    assert device.write(b'\x02\xff') == 2
+    assert controller_end.recv(100) == b'\x02\xff'
+
+    device.close()
+    assert device.is_opened() is False
+
+
+def test_read_after_disconnect(fixture_socketpair: tuple[socket.socket, socket.socket]) -> None:
+    device_end, controller_end = fixture_socketpair
+    device: HidrawDevice = HidrawDevice(fd=device_end.detach())
+    device.open()
+    controller_end.shutdown(socket.SHUT_RDWR)
+    with pytest.raises(OSError):
+        device.read(timeout_ms=1000)
+    device.close()
+
+
+def test_close_wakes_up_read(fixture_socketpair: tuple[socket.socket, socket.socket]) -> None:
+    device_end, _ = fixture_socketpair
+    device: HidrawDevice = HidrawDevice(fd=device_end.detach())
+    device.open()
+    lengths: list[int] = []
+    reader: threading.Thread = threading.Thread(target=lambda: lengths.append(len(device.read())), daemon=True)
+    reader.start()
+    time.sleep(0.05)
+    device.close()
+    reader.join(timeout=1)
+    assert reader.is_alive() is False
+    assert lengths == [0]
+    with pytest.raises(OSError):
+        device.read()
+
+
+def test_enumerate_paths(tmp_path: Path) -> None:
+    for name, hid_id in (
+            ('hidraw0', '0003:0000046D:0000C52B'),
+            ('hidraw1', '0003:0000054C:00000CE6'),
+            ('hidraw2', '0005:0000054C:00000CE6'),
+    ):
+        device_dir: Path = tmp_path / name / 'device'
+        device_dir.mkdir(parents=True)
+        (device_dir / 'uevent').write_text(f'DRIVER=playstation\nHID_ID={hid_id}\nHID_NAME=Controller\n')
+    assert HidrawDevice.enumerate_paths(sys_class_hidraw=str(tmp_path)) == ['/dev/hidraw1', '/dev/hidraw2']
+
+
+def test_controller_on_hidraw(fixture_socketpair: tuple[socket.socket, socket.socket]) -> None:
+    device_end, controller_end = fixture_socketpair
+    stop: threading.Event = threading.Event()
+
+    def emit_reports() -> None:
+        value: int = 0
+        while not stop.is_set():
+            controller_end.send(_report(JoyStick(value % 256, 0)))
+            value += 1
+            time.sleep(0.001)
+
+    emitter: threading.Thread = threading.Thread(target=emit_reports, daemon=True)
+    emitter.start()
+    controller: DualSenseController = DualSenseController(
+        hid_device=HidrawDevice(fd=device_end.detach()), mapping=Mapping.RAW, left_joystick_deadzone=0
+    )
+    controller.activate()
+    try:
+        values: list[int] = []
+        controller.left_stick_x.on_change(values.append)
+        deadline: float = time.monotonic() + 1
+        while len(values) < 5 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert len(values) >= 5
+        assert all(0 <= value < 256 for value in values)
+    finally:
+        controller.deactivate()
+        stop.set()
+        emitter.join()
+
+
+def test_silent_controller_deactivates(fixture_socketpair: tuple[socket.socket, socket.socket]) -> None:
+    device_end, controller_end = fixture_socketpair
+    # one report for the detection and one activate() waits for, then the controller goes silent
+    controller_end.send(_report(JoyStick(0, 0)))
+    controller_end.send(_report(JoyStick(0, 0)))
+    controller: DualSenseController = DualSenseController(hid_device=HidrawDevice(fd=device_end.detach()))
+    controller.activate()
+    time.sleep(0.05)
+    deactivator: threading.Thread = threading.Thread(target=controller.deactivate, daemon=True)
+    deactivator.start()
+    deactivator.join(timeout=1)
+    assert deactivator.is_alive() is False
@@ -0,0 +1,53 @@
+import random
+
+import pytest as pytest
+
+from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
+from dualsense_controller.core.report.in_report.Bt31InReport import Bt31InReport
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.InReportSnapshot import InReportSnapshot
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+
+
+def _int16(v1: int, v0: int) -> int:
+    res: int = ((v1 << 8) | v0)
+    return res - 0x10000 if res > 0x7FFF else res
+
+
+def _uint32(in_report: InReport, prefix: str) -> int:
+    return int.from_bytes(bytes(getattr(in_report, f'{prefix}_{i}') for i in range(4)), 'little')
+
+
+@pytest.mark.parametrize(
+    'in_report_type,length',
+    [
+        [Usb01InReport, InReportLength.USB_01],
+        [Bt31InReport, InReportLength.BT_31],
+        [Bt01InReport, InReportLength.BT_01],
+    ]
+)
+def test_snapshot_matches_single_byte_access(in_report_type: type[InReport], length: int) -> None:
+    rnd: random.Random = random.Random(length)
+    in_report: InReport = in_report_type()
+    for _ in range(50):
+        in_report.update(bytearray(rnd.getrandbits(8) for _ in range(length)))
+        snapshot: InReportSnapshot = in_report.snapshot
+        for name in InReportSnapshot._fields:
+            if name in ('timestamp', 'sensor_timestamp'):
+                expected: int = _uint32(in_report, name) if f'{name}_0' in in_report._index_dict else 0
+            elif name.startswith(('gyro_', 'accel_')):
+                expected = (
+                    _int16(getattr(in_report, f'{name}_1'), getattr(in_report, f'{name}_0'))
+                    if f'{name}_0' in in_report._index_dict else 0
+                )
+            else:
+                expected = getattr(in_report, name) if name in in_report._index_dict else 0
+            assert getattr(snapshot, name) == expected, name
+
+
+def test_snapshot_invalidated_on_set() -> None:
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    assert in_report.snapshot.axes_0 == 0
+    in_report.axes_0 = 42
+    assert in_report.snapshot.axes_0 == 42
@@ -0,0 +1,81 @@
+import logging
+from typing import Generator
+
+import pytest
+
+from dualsense_controller.core.HidControllerDevice import HidControllerDevice
+from dualsense_controller.core.log import Log, LogLevel, NAME_LOGGER
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.report.out_report.Usb01OutReport import Usb01OutReport
+
+
+class _CountingArg:
+    def __init__(self):
+        self.num_str: int = 0
+
+    def __str__(self) -> str:
+        self.num_str += 1
+        return 'arg'
+
+
+class _CountingBuffer(bytearray):
+    num_hex: int = 0
+
+    def hex(self, *args) -> str:
+        _CountingBuffer.num_hex += 1
+        return super().hex(*args)
+
+
+class _CountingOutReport(Usb01OutReport):
+    def to_bytes(self) -> bytearray:
+        return _CountingBuffer(super().to_bytes())
+
+
+@pytest.fixture
+def fixture_log_level() -> Generator[None, None, None]:
+    yield
+    Log.set_level(LogLevel.INFO)
+
+
+def test_enabled_levels_follow_set_level(fixture_log_level: None) -> None:
+    Log.set_level(LogLevel.INFO)
+    assert (Log.verbose_enabled(), Log.debug_enabled(), Log.trace_enabled()) == (False, False, False)
+    Log.set_level(LogLevel.DEBUG)
+    assert (Log.verbose_enabled(), Log.debug_enabled(), Log.trace_enabled()) == (True, True, False)
+
+
+def test_enabled_levels_follow_the_logger(fixture_log_level: None) -> None:
+    Log.set_level(LogLevel.INFO)
+    logging.getLogger(NAME_LOGGER).setLevel(LogLevel.TRACE)
+    assert (Log.verbose_enabled(), Log.debug_enabled(), Log.trace_enabled()) == (True, True, True)
+    arg: _CountingArg = _CountingArg()
+    Log.trace('msg', arg)
+    assert arg.num_str == 1
+    logging.getLogger(NAME_LOGGER).setLevel(LogLevel.WARNING)
+    Log.info('msg', arg)
+    assert arg.num_str == 1
+    assert Log.verbose_enabled() is False
+
+
+def test_disabled_levels_do_not_format(fixture_log_level: None) -> None:
+    Log.set_level(LogLevel.INFO)
+    arg: _CountingArg = _CountingArg()
+    Log.verbose('msg', arg)
+    Log.debug('msg', arg)
+    Log.trace('msg', arg)
+    assert arg.num_str == 0
+    Log.set_level(LogLevel.VERBOSE)
+    Log.verbose('msg', arg)
+    assert arg.num_str == 1
+
+
+def test_write_does_not_format_at_info(fixture_log_level: None) -> None:
+    Log.set_level(LogLevel.INFO)
+    device: HidControllerDevice = HidControllerDevice(hid_device=ReplayHidDevice([]))
+    device._out_report_lockable.value = _CountingOutReport()
+    _CountingBuffer.num_hex = 0
+    device.write()
+    assert _CountingBuffer.num_hex == 0
+    Log.set_level(LogLevel.VERBOSE)
+    device.write()
+    assert _CountingBuffer.num_hex == 1
@@ -0,0 +1,48 @@
+import pytest
+
+from dualsense_controller.core.report.out_report.Bt01OutReport import Bt01OutReport
+from dualsense_controller.core.report.out_report.Bt31OutReport import Bt31OutReport
+from dualsense_controller.core.report.out_report.OutReport import OutReport
+from dualsense_controller.core.report.out_report.Usb01OutReport import Usb01OutReport
+from dualsense_controller.core.report.out_report.enum import OutReportLength
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.write_state.WriteStates import WriteStates
+from dualsense_controller.core.state.write_state.value_type import Lightbar, TriggerEffect
+
+
+@pytest.mark.parametrize(
+    'out_report_type,length,offset',
+    [
+        [Usb01OutReport, OutReportLength.USB_01, 0],
+        [Bt31OutReport, OutReportLength.BT_31, 1],
+    ]
+)
+def test_to_bytes_reuses_its_buffer(out_report_type: type[OutReport], length: int, offset: int) -> None:
+    out_report: OutReport = out_report_type()
+    first: bytearray = out_report.to_bytes()
+    assert len(first) == length
+    out_report.lightbar_red = 0x12
+    out_report.motor_left = 300
+    second: bytearray = out_report.to_bytes()
+    assert second is first
+    assert second[45 + offset] == 0x12
+    assert second[4 + offset] == 0xFF
+    assert bytes(second) == bytes(out_report_type(lightbar_red=0x12, motor_left=300).to_bytes())
+
+
+def test_bt01_to_bytes_length() -> None:
+    assert len(Bt01OutReport().to_bytes()) == OutReportLength.BT_31
+
+
+def test_update_out_report() -> None:
+    write_states: WriteStates = WriteStates(state_value_mapper=StateValueMapper(mapping=StateValueMapping.DEFAULT))
+    write_states.lightbar.value = Lightbar(1, 2, 3)
+    write_states.left_trigger_effect.value = TriggerEffect(mode=0x21, param1=4, param7=5)
+    write_states.right_motor.value = 200
+    out_report: Usb01OutReport = Usb01OutReport()
+    write_states.update_out_report(out_report)
+    raw_bytes: bytearray = out_report.to_bytes()
+    assert raw_bytes[45:48] == bytes((1, 2, 3))
+    assert raw_bytes[22] == 0x21 and raw_bytes[23] == 4 and raw_bytes[29] == 5
+    assert raw_bytes[3] == 200
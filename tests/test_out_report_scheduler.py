@@ -0,0 +1,73 @@
+from dualsense_controller.core.OutReportScheduler import OutReportScheduler
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.write_state.WriteStates import WriteStates
+from dualsense_controller.core.state.write_state.enum import WritePriority
+from dualsense_controller.core.state.write_state.value_type import Lightbar, TriggerEffect
+
+_MS: int = 1_000_000
+
+
+def _create_write_states() -> WriteStates:
+    return WriteStates(state_value_mapper=StateValueMapper(mapping=StateValueMapping.DEFAULT))
+
+
+def test_write_states_track_highest_priority() -> None:
+    write_states: WriteStates = _create_write_states()
+    assert write_states.changed_priority is None
+
+    write_states.lightbar.value = Lightbar(255, 0, 0)
+    assert write_states.changed_priority == WritePriority.COSMETIC
+    changed_timestamp: int = write_states.changed_timestamp
+
+    write_states.left_motor.value = 255
+    assert write_states.changed_priority == WritePriority.CRITICAL
+    assert write_states.changed_timestamp == changed_timestamp
+
+    write_states.set_unchanged()
+    assert write_states.has_changed is False
+    assert write_states.changed_priority is None
+
+    write_states.right_trigger_effect.value = TriggerEffect(mode=0x01, param1=10)
+    assert write_states.changed_priority == WritePriority.CRITICAL
+
+
+def test_take_changed_returns_first_change_timestamp() -> None:
+    write_states: WriteStates = _create_write_states()
+    assert write_states.take_changed() is None
+
+    write_states.lightbar.value = Lightbar(255, 0, 0)
+    changed_timestamp: int = write_states.changed_timestamp
+    write_states.left_motor.value = 255
+    assert write_states.take_changed() == changed_timestamp
+    assert write_states.has_changed is False
+    assert write_states.take_changed() is None
+
+
+def test_coalesce_window_per_priority() -> None:
+    scheduler: OutReportScheduler = OutReportScheduler(
+        coalesce_window={WritePriority.COSMETIC: 0.05, WritePriority.CRITICAL: 0}
+    )
+    assert scheduler.is_due(WritePriority.CRITICAL, 0, ConnectionType.USB_01, now=0) is True
+    assert scheduler.is_due(WritePriority.COSMETIC, 0, ConnectionType.USB_01, now=40 * _MS) is False
+    assert scheduler.is_due(WritePriority.COSMETIC, 0, ConnectionType.USB_01, now=49 * _MS) is False
+    assert scheduler.is_due(WritePriority.COSMETIC, 0, ConnectionType.USB_01, now=50 * _MS) is True
+    # once per pending change, not per poll
+    assert scheduler.deferred == 1
+    scheduler.written(now=50 * _MS)
+    assert scheduler.is_due(WritePriority.COSMETIC, 60 * _MS, ConnectionType.USB_01, now=70 * _MS) is False
+    assert scheduler.is_due(WritePriority.COSMETIC, 60 * _MS, ConnectionType.USB_01, now=80 * _MS) is False
+    assert scheduler.deferred == 2
+
+
+def test_min_interval_per_connection_type() -> None:
+    scheduler: OutReportScheduler = OutReportScheduler(
+        min_interval={ConnectionType.USB_01: 0.004, ConnectionType.BT_31: 0.02}
+    )
+    scheduler.written(now=100 * _MS)
+    assert scheduler.is_due(WritePriority.CRITICAL, 101 * _MS, ConnectionType.USB_01, now=103 * _MS) is False
+    assert scheduler.is_due(WritePriority.CRITICAL, 101 * _MS, ConnectionType.USB_01, now=104 * _MS) is True
+    assert scheduler.is_due(WritePriority.CRITICAL, 101 * _MS, ConnectionType.BT_31, now=110 * _MS) is False
+    assert scheduler.due_at(WritePriority.CRITICAL, 101 * _MS, ConnectionType.BT_31) == 120 * _MS
+    assert scheduler.writes == 1
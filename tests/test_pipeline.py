@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from dualsense_controller.core.InReportRingBuffer import InReportRingBuffer, PipelineStats
+from dualsense_controller.core.enum import ConnectionType, PipelinePolicy
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from tests.common import ControllerInstanceData, ControllerInstanceParams
+
+
+def _produce(ring_buffer: InReportRingBuffer, count: int) -> None:
+    for i in range(count):
+        slot: bytearray = ring_buffer.reserve()
+        slot[0] = i
+        ring_buffer.commit(1)
+
+
+@pytest.mark.parametrize(
+    'policy,expected_reports,expected_dropped,expected_coalesced',
+    [
+        [PipelinePolicy.DROP_OLDEST, [6, 7, 8, 9], 6, 0],
+        [PipelinePolicy.COALESCE_LATEST, [9], 6, 3],
+    ]
+)
+def test_ring_buffer_policies_without_consumer(
+        policy: PipelinePolicy, expected_reports: list[int], expected_dropped: int, expected_coalesced: int
+) -> None:
+    ring_buffer: InReportRingBuffer = InReportRingBuffer(capacity=4, slot_size=8, policy=policy)
+    _produce(ring_buffer, 10)
+    ring_buffer.close()
+    reports: list[int] = []
+    while (raw_bytes := ring_buffer.take()) is not None:
+        reports.append(raw_bytes[0])
+    assert reports == expected_reports
+    stats: PipelineStats = ring_buffer.stats
+    assert (stats.received, stats.dropped, stats.coalesced) == (10, expected_dropped, expected_coalesced)
+    assert stats.processed == len(expected_reports)
+
+
+def test_ring_buffer_process_all_blocks_producer() -> None:
+    ring_buffer: InReportRingBuffer = InReportRingBuffer(capacity=2, slot_size=8, policy=PipelinePolicy.PROCESS_ALL)
+    producer: threading.Thread = threading.Thread(target=_produce, args=(ring_buffer, 50))
+    producer.start()
+    reports: list[int] = [ring_buffer.take(timeout=1)[0] for _ in range(50)]
+    producer.join()
+    assert reports == list(range(50))
+    assert ring_buffer.stats.dropped == 0
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device,fixture_params_for_controller_instance',
+    [
+        [conn_type, ControllerInstanceParams(pipeline_policy=policy)]
+        for conn_type in [ConnectionType.USB_01, ConnectionType.BT_31, ConnectionType.BT_01]
+        for policy in PipelinePolicy
+    ],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_controller_with_pipeline(
+        fixture_params_for_mocked_hidapi_device: ConnectionType,
+        fixture_params_for_controller_instance: ControllerInstanceParams,
+        fixture_activated_instance: ControllerInstanceData,
+) -> None:
+    controller = fixture_activated_instance.controller
+    fixture_activated_instance.mocked_hidapi_device.set_btn_square(True)
+    fixture_activated_instance.mocked_hidapi_device.set_btn_cross(True)
+    assert controller.wait_for_state(ReadStateName.BTN_CROSS, lambda pressed: pressed is True, timeout=1) is True
+    assert controller.pipeline_stats.received > 0
@@ -0,0 +1,113 @@
+from pytest_mock import MockerFixture
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ReadState import ReadState
+from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
+from dualsense_controller.core.state.read_state.value_type import JoyStick
+
+
+def _create_read_states(enforce_update: bool, can_update_itself: bool) -> ReadStates:
+    return ReadStates(
+        state_value_mapper=StateValueMapper(mapping=StateValueMapping.RAW),
+        enforce_update=enforce_update,
+        can_update_itself=can_update_itself,
+    )
+
+
+def _create_in_report() -> Usb01InReport:
+    return Usb01InReport(bytearray(InReportLength.USB_01))
+
+
+def test_unchanged_report_calculates_nothing(mocker: MockerFixture) -> None:
+    read_states: ReadStates = _create_read_states(enforce_update=True, can_update_itself=False)
+    in_report: Usb01InReport = _create_in_report()
+    read_states.update(in_report, ConnectionType.USB_01)
+
+    calc_value_spy = mocker.spy(ReadState, 'calc_value')
+    in_report.update(bytearray(in_report.raw_bytes))
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert calc_value_spy.call_count == 0
+
+
+def test_only_states_of_changed_bytes_are_calculated(mocker: MockerFixture) -> None:
+    read_states: ReadStates = _create_read_states(enforce_update=True, can_update_itself=False)
+    in_report: Usb01InReport = _create_in_report()
+    read_states.update(in_report, ConnectionType.USB_01)
+
+    calc_value_spy = mocker.spy(ReadState, 'calc_value')
+    ValueCalc.set_left_stick(in_report, JoyStick(10, 20))
+    read_states.update(in_report, ConnectionType.USB_01)
+    calculated: set[ReadState] = {call.args[0] for call in calc_value_spy.call_args_list}
+    assert calculated == {read_states.left_stick, read_states.left_stick_x, read_states.left_stick_y}
+    assert read_states.left_stick_x.value == 10
+    assert read_states.left_stick.has_changed_since_last_set_value is True
+
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states.left_stick.has_changed_since_last_set_value is False
+
+
+def test_stale_state_calculated_once_listened() -> None:
+    read_states: ReadStates = _create_read_states(enforce_update=False, can_update_itself=False)
+    in_report: Usb01InReport = _create_in_report()
+    ValueCalc.set_left_stick(in_report, JoyStick(10, 20))
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states.left_stick.value is None
+
+    read_states.left_stick.on_change(lambda _: _)
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states.left_stick.value == JoyStick(10, 20)
+
+
+def test_update_plan_follows_listeners() -> None:
+    read_states: ReadStates = _create_read_states(enforce_update=False, can_update_itself=False)
+    in_report: Usb01InReport = _create_in_report()
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states._update_plan.steps == ()
+
+    callback = lambda _: _
+    read_states.left_stick_x.on_change(callback)
+    assert read_states._update_plan is None
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert [step[0] for step in read_states._update_plan.steps] == [
+        read_states.left_stick, read_states.left_stick_x, read_states.left_stick_y
+    ]
+
+    read_states.left_stick_x.remove_change_listener(callback)
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states._update_plan.steps == ()
+
+
+def test_update_plan_follows_update_level() -> None:
+    read_states: ReadStates = _create_read_states(enforce_update=False, can_update_itself=False)
+    in_report: Usb01InReport = _create_in_report()
+    ValueCalc.set_left_stick(in_report, JoyStick(10, 20))
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states.left_stick.value is None
+
+    read_states.set_update_level(enforce_update=True, can_update_itself=False)
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert len(read_states._update_plan.steps) == len(read_states._source_masks)
+    assert read_states.left_stick.value == JoyStick(10, 20)
+
+
+def test_update_plan_invalidated_while_created(mocker: MockerFixture) -> None:
+    read_states: ReadStates = _create_read_states(enforce_update=False, can_update_itself=False)
+    in_report: Usb01InReport = _create_in_report()
+    create_update_plan = read_states._create_update_plan
+
+    def create_update_plan_and_add_listener():
+        # a listener added by another thread while the plan is created
+        update_plan = create_update_plan()
+        read_states.left_stick_x.on_change(lambda _: _)
+        return update_plan
+
+    mocker.patch.object(read_states, '_create_update_plan', side_effect=create_update_plan_and_add_listener)
+    read_states.update(in_report, ConnectionType.USB_01)
+    mocker.patch.object(read_states, '_create_update_plan', side_effect=create_update_plan)
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states.left_stick_x in [step[0] for step in read_states._update_plan.steps]
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.recording.RecordedReport import RecordedReport
+from dualsense_controller.core.recording.SessionRecorder import MAX_REPORT_LENGTH, SessionRecorder
+from dualsense_controller.core.recording.SessionRecording import SessionRecording
+from dualsense_controller.core.recording.enum import ReportDirection
+from tests.common import ControllerInstanceData
+
+
+def _raw_bytes(i: int) -> bytes:
+    return bytes([i % 256]) * (1 + i % 64)
+
+
+@pytest.mark.parametrize('mmap_records', [None, 100])
+def test_records_are_read_back_in_order(tmp_path: Path, mmap_records: int | None) -> None:
+    path: Path = tmp_path / 'session.dsrec'
+    with SessionRecorder(path, buffer_records=8, num_buffers=8, mmap_records=mmap_records) as recorder:
+        for i in range(50):
+            recorder.record(ReportDirection.IN if i % 2 else ReportDirection.OUT, _raw_bytes(i))
+        slot: bytearray = bytearray(100)
+        slot[:3] = b'abc'
+        recorder.record(ReportDirection.IN, slot, 3)
+
+    with SessionRecording(path) as recording:
+        records: list[RecordedReport] = list(recording)
+        assert len(recording) == 51
+    assert [record.raw_bytes for record in records] == [_raw_bytes(i) for i in range(50)] + [b'abc']
+    assert records[0].direction == ReportDirection.OUT and records[1].direction == ReportDirection.IN
+    assert all(a.timestamp <= b.timestamp for a, b in zip(records, records[1:]))
+    assert records[0].timestamp >= recording.start_timestamp
+
+
+def test_full_mmap_drops(tmp_path: Path) -> None:
+    path: Path = tmp_path / 'session.dsrec'
+    with SessionRecorder(path, mmap_records=4) as recorder:
+        for i in range(6):
+            recorder.record(ReportDirection.IN, _raw_bytes(i))
+    assert (recorder.records, recorder.dropped) == (4, 2)
+    with SessionRecording(path) as recording:
+        assert len(recording) == 4
+
+
+def test_too_long_reports_are_truncated(tmp_path: Path) -> None:
+    path: Path = tmp_path / 'session.dsrec'
+    with SessionRecorder(path) as recorder:
+        recorder.record(ReportDirection.IN, bytes(MAX_REPORT_LENGTH + 10))
+    with SessionRecording(path) as recording:
+        assert len(next(iter(recording)).raw_bytes) == MAX_REPORT_LENGTH
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device',
+    [ConnectionType.USB_01, ConnectionType.BT_31, ConnectionType.BT_01],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_controller_records_in_and_out_reports(
+        tmp_path: Path,
+        fixture_params_for_mocked_hidapi_device: ConnectionType,
+        fixture_activated_instance: ControllerInstanceData,
+) -> None:
+    path: Path = tmp_path / 'session.dsrec'
+    controller = fixture_activated_instance.controller
+    controller.start_recording(path)
+    controller.lightbar.set_color_red()
+    assert controller.wait_until_updated(timeout=1) is True
+    assert controller.wait_until_updated(timeout=1) is True
+    controller.stop_recording()
+
+    with SessionRecording(path) as recording:
+        directions: set[ReportDirection] = {record.direction for record in recording}
+    assert directions == {ReportDirection.IN, ReportDirection.OUT}
@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from dualsense_controller.api.DualSenseController import DualSenseController, Mapping
+from dualsense_controller.core.enum import PipelinePolicy
+from dualsense_controller.core.recording.RecordedReport import RecordedReport
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.recording.enum import ReportDirection
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
+from dualsense_controller.core.state.read_state.value_type import JoyStick
+
+
+def _recorded_reports(num: int, interval_ns: int = 1_000_000) -> list[RecordedReport]:
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    reports: list[RecordedReport] = []
+    for i in range(num):
+        ValueCalc.set_left_stick(in_report, JoyStick(i, 255 - i))
+        reports.append(RecordedReport(i * interval_ns, ReportDirection.IN, bytes(in_report.raw_bytes)))
+        reports.append(RecordedReport(i * interval_ns, ReportDirection.OUT, b'\x02'))
+    return reports
+
+
+def test_replays_in_reports_only_and_repeats_the_last() -> None:
+    reports: list[RecordedReport] = _recorded_reports(3)
+    device: ReplayHidDevice = ReplayHidDevice(reports, speed=None, idle_interval=0)
+    device.open()
+    assert [device.read() for _ in range(4)] == [reports[0].raw_bytes, reports[2].raw_bytes, reports[4].raw_bytes,
+                                                 reports[4].raw_bytes]
+    assert device.wait_until_finished(timeout=0) is True
+    assert device.num_replayed == 3
+    buffer: bytearray = bytearray(100)
+    assert device.read(buffer) == InReportLength.USB_01
+    device.close()
+    assert device.is_opened() is False
+
+
+@pytest.mark.parametrize('speed,min_duration', [[1.0, 0.018], [4.0, 0.0045]])
+def test_replay_keeps_recorded_timing(speed: float, min_duration: float) -> None:
+    device: ReplayHidDevice = ReplayHidDevice(_recorded_reports(20), speed=speed)
+    device.open()
+    start: float = time.perf_counter()
+    for _ in range(20):
+        device.read()
+    assert time.perf_counter() - start >= min_duration
+    device.close()
+
+
+@pytest.mark.parametrize('pipeline', [False, True])
+def test_controller_driven_by_replay(pipeline: bool) -> None:
+    device: ReplayHidDevice = ReplayHidDevice(_recorded_reports(50), speed=None)
+    controller: DualSenseController = DualSenseController(
+        hid_device=device,
+        mapping=Mapping.RAW,
+        left_joystick_deadzone=0,
+        pipeline_policy=PipelinePolicy.PROCESS_ALL if pipeline else None,
+    )
+    values: list[int] = []
+    controller.left_stick_x.on_change(values.append)
+    controller.activate()
+    assert device.wait_until_finished(timeout=1) is True
+    assert controller.wait_until_updated(timeout=1) is True
+    controller.deactivate()
+    # the first report is consumed by the connection type detection, the second one sets the initial value
+    assert values == list(range(2, 50))
+
+
+@pytest.mark.parametrize('max_out_reports,expected', [[3, [b'\x07', b'\x08', b'\x09']], [0, []]])
+def test_keeps_the_last_out_reports(max_out_reports: int, expected: list[bytes]) -> None:
+    device: ReplayHidDevice = ReplayHidDevice([], max_out_reports=max_out_reports)
+    for value in range(10):
+        assert device.write(bytes([value])) == 1
+    assert list(device.out_reports) == expected
@@ -0,0 +1,248 @@
+import pickle
+import socket
+import sys
+import threading
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+
+from dualsense_controller.api.SharedDualSenseController import SharedDualSenseController
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.exception import SharedReaderException, SharedStateListenerException
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.shared.SharedStateLayout import SharedStateLayout, VALUE
+from dualsense_controller.core.shared.SharedStateReader import SharedStateReader
+from dualsense_controller.core.shared.SharedStateWriter import SharedStateWriter
+from dualsense_controller.core.shared.enum import SharedReaderStatus
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from dualsense_controller.core.state.read_state.value_type import JoyStick
+from tests.mock.common import DeviceInfoMock
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith('linux'), reason='hidraw and fork are linux only')
+
+
+def _in_report(left_stick_x: int, left_trigger: int = 0) -> Usb01InReport:
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    in_report.raw_bytes[0] = 0x01
+    ValueCalc.set_left_stick(in_report, JoyStick(left_stick_x, 0))
+    ValueCalc.set_left_trigger(in_report, left_trigger)
+    return in_report
+
+
+@pytest.fixture
+def fixture_shared_memory() -> Generator[SharedMemory, None, None]:
+    shared_memory: SharedMemory = SharedMemory(create=True, size=SharedStateLayout().size)
+    yield shared_memory
+    shared_memory.close()
+    shared_memory.unlink()
+
+
+def _read_states() -> ReadStates:
+    return ReadStates(
+        StateValueMapper(mapping=StateValueMapping.RAW, left_joystick_deadzone=0, right_joystick_deadzone=0),
+        enforce_update=True,
+    )
+
+
+def test_writer_publishes_to_reader(fixture_shared_memory: SharedMemory) -> None:
+    read_states: ReadStates = _read_states()
+    writer: SharedStateWriter = SharedStateWriter(fixture_shared_memory.buf, read_states)
+    reader: SharedStateReader = SharedStateReader(fixture_shared_memory.buf)
+    left_stick_x = reader.layout.get_entry(ReadStateName.LEFT_STICK_X)
+    left_stick = reader.layout.get_entry(ReadStateName.LEFT_STICK)
+    left_trigger = reader.layout.get_entry(ReadStateName.LEFT_TRIGGER_VALUE)
+    assert reader.sequence == 0
+    assert reader.status is SharedReaderStatus.STARTING
+    assert reader.read_value(left_stick) is None
+
+    writer.set_status(SharedReaderStatus.RUNNING, ConnectionType.USB_01)
+    read_states.update(_in_report(42, left_trigger=200), ConnectionType.USB_01)
+    writer.publish()
+    assert reader.sequence == 1
+    assert reader.status is SharedReaderStatus.RUNNING
+    assert reader.connection_type is ConnectionType.USB_01
+    assert reader.timestamp == read_states.timestamp
+    assert reader.read_value(left_stick_x) == 42
+    assert reader.read_value(left_stick) == JoyStick(42, 0)
+    assert reader.read_value(left_trigger) == 200
+    assert reader.read_changed(left_stick_x)
+
+    read_states.update(_in_report(42), ConnectionType.USB_01)
+    writer.publish()
+    assert reader.sequence == 2
+    assert reader.read_value(left_trigger) == 0
+    assert reader.read_changed(left_trigger)
+    assert not reader.read_changed(left_stick_x)
+    assert reader.wait_for_sequence(1, timeout=0)
+    assert not reader.wait_for_sequence(2, timeout=0.01)
+
+
+def test_reader_snapshot_equals_snapshot_of_read_states(fixture_shared_memory: SharedMemory) -> None:
+    read_states: ReadStates = _read_states()
+    read_states.enable_snapshots()
+    writer: SharedStateWriter = SharedStateWriter(fixture_shared_memory.buf, read_states)
+    reader: SharedStateReader = SharedStateReader(fixture_shared_memory.buf)
+    assert reader.read_snapshot() is None
+
+    in_report: Usb01InReport = _in_report(42, left_trigger=200)
+    in_report.seq_num = 9
+    in_report.timestamp_2 = 0x01
+    in_report.sensor_timestamp_0 = 0x05
+    read_states.update(in_report, ConnectionType.USB_01)
+    writer.publish()
+    assert reader.read_snapshot() == read_states.snapshot
+
+
+def test_reader_never_sees_torn_values(fixture_shared_memory: SharedMemory) -> None:
+    read_states: ReadStates = _read_states()
+    writer: SharedStateWriter = SharedStateWriter(fixture_shared_memory.buf, read_states)
+    reader: SharedStateReader = SharedStateReader(fixture_shared_memory.buf)
+    left_stick = reader.layout.get_entry(ReadStateName.LEFT_STICK)
+    stop: threading.Event = threading.Event()
+
+    def write() -> None:
+        value: int = 0
+        while not stop.is_set():
+            value = (value + 1) % 256
+            ValueCalc.set_left_stick(in_report, JoyStick(value, value))
+            read_states.update(in_report, ConnectionType.USB_01)
+            writer.publish()
+
+    in_report: Usb01InReport = _in_report(0)
+    writer_thread: threading.Thread = threading.Thread(target=write, daemon=True)
+    writer_thread.start()
+    try:
+        reads: int = 0
+        while reads < 2000:
+            value: JoyStick | None = reader.read_value(left_stick)
+            if value is not None:
+                assert value.x == value.y
+                reads += 1
+    finally:
+        stop.set()
+        writer_thread.join()
+
+
+@linux_only
+def test_shared_controller_reads_in_other_process() -> None:
+    device_end, controller_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    left_stick_x: list[int] = [0]
+    stop: threading.Event = threading.Event()
+
+    def emit_reports() -> None:
+        while not stop.is_set():
+            controller_end.send(bytes(_in_report(left_stick_x[0]).raw_bytes))
+            time.sleep(0.002)
+
+    emitter: threading.Thread = threading.Thread(target=emit_reports, daemon=True)
+    emitter.start()
+    controller: SharedDualSenseController = SharedDualSenseController(
+        hid_device=HidrawDevice(fd=device_end.detach()),
+        mapping=StateValueMapping.RAW,
+        left_joystick_deadzone=0,
+        start_method='fork',
+    )
+    try:
+        assert controller.left_stick_x.value is None
+        with controller:
+            assert controller.is_active
+            assert controller.connection.value.connected
+            assert controller.connection_type is ConnectionType.USB_01
+            left_stick_x[0] = 77
+            assert controller.wait_for_state(ReadStateName.LEFT_STICK_X, lambda value: value == 77, timeout=2)
+            assert controller.left_stick_x.value == 77
+            # reports keep arriving, the timeout still holds
+            start: float = time.monotonic()
+            assert not controller.wait_for_state(ReadStateName.LEFT_STICK_X, lambda value: value == 1, timeout=0.1)
+            assert time.monotonic() - start < 0.5
+            assert controller.snapshot(timeout=1).left_stick_x == 77
+            assert controller.left_stick.value == JoyStick(77, 0)
+            assert controller.btn_cross.pressed is False
+            assert controller.update_count > 0
+            with pytest.raises(SharedStateListenerException):
+                controller.left_stick_x.on_change(print)
+        assert not controller.is_active
+        assert controller.left_stick_x.value is None
+    finally:
+        stop.set()
+        emitter.join()
+        controller_end.close()
+
+
+@linux_only
+def test_shared_controller_reports_failed_start() -> None:
+    # a closed device can not be read
+    device_end, controller_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    controller_end.close()
+    hid_device: HidrawDevice = HidrawDevice(fd=device_end.detach())
+    hid_device.close()
+    controller: SharedDualSenseController = SharedDualSenseController(
+        hid_device=hid_device, start_method='fork', start_timeout=2
+    )
+    with pytest.raises(SharedReaderException):
+        controller.activate()
+    assert not controller.is_active
+
+
+def test_reader_retries_until_checksum_matches(fixture_shared_memory: SharedMemory) -> None:
+    # stores of the writer becoming visible out of order leave an even, unchanged version but a torn block
+    read_states: ReadStates = _read_states()
+    writer: SharedStateWriter = SharedStateWriter(fixture_shared_memory.buf, read_states)
+    reader: SharedStateReader = SharedStateReader(fixture_shared_memory.buf)
+    entry = reader.layout.get_entry(ReadStateName.LEFT_STICK_X)
+    read_states.update(_in_report(12), ConnectionType.USB_01)
+    writer.publish()
+    values_offset: int = reader.layout.values_offset + VALUE.size * entry.first_slot
+    published: bytes = bytes(fixture_shared_memory.buf[values_offset:values_offset + VALUE.size])
+    fixture_shared_memory.buf[values_offset:values_offset + VALUE.size] = bytes(VALUE.size)
+
+    def restore() -> None:
+        time.sleep(0.05)
+        fixture_shared_memory.buf[values_offset:values_offset + VALUE.size] = published
+
+    restorer: threading.Thread = threading.Thread(target=restore)
+    restorer.start()
+    start: float = time.monotonic()
+    assert reader.read_value(entry) == 12
+    assert time.monotonic() - start >= 0.04
+    restorer.join()
+
+
+def test_reader_copies_once_per_published_version(fixture_shared_memory: SharedMemory) -> None:
+    read_states: ReadStates = _read_states()
+    writer: SharedStateWriter = SharedStateWriter(fixture_shared_memory.buf, read_states)
+    reader: SharedStateReader = SharedStateReader(fixture_shared_memory.buf)
+    read_states.update(_in_report(12), ConnectionType.USB_01)
+    writer.publish()
+    copy: bytes = reader._read_consistent()
+    assert reader._read_consistent() is copy
+    assert reader.read_value(reader.layout.get_entry(ReadStateName.LEFT_STICK_X)) == 12
+    read_states.update(_in_report(13), ConnectionType.USB_01)
+    writer.publish()
+    assert reader._read_consistent() is not copy
+    assert reader.read_value(reader.layout.get_entry(ReadStateName.LEFT_STICK_X)) == 13
+
+
+def test_shared_controller_spawns_with_picklable_arguments() -> None:
+    device_info: DeviceInfoMock = DeviceInfoMock()
+    with patch(
+            'dualsense_controller.core.HidControllerDevice.HidControllerDevice.enumerate_devices',
+            return_value=[DeviceInfoMock(), device_info],
+    ):
+        device_info.path = 'second'
+        controller: SharedDualSenseController = SharedDualSenseController(device_index_or_device_info=device_info)
+    assert controller._context.get_start_method() == 'spawn'
+    assert controller._core_kwargs['device_index_or_device_info'] == 1
+    pickle.dumps(controller._core_kwargs)
+    with pytest.raises(AssertionError):
+        SharedDualSenseController(hid_device=ReplayHidDevice([]))
@@ -0,0 +1,158 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from dualsense_controller.api.enum import UpdateLevel
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.exception import SnapshotsNotEnabledException
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ControllerSnapshot import ControllerSnapshot, SNAPSHOT_STATE_NAMES
+from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from dualsense_controller.core.state.read_state.value_type import JoyStick
+from tests.common import ControllerInstanceData, ControllerInstanceParams
+
+
+def _create_read_states(update_level: UpdateLevel) -> ReadStates:
+    return ReadStates(
+        state_value_mapper=StateValueMapper(mapping=StateValueMapping.RAW),
+        enforce_update=update_level.value.enforce_update,
+        can_update_itself=update_level.value.can_update_itself,
+    )
+
+
+def _create_in_report(left_stick_x: int, right_trigger: int) -> Usb01InReport:
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    ValueCalc.set_left_stick(in_report, JoyStick(left_stick_x, 0))
+    ValueCalc.set_right_trigger(in_report, right_trigger)
+    in_report.seq_num = 7
+    in_report.timestamp_0, in_report.timestamp_1 = 0x34, 0x12
+    in_report.sensor_timestamp_2 = 0x01
+    return in_report
+
+
+def test_no_snapshot_unless_enabled(mocker: MockerFixture) -> None:
+    read_states: ReadStates = _create_read_states(UpdateLevel.LAZY)
+    create_snapshot_spy = mocker.spy(read_states, '_create_snapshot')
+    read_states.update(_create_in_report(1, 2), ConnectionType.USB_01)
+    assert read_states.snapshot is None
+    assert create_snapshot_spy.call_count == 0
+
+
+@pytest.mark.parametrize('update_level', [UpdateLevel.LAZY, UpdateLevel.PAINSTAKING, UpdateLevel.HAENGBLIEM])
+def test_snapshot_contains_all_states_of_the_report(update_level: UpdateLevel) -> None:
+    read_states: ReadStates = _create_read_states(update_level)
+    read_states.update(_create_in_report(1, 2), ConnectionType.USB_01)
+    read_states.enable_snapshots()
+    read_states.update(_create_in_report(42, 200), ConnectionType.USB_01)
+
+    snapshot: ControllerSnapshot | None = read_states.snapshot
+    assert snapshot is not None
+    assert snapshot.sequence == 2
+    assert snapshot.controller_sequence == 7
+    assert snapshot.host_timestamp == read_states.timestamp
+    assert snapshot.controller_timestamp == 0x1234
+    assert snapshot.sensor_timestamp == 0x010000
+    assert snapshot.left_stick_x == 42
+    assert snapshot.left_stick == JoyStick(42, 0)
+    assert snapshot.right_trigger_value == 200
+    assert snapshot.btn_cross is False
+    for name in SNAPSHOT_STATE_NAMES:
+        assert getattr(snapshot, name.lower()) == read_states.get_state(name).value, name
+
+
+@pytest.mark.parametrize('update_level', [UpdateLevel.LAZY, UpdateLevel.HAENGBLIEM])
+def test_snapshot_follows_changed_states(update_level: UpdateLevel) -> None:
+    read_states: ReadStates = _create_read_states(update_level)
+    read_states.enable_snapshots()
+    in_report: Usb01InReport = _create_in_report(1, 2)
+    for left_stick_x, right_trigger, circle in [(1, 2, False), (1, 3, True), (5, 3, True), (5, 3, False)]:
+        ValueCalc.set_left_stick_x(in_report, left_stick_x)
+        ValueCalc.set_right_trigger(in_report, right_trigger)
+        in_report.buttons_0 = in_report.buttons_0 | 0x40 if circle else in_report.buttons_0 & 0xBF
+        read_states.update(in_report, ConnectionType.USB_01)
+        snapshot: ControllerSnapshot = read_states.snapshot
+        assert (snapshot.left_stick_x, snapshot.right_trigger_value, snapshot.btn_circle) == (
+            left_stick_x, right_trigger, circle
+        )
+        for name in SNAPSHOT_STATE_NAMES:
+            assert getattr(snapshot, name.lower()) == read_states.get_state(name).value, name
+
+
+def test_snapshot_is_immutable_and_created_once_per_report() -> None:
+    read_states: ReadStates = _create_read_states(UpdateLevel.LAZY)
+    read_states.enable_snapshots()
+    snapshots: list[ControllerSnapshot | None] = []
+    read_states.on_updated(lambda: snapshots.append(read_states.snapshot))
+    read_states.update(_create_in_report(1, 2), ConnectionType.USB_01)
+    snapshot: ControllerSnapshot = read_states.snapshot
+    # callbacks get the snapshot of the report they are called for
+    assert snapshots == [snapshot]
+    assert read_states.snapshot is snapshot
+    assert not hasattr(snapshot, '__dict__')
+    with pytest.raises(AttributeError):
+        snapshot.left_stick_x = 0
+
+    read_states.update(_create_in_report(3, 4), ConnectionType.USB_01)
+    assert read_states.snapshot is not snapshot
+    assert read_states.snapshot.sequence == snapshot.sequence + 1
+    assert snapshot.left_stick_x == 1
+
+
+def test_disable_snapshots_restores_update_plan(mocker: MockerFixture) -> None:
+    read_states: ReadStates = _create_read_states(UpdateLevel.LAZY)
+    read_states.update(_create_in_report(1, 2), ConnectionType.USB_01)
+    lazy_plan = read_states._update_plan
+    read_states.enable_snapshots()
+    read_states.update(_create_in_report(1, 2), ConnectionType.USB_01)
+    assert read_states.snapshot is not None
+    assert len(read_states._update_plan.steps) > len(lazy_plan.steps)
+
+    read_states.disable_snapshots()
+    assert read_states.snapshots_enabled is False
+    assert read_states.snapshot is None
+    create_snapshot_spy = mocker.spy(read_states, '_create_snapshot')
+    read_states.update(_create_in_report(3, 4), ConnectionType.USB_01)
+    assert create_snapshot_spy.call_count == 0
+    assert read_states._update_plan == lazy_plan
+
+    read_states.enable_snapshots()
+    assert read_states.snapshot is None
+    read_states.update(_create_in_report(5, 6), ConnectionType.USB_01)
+    assert read_states.snapshot.left_stick_x == 5
+    assert read_states.snapshot.right_trigger_value == 6
+
+
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device,fixture_params_for_controller_instance',
+    [
+        [conn_type, ControllerInstanceParams(mapping=StateValueMapping.RAW, latest_only=latest_only)]
+        for conn_type in [ConnectionType.USB_01, ConnectionType.BT_31, ConnectionType.BT_01]
+        for latest_only in [False, True]
+    ],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_controller_snapshot(
+        fixture_params_for_mocked_hidapi_device: ConnectionType,
+        fixture_params_for_controller_instance: ControllerInstanceParams,
+        fixture_activated_instance: ControllerInstanceData,
+) -> None:
+    controller = fixture_activated_instance.controller
+    fixture_activated_instance.mocked_hidapi_device.set_left_stick_x_raw(99)
+    # asking for a snapshot does not enable them
+    with pytest.raises(SnapshotsNotEnabledException):
+        controller.snapshot(timeout=1)
+    controller.enable_snapshots()
+    # the first call waits for the next report
+    snapshot: ControllerSnapshot | None = controller.snapshot(timeout=1)
+    assert snapshot is not None
+    assert controller.wait_for_state(ReadStateName.LEFT_STICK_X, lambda value: value == 99, timeout=1)
+    controller.wait_until_updated(timeout=1)
+    snapshot = controller.snapshot(timeout=1)
+    assert snapshot.left_stick_x == 99
+    assert snapshot.left_stick == JoyStick(99, snapshot.left_stick_y)
+    controller.disable_snapshots()
+    assert controller._core.read_states.snapshots_enabled is False
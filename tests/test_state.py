@@ -0,0 +1,40 @@
+import threading
+
+from dualsense_controller.core.state.State import State
+from dualsense_controller.core.state.StateRecord import StateRecord
+
+
+def test_state_publishes_one_record_per_change() -> None:
+    state: State[int] = State(name='test', value=1)
+    record_before: StateRecord[int] = state.record
+
+    state.value = 2
+    record: StateRecord[int] = state.record
+    assert record is not record_before
+    assert (record.value, record.last_value, record.changed) == (2, 1, True)
+    assert record.change_timestamp > 0
+    assert record_before.value == 1
+
+    state.set_unchanged()
+    assert state.record.changed is False
+    assert state.record.value == 2
+    assert state.has_changed_since_last_set_value is False
+
+
+def test_state_change_callback_gets_values_of_one_record() -> None:
+    state: State[int] = State(name='test', value=1)
+    received: list[tuple[int, int, int]] = []
+    state.on_change(lambda old, new, timestamp: received.append((old, new, timestamp)))
+    state.value = 5
+    assert received == [(1, 5, state.record.change_timestamp)]
+
+
+def test_wait_for_skips_predicate_until_value_is_set() -> None:
+    state: State[float] = State(name='test')
+    assert state.value is None
+    assert state.wait_for(lambda value: value > 0.5, timeout=0.01) is False
+
+    setter: threading.Timer = threading.Timer(0.01, lambda: setattr(state, 'value', 0.75))
+    setter.start()
+    assert state.wait_for(lambda value: value > 0.5, timeout=1) is True
+    setter.join()
@@ -0,0 +1,95 @@
+from dualsense_controller.core.state.StateValueCallbackManager import StateValueCallbackManager
+
+
+def test_callbacks_get_args_by_arity() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    received: list[tuple] = []
+    manager.on_change(lambda: received.append(()))
+    manager.on_change(lambda new: received.append((new,)))
+    manager.on_change(lambda new, timestamp: received.append((new, timestamp)))
+    manager.on_change(lambda old, new, timestamp: received.append((old, new, timestamp)))
+    manager.on_change(lambda name, old, new, timestamp: received.append((name, old, new, timestamp)))
+
+    manager.emit_change(1, 2, 3)
+    assert received == [(), (2,), (2, 3), (1, 2, 3), ('test', 1, 2, 3)]
+
+
+def test_once_listener_is_called_once() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    received: list[int] = []
+    manager.once_change(lambda new: received.append(new))
+    assert manager.has_listeners is True
+    assert manager.has_once_listeners is True
+
+    manager.emit_change(0, 1, 0)
+    manager.emit_change(1, 2, 0)
+    assert received == [1]
+    assert manager.has_listeners is False
+    assert manager.has_once_listeners is False
+
+
+def test_listener_registered_only_once_and_removable() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    received: list[int] = []
+
+    def callback(new: int) -> None:
+        received.append(new)
+
+    manager.on_change(callback)
+    manager.on_change(callback)
+    manager.emit_change(0, 1, 0)
+    assert received == [1]
+
+    manager.remove_change_listener(callback)
+    assert manager.has_listeners is False
+    manager.emit_change(1, 2, 0)
+    assert received == [1]
+
+
+def test_remove_all_listeners() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    manager.on_change(lambda: None)
+    manager.once_change(lambda new: None)
+    manager.remove_all_change_listeners()
+    assert manager.has_listeners is False
+    assert manager.has_once_listeners is False
+
+
+def test_once_listeners_are_taken_in_one_step() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    received: list[str] = []
+    manager.on_change(lambda new: received.append(f'on {new}'))
+    manager.once_change(lambda: received.append('once'))
+    callbacks = manager._callbacks
+
+    manager.emit_change(0, 1, 0)
+    manager.emit_change(1, 2, 0)
+    assert received == ['on 1', 'once', 'on 2']
+    # the other listeners are untouched
+    assert manager._callbacks is callbacks
+    assert manager.has_once_listeners is False
+
+
+def test_listener_moves_between_once_and_on() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    received: list[int] = []
+
+    def callback(new: int) -> None:
+        received.append(new)
+
+    manager.on_change(callback)
+    manager.once_change(callback)
+    assert manager.has_once_listeners is True
+    manager.emit_change(0, 1, 0)
+    manager.emit_change(1, 2, 0)
+    assert received == [1]
+    assert manager.has_listeners is False
+
+    manager.once_change(callback)
+    manager.on_change(callback)
+    assert manager.has_once_listeners is False
+    manager.emit_change(2, 3, 0)
+    manager.emit_change(3, 4, 0)
+    assert received == [1, 3, 4]
+    manager.remove_change_listener(callback)
+    assert manager.has_listeners is False
@@ -0,0 +1,36 @@
+import pytest
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from tests.common import ControllerInstanceData
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device',
+    [ConnectionType.USB_01, ConnectionType.BT_31, ConnectionType.BT_01],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_wait_until_updated(
+        fixture_params_for_mocked_hidapi_device: ConnectionType,
+        fixture_activated_instance: ControllerInstanceData,
+) -> None:
+    assert fixture_activated_instance.controller.wait_until_updated(timeout=1) is True
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device',
+    [ConnectionType.USB_01, ConnectionType.BT_31, ConnectionType.BT_01],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_wait_for_state(
+        fixture_params_for_mocked_hidapi_device: ConnectionType,
+        fixture_activated_instance: ControllerInstanceData,
+) -> None:
+    controller = fixture_activated_instance.controller
+    assert controller.wait_for_state(ReadStateName.BTN_CROSS, lambda pressed: pressed is True, timeout=0.05) is False
+    fixture_activated_instance.mocked_hidapi_device.set_btn_square(True)
+    fixture_activated_instance.mocked_hidapi_device.set_btn_cross(True)
+    assert controller.wait_for_state(ReadStateName.BTN_CROSS, lambda pressed: pressed is True, timeout=1) is True
+    assert controller.btn_cross.pressed is True
@@ -0,0 +1,86 @@
+import multiprocessing
+import socket
+import time
+from argparse import ArgumentParser, Namespace
+from multiprocessing.synchronize import Event
+
+from dualsense_controller.api.DualSenseController import DualSenseController
+from dualsense_controller.core.ControllerHub import ControllerHub
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
+from dualsense_controller.core.state.read_state.value_type import JoyStick
+
+
+def _feed(controller_ends: list[socket.socket], rate: float, stop: Event) -> None:
+    # runs in its own process, so feeding the controllers does not count as cpu time of the benchmarked one
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    in_report.raw_bytes[0] = 0x01
+    interval: float = 1 / rate
+    deadline: float = time.perf_counter()
+    value: int = 0
+    while not stop.is_set():
+        ValueCalc.set_left_stick(in_report, JoyStick(value % 256, 255 - value % 256))
+        raw_bytes: bytes = bytes(in_report.raw_bytes)
+        for controller_end in controller_ends:
+            controller_end.send(raw_bytes)
+        value += 1
+        deadline += interval
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+
+
+def _measure(num_controllers: int, use_hub: bool, args: Namespace) -> tuple[float, float]:
+    pairs: list[tuple[socket.socket, socket.socket]] = [
+        socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET) for _ in range(num_controllers)
+    ]
+    stop: Event = multiprocessing.get_context('fork').Event()
+    feeder = multiprocessing.get_context('fork').Process(
+        target=_feed, args=([controller_end for _, controller_end in pairs], args.rate, stop), daemon=True
+    )
+    feeder.start()
+    hub: ControllerHub | None = ControllerHub() if use_hub else None
+    controllers: list[DualSenseController] = [
+        DualSenseController(hid_device=HidrawDevice(fd=device_end.detach()), hub=hub) for device_end, _ in pairs
+    ]
+    for controller in controllers:
+        controller.activate()
+        controller.left_stick.on_change(lambda _: _)
+
+    time.sleep(0.2)
+    cpu_start: float = time.process_time()
+    wall_start: float = time.perf_counter()
+    time.sleep(args.duration)
+    cpu: float = time.process_time() - cpu_start
+    wall: float = time.perf_counter() - wall_start
+
+    # a reader waits for the next report before it stops, so the feeder runs until all are deactivated
+    for controller in controllers:
+        controller.deactivate()
+    if hub is not None:
+        hub.close()
+    stop.set()
+    feeder.join()
+    for _, controller_end in pairs:
+        controller_end.close()
+    return cpu / wall * 100, cpu / (wall * args.rate * num_controllers) * 1e6
+
+
+def main(args: Namespace) -> None:
+    print(f'{args.rate:.0f} reports/s per controller, {args.duration}s each')
+    print(f'{"controllers":>11} {"threads cpu":>12} {"hub cpu":>10} {"threads":>12} {"hub":>12}')
+    for num_controllers in args.controllers:
+        threads_cpu, threads_per_report = _measure(num_controllers, False, args)
+        hub_cpu, hub_per_report = _measure(num_controllers, True, args)
+        print(
+            f'{num_controllers:>11} {threads_cpu:>11.1f}% {hub_cpu:>9.1f}% '
+            f'{threads_per_report:>9.1f} µs {hub_per_report:>9.1f} µs'
+        )
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='CPU usage of a reader thread per controller vs. one hub')
+    parser.add_argument('-c', '--controllers', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    parser.add_argument('--rate', type=float, default=250)
+    parser.add_argument('-d', '--duration', type=float, default=2)
+    main(parser.parse_args())
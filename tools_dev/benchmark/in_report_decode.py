@@ -0,0 +1,71 @@
+import random
+import timeit
+from argparse import ArgumentParser, Namespace
+from typing import Final
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.Bt31InReport import Bt31InReport
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.batch import decode_reports, np
+from dualsense_controller.core.report.in_report.enum import InReportLength
+
+
+def _sensor_axis(v1: int, v0: int) -> int:
+    res: int = ((v1 << 8) | v0)
+    if res > 0x7FFF:
+        res -= 0x10000
+    return res
+
+
+def decode_single_bytes(in_report: InReport) -> tuple[int, ...]:
+    return (
+        in_report.axes_0, in_report.axes_1, in_report.axes_2, in_report.axes_3, in_report.axes_4, in_report.axes_5,
+        in_report.buttons_0, in_report.buttons_1, in_report.buttons_2,
+        _sensor_axis(in_report.gyro_x_1, in_report.gyro_x_0),
+        _sensor_axis(in_report.gyro_y_1, in_report.gyro_y_0),
+        _sensor_axis(in_report.gyro_z_1, in_report.gyro_z_0),
+        _sensor_axis(in_report.accel_x_1, in_report.accel_x_0),
+        _sensor_axis(in_report.accel_y_1, in_report.accel_y_0),
+        _sensor_axis(in_report.accel_z_1, in_report.accel_z_0),
+        in_report.touch_1_0, in_report.touch_1_1, in_report.touch_1_2, in_report.touch_1_3,
+        in_report.touch_2_0, in_report.touch_2_1, in_report.touch_2_2, in_report.touch_2_3,
+        in_report.right_trigger_feedback, in_report.left_trigger_feedback,
+        in_report.battery_0, in_report.battery_1,
+    )
+
+
+def decode_snapshot(in_report: InReport) -> tuple[int, ...]:
+    return in_report.snapshot
+
+
+def main(args: Namespace) -> None:
+    rnd: random.Random = random.Random(0)
+    for name, in_report, length, connection_type in (
+            ('usb', Usb01InReport(), InReportLength.USB_01, ConnectionType.USB_01),
+            ('bt31', Bt31InReport(), InReportLength.BT_31, ConnectionType.BT_31),
+    ):
+        raw_reports: Final[list[bytes]] = [bytes(rnd.getrandbits(8) for _ in range(length)) for _ in range(64)]
+        for fn in (decode_single_bytes, decode_snapshot):
+            def run() -> None:
+                for raw in raw_reports:
+                    in_report.update(raw)
+                    fn(in_report)
+
+            best: float = min(timeit.repeat(run, number=args.number, repeat=args.repeat))
+            per_report_ns: float = best / (args.number * len(raw_reports)) * 1e9
+            print(f'{name:5} {fn.__name__:20} {per_report_ns:10.1f} ns/report {1e9 / per_report_ns:12.0f} reports/s')
+
+        if np is None:
+            continue
+        batch: bytes = b''.join(raw_reports) * args.number
+        best = min(timeit.repeat(lambda: decode_reports(batch, connection_type), number=1, repeat=args.repeat))
+        per_report_ns = best / (args.number * len(raw_reports)) * 1e9
+        print(f'{name:5} {"decode_reports":20} {per_report_ns:10.1f} ns/report {1e9 / per_report_ns:12.0f} reports/s')
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='In report decode micro benchmark')
+    parser.add_argument('-n', '--number', type=int, default=200)
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    main(parser.parse_args())
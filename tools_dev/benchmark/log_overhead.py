@@ -0,0 +1,45 @@
+import timeit
+from argparse import ArgumentParser, Namespace
+from typing import Callable
+
+from dualsense_controller.core.HidControllerDevice import HidControllerDevice
+from dualsense_controller.core.log import Log, LogLevel
+from dualsense_controller.core.report.out_report.Bt31OutReport import Bt31OutReport
+from dualsense_controller.core.state.write_state.value_type import TriggerEffect
+
+
+class _NullHidDevice:
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+    def is_opened(self) -> bool:
+        return True
+
+
+def main(args: Namespace) -> None:
+    Log.set_level(LogLevel.INFO)
+    device: HidControllerDevice = HidControllerDevice(hid_device=_NullHidDevice())
+    out_report: Bt31OutReport = Bt31OutReport()
+    device._out_report_lockable.value = out_report
+    data: bytearray = out_report.to_bytes()
+    effect: TriggerEffect = TriggerEffect()
+
+    ops: dict[str, Callable[[], object]] = {
+        'Log.verbose(effect)': lambda: Log.verbose('effect', effect),
+        'guarded data.hex': lambda: Log.verbose_enabled() and Log.verbose(data.hex(' ')),
+        # what every write did before the guard
+        'unguarded data.hex': lambda: Log.verbose(data.hex(' ')),
+        'to_bytes': out_report.to_bytes,
+        'device.write': device.write,
+    }
+    print(f'log level {LogLevel(Log.get_level()).name}')
+    for name, op in ops.items():
+        best: float = min(timeit.repeat(op, number=args.number, repeat=args.repeat))
+        print(f'{name:20} {best / args.number * 1e9:10.1f} ns/call')
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='Logging overhead on the write path')
+    parser.add_argument('-n', '--number', type=int, default=20000)
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,35 @@
+import timeit
+from argparse import ArgumentParser, Namespace
+from typing import Callable
+
+from dualsense_controller.core.report.out_report.Bt31OutReport import Bt31OutReport
+from dualsense_controller.core.report.out_report.OutReport import OutReport
+from dualsense_controller.core.report.out_report.Usb01OutReport import Usb01OutReport
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.write_state.WriteStates import WriteStates
+
+
+def main(args: Namespace) -> None:
+    write_states: WriteStates = WriteStates(state_value_mapper=StateValueMapper(mapping=StateValueMapping.DEFAULT))
+    for name, out_report in (
+            ('usb', Usb01OutReport()),
+            ('bt31', Bt31OutReport()),
+    ):
+        ops: dict[str, Callable[[OutReport], object]] = {
+            'update_out_report': write_states.update_out_report,
+            'to_bytes': lambda report: report.to_bytes(),
+            # what every write cost while to_bytes allocated a new bytearray
+            'to_bytes copied': lambda report: bytes(report.to_bytes()),
+        }
+        for op_name, op in ops.items():
+            best: float = min(timeit.repeat(lambda: op(out_report), number=args.number, repeat=args.repeat))
+            per_report_ns: float = best / args.number * 1e9
+            print(f'{name:5} {op_name:20} {per_report_ns:10.1f} ns/report {1e9 / per_report_ns:12.0f} reports/s')
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='Out report encode micro benchmark')
+    parser.add_argument('-n', '--number', type=int, default=20000)
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,47 @@
+import random
+import time
+from argparse import ArgumentParser, Namespace
+
+from dualsense_controller.api.enum import UpdateLevel
+from dualsense_controller.core.DualSenseControllerCore import DualSenseControllerCore
+from dualsense_controller.core.recording.RecordedReport import RecordedReport
+from dualsense_controller.core.recording.ReplayHidDevice import ReplayHidDevice
+from dualsense_controller.core.recording.enum import ReportDirection
+from dualsense_controller.core.report.in_report.enum import InReportLength
+
+
+def _random_reports(num: int) -> list[RecordedReport]:
+    rnd: random.Random = random.Random(0)
+    return [
+        RecordedReport(i * 1_000_000, ReportDirection.IN, bytes(rnd.getrandbits(8) for _ in range(InReportLength.USB_01)))
+        for i in range(num)
+    ]
+
+
+def main(args: Namespace) -> None:
+    source: str | list[RecordedReport] = args.recording if args.recording else _random_reports(args.number)
+    device: ReplayHidDevice = ReplayHidDevice(source, speed=args.speed)
+    update_level: UpdateLevel = UpdateLevel[args.update_level]
+    core: DualSenseControllerCore = DualSenseControllerCore(
+        hid_device=device,
+        enforce_update=update_level.value.enforce_update,
+        can_update_itself=update_level.value.can_update_itself,
+    )
+    if args.listen:
+        core.on_any_state_change(lambda *_: None)
+    start: float = time.perf_counter()
+    core.init()
+    device.wait_until_finished()
+    duration: float = time.perf_counter() - start
+    core.deinit()
+    print(f'{device.num_replayed} reports in {duration:.3f} s, {device.num_replayed / duration:.0f} reports/s')
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='Replays a recorded session through the full state pipeline')
+    parser.add_argument('recording', nargs='?', help='session recording, random usb reports if omitted')
+    parser.add_argument('-n', '--number', type=int, default=20000, help='number of random reports')
+    parser.add_argument('-s', '--speed', type=float, default=None, help='replay speed, as fast as possible if omitted')
+    parser.add_argument('-u', '--update-level', default='LAZY', choices=[level.name for level in UpdateLevel])
+    parser.add_argument('-l', '--listen', action='store_true', help='listen to all state changes')
+    main(parser.parse_args())
@@ -0,0 +1,86 @@
+import multiprocessing
+import socket
+import statistics
+import time
+from argparse import ArgumentParser, Namespace
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.synchronize import Event
+
+from dualsense_controller.api.DualSenseController import DualSenseController
+from dualsense_controller.api.SharedDualSenseController import SharedDualSenseController
+from dualsense_controller.core.HidrawDevice import HidrawDevice
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
+from dualsense_controller.core.state.read_state.value_type import JoyStick
+
+
+def _feed(controller_end: socket.socket, rate: float, sent: Synchronized, stop: Event) -> None:
+    # runs in its own process, counts the reports in the left stick x value
+    in_report: Usb01InReport = Usb01InReport(bytearray(InReportLength.USB_01))
+    in_report.raw_bytes[0] = 0x01
+    interval: float = 1 / rate
+    deadline: float = time.perf_counter()
+    value: int = 0
+    while not stop.is_set():
+        ValueCalc.set_left_stick(in_report, JoyStick(value % 256, 0))
+        # counted before sending, a reader must never be ahead
+        sent.value = value
+        controller_end.send(bytes(in_report.raw_bytes))
+        value += 1
+        deadline += interval
+        time.sleep(max(0.0, deadline - time.perf_counter()))
+
+
+def _work(iterations: int) -> int:
+    # stands in for application code holding the GIL
+    return sum(i * i for i in range(iterations))
+
+
+def _measure(shared: bool, args: Namespace) -> tuple[float, float, float]:
+    device_end, controller_end = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    context = multiprocessing.get_context('fork')
+    stop: Event = context.Event()
+    sent: Synchronized = context.Value('q', -1, lock=False)
+    feeder = context.Process(target=_feed, args=(controller_end, args.rate, sent, stop), daemon=True)
+    feeder.start()
+    kwargs = dict(hid_device=HidrawDevice(fd=device_end.detach()), mapping=StateValueMapping.RAW, left_joystick_deadzone=0)
+    controller: DualSenseController | SharedDualSenseController = (
+        SharedDualSenseController(start_method='fork', **kwargs) if shared else DualSenseController(**kwargs)
+    )
+    controller.activate()
+
+    # reports the feeder sent, but the application did not see yet
+    lags: list[int] = []
+    work_done: int = 0
+    start: float = time.perf_counter()
+    while time.perf_counter() - start < args.duration:
+        _work(args.work)
+        work_done += 1
+        seen: int = controller.left_stick_x.value
+        lags.append((sent.value - seen) % 256)
+    elapsed: float = time.perf_counter() - start
+
+    controller.deactivate()
+    stop.set()
+    feeder.join()
+    controller_end.close()
+    lags.sort()
+    return statistics.fmean(lags), lags[int(len(lags) * 0.99)], work_done / elapsed
+
+
+def main(args: Namespace) -> None:
+    print(f'{args.rate:.0f} reports/s, {args.work} iterations of work per read, {args.duration}s each')
+    print(f'{"reader":>8} {"mean lag":>10} {"p99 lag":>9} {"work/s":>9}')
+    for shared in (False, True):
+        mean_lag, p99_lag, work_per_second = _measure(shared, args)
+        print(f'{"process" if shared else "thread":>8} {mean_lag:>10.2f} {p99_lag:>9} {work_per_second:>9.0f}')
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='Reports behind, reader thread vs. reader process under GIL load')
+    parser.add_argument('--rate', type=float, default=250)
+    parser.add_argument('-w', '--work', type=int, default=20000)
+    parser.add_argument('-d', '--duration', type=float, default=3)
+    main(parser.parse_args())
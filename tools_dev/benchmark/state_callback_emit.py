@@ -0,0 +1,59 @@
+import timeit
+from argparse import ArgumentParser, Namespace
+from typing import Callable
+
+import pyee
+
+from dualsense_controller.core.state.StateValueCallbackManager import StateValueCallbackManager
+
+_CALLBACKS: list[Callable[..., None]] = [
+    lambda: None,
+    lambda new: None,
+    lambda new, timestamp: None,
+    lambda old, new, timestamp: None,
+    lambda name, old, new, timestamp: None,
+]
+
+
+class PyeeCallbackManager:
+    # event emitter based dispatch as used before, for comparison
+
+    def __init__(self, name: str):
+        self._name: str = name
+        self._event_emitter: pyee.EventEmitter = pyee.EventEmitter()
+        self._event_names: list[str] = [f'{name}_{num_args}' for num_args in range(5)]
+
+    def on_change(self, num_args: int, callback: Callable[..., None]) -> None:
+        self._event_emitter.on(self._event_names[num_args], callback)
+
+    def emit_change(self, old_value: int, new_value: int, timestamp: int) -> None:
+        if self._event_names[0] in self._event_emitter.event_names():
+            self._event_emitter.emit(self._event_names[0])
+        if self._event_names[1] in self._event_emitter.event_names():
+            self._event_emitter.emit(self._event_names[1], new_value)
+        if self._event_names[2] in self._event_emitter.event_names():
+            self._event_emitter.emit(self._event_names[2], new_value, timestamp)
+        if self._event_names[3] in self._event_emitter.event_names():
+            self._event_emitter.emit(self._event_names[3], old_value, new_value, timestamp)
+        if self._event_names[4] in self._event_emitter.event_names():
+            self._event_emitter.emit(self._event_names[4], self._name, old_value, new_value, timestamp)
+
+
+def main(args: Namespace) -> None:
+    for num_args in [None, 0, 1, 2, 3, 4]:
+        manager: StateValueCallbackManager[int] = StateValueCallbackManager('bench')
+        pyee_manager: PyeeCallbackManager = PyeeCallbackManager('bench')
+        if num_args is not None:
+            manager.on_change(_CALLBACKS[num_args])
+            pyee_manager.on_change(num_args, _CALLBACKS[num_args])
+        label: str = 'no listener' if num_args is None else f'{num_args} args'
+        for name, emit in (('callback manager', manager.emit_change), ('pyee', pyee_manager.emit_change)):
+            best: float = min(timeit.repeat(lambda: emit(1, 2, 3), number=args.number, repeat=args.repeat))
+            print(f'{label:12} {name:17} {best / args.number * 1e9:8.1f} ns/emit')
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='State change emission micro benchmark')
+    parser.add_argument('-n', '--number', type=int, default=100000)
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    main(parser.parse_args())
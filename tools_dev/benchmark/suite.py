@@ -0,0 +1,239 @@
+import gc
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from dataclasses import asdict, dataclass
+from typing import Callable, Final
+
+from dualsense_controller.api.enum import UpdateLevel
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
+from dualsense_controller.core.report.in_report.Bt31InReport import Bt31InReport
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+from dualsense_controller.core.report.out_report.Bt31OutReport import Bt31OutReport
+from dualsense_controller.core.report.out_report.OutReport import OutReport
+from dualsense_controller.core.report.out_report.Usb01OutReport import Usb01OutReport
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+from dualsense_controller.core.state.write_state.WriteStates import WriteStates
+from dualsense_controller.core.state.write_state.enum import WriteStateName
+
+# op(i) processes the i-th report of a case
+_Op = Callable[[int], None]
+
+_IN_REPORTS: Final[dict[ConnectionType, tuple[type[InReport], InReportLength]]] = {
+    ConnectionType.USB_01: (Usb01InReport, InReportLength.USB_01),
+    ConnectionType.BT_31: (Bt31InReport, InReportLength.BT_31),
+    ConnectionType.BT_01: (Bt01InReport, InReportLength.BT_01),
+}
+_SENSOR_KEYS: Final[tuple[str, ...]] = tuple(
+    f'{sensor}_{axis}_{byte}' for sensor in ('gyro', 'accel') for axis in 'xyz' for byte in (0, 1)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class CaseResult:
+    name: str
+    reports_per_second: float
+    p50_ns: float
+    p99_ns: float
+    alloc_bytes: float
+    retained_blocks: float
+
+
+def synthetic_reports(connection_type: ConnectionType, num: int, seed: int = 0) -> list[bytes]:
+    # like a controller in use: drifting sticks, noisy motion sensors, a button toggling now and then
+    rnd: random.Random = random.Random(seed)
+    in_report_type, length = _IN_REPORTS[connection_type]
+    in_report: InReport = in_report_type(bytearray(length))
+    stick: list[int] = [128, 128, 128, 128]
+    reports: list[bytes] = []
+    for i in range(num):
+        for axis in range(4):
+            stick[axis] = min(255, max(0, stick[axis] + rnd.choice((-1, 0, 0, 1))))
+        in_report.axes_0, in_report.axes_1, in_report.axes_2, in_report.axes_3 = stick
+        in_report.buttons_0 = 0x08 | (0x20 if (i // 50) % 2 else 0)
+        if in_report.fields[-1][0] > 20:
+            for key in _SENSOR_KEYS:
+                setattr(in_report, key, rnd.getrandbits(8))
+        reports.append(bytes(in_report.raw_bytes))
+    return reports
+
+
+def _decode_case(connection_type: ConnectionType, reports: list[bytes]) -> _Op:
+    in_report: InReport = _IN_REPORTS[connection_type][0]()
+
+    def op(i: int) -> None:
+        in_report.update(reports[i])
+        in_report.snapshot
+
+    return op
+
+
+def _read_states_case(
+        connection_type: ConnectionType,
+        reports: list[bytes],
+        update_level: UpdateLevel,
+        listeners: int,
+        snapshots: bool = False,
+) -> _Op:
+    read_states: ReadStates = ReadStates(
+        state_value_mapper=StateValueMapper(mapping=StateValueMapping.DEFAULT),
+        enforce_update=update_level.value.enforce_update,
+        can_update_itself=update_level.value.can_update_itself,
+    )
+    for _ in range(listeners):
+        read_states.on_any_change(lambda *_: None)
+    if snapshots:
+        read_states.enable_snapshots()
+    in_report: InReport = _IN_REPORTS[connection_type][0]()
+
+    def op(i: int) -> None:
+        in_report.update(reports[i])
+        read_states.update(in_report, connection_type)
+
+    return op
+
+
+def _write_case(out_report: OutReport) -> _Op:
+    write_states: WriteStates = WriteStates(state_value_mapper=StateValueMapper(mapping=StateValueMapping.DEFAULT))
+
+    def op(i: int) -> None:
+        write_states.set_value(WriteStateName.LIGHTBAR_RED, i & 0xFF)
+        write_states.update_out_report(out_report)
+        write_states.set_unchanged()
+        out_report.to_bytes()
+
+    return op
+
+
+def create_cases(num_reports: int) -> dict[str, _Op]:
+    reports: dict[ConnectionType, list[bytes]] = {
+        connection_type: synthetic_reports(connection_type, num_reports) for connection_type in _IN_REPORTS
+    }
+    cases: dict[str, _Op] = {}
+    for connection_type in _IN_REPORTS:
+        cases[f'decode/{connection_type.name}'] = _decode_case(connection_type, reports[connection_type])
+    for connection_type in (ConnectionType.USB_01, ConnectionType.BT_31):
+        for update_level in (UpdateLevel.LAZY, UpdateLevel.PAINSTAKING, UpdateLevel.HAENGBLIEM):
+            cases[f'read_states/{update_level.name}/{connection_type.name}'] = _read_states_case(
+                connection_type, reports[connection_type], update_level, listeners=0
+            )
+    for listeners in (1, 4):
+        cases[f'fan_out/{listeners}_per_state/USB_01'] = _read_states_case(
+            ConnectionType.USB_01, reports[ConnectionType.USB_01], UpdateLevel.HAENGBLIEM, listeners=listeners
+        )
+    cases['snapshot/HAENGBLIEM/USB_01'] = _read_states_case(
+        ConnectionType.USB_01, reports[ConnectionType.USB_01], UpdateLevel.HAENGBLIEM, listeners=0, snapshots=True
+    )
+    cases['write/USB_01'] = _write_case(Usb01OutReport())
+    cases['write/BT_31'] = _write_case(Bt31OutReport())
+    return cases
+
+
+def run_case(name: str, op: _Op, num_reports: int, repeat: int) -> CaseResult:
+    for i in range(num_reports):
+        op(i)
+
+    gc.collect()
+    gc.disable()
+    try:
+        # throughput without the per op timer
+        best: float = float('inf')
+        for _ in range(repeat):
+            start: int = time.perf_counter_ns()
+            for i in range(num_reports):
+                op(i)
+            best = min(best, time.perf_counter_ns() - start)
+
+        latencies: list[int] = []
+        perf_counter_ns: Callable[[], int] = time.perf_counter_ns
+        for i in range(num_reports):
+            start = perf_counter_ns()
+            op(i)
+            latencies.append(perf_counter_ns() - start)
+        latencies.sort()
+
+        blocks_before: int = sys.getallocatedblocks()
+        for i in range(num_reports):
+            op(i)
+        retained_blocks: float = (sys.getallocatedblocks() - blocks_before) / num_reports
+
+        # transient allocation of a single op, tracemalloc slows everything down, so only a sample
+        tracemalloc.start()
+        alloc_bytes: list[int] = []
+        for i in range(min(num_reports, 200)):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            op(i)
+            alloc_bytes.append(tracemalloc.get_traced_memory()[1] - current)
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+
+    return CaseResult(
+        name=name,
+        reports_per_second=num_reports / (best / 1e9),
+        p50_ns=latencies[len(latencies) // 2],
+        p99_ns=latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        alloc_bytes=statistics.median(alloc_bytes),
+        retained_blocks=retained_blocks,
+    )
+
+
+def compare(results: list[CaseResult], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    regressions: list[str] = []
+    for result in results:
+        base: dict | None = baseline.get(result.name)
+        if base is None:
+            continue
+        if result.p50_ns > base['p50_ns'] * (1 + tolerance):
+            regressions.append(f'{result.name}: p50 {base["p50_ns"]:.0f} -> {result.p50_ns:.0f} ns')
+        if result.reports_per_second < base['reports_per_second'] / (1 + tolerance):
+            regressions.append(
+                f'{result.name}: {base["reports_per_second"]:.0f} -> {result.reports_per_second:.0f} reports/s'
+            )
+    return regressions
+
+
+def main(args: Namespace) -> int:
+    results: list[CaseResult] = []
+    print(f'{"case":40} {"reports/s":>12} {"p50 ns":>10} {"p99 ns":>10} {"alloc B":>9} {"retained":>9}')
+    for name, op in create_cases(args.number).items():
+        if args.filter and args.filter not in name:
+            continue
+        result: CaseResult = run_case(name, op, args.number, args.repeat)
+        results.append(result)
+        print(
+            f'{result.name:40} {result.reports_per_second:12.0f} {result.p50_ns:10.0f} {result.p99_ns:10.0f} '
+            f'{result.alloc_bytes:9.0f} {result.retained_blocks:9.2f}'
+        )
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({result.name: asdict(result) for result in results}, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            regressions: list[str] = compare(results, json.load(file), args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression}')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser(description='Throughput, latency and allocations of the report pipeline')
+    parser.add_argument('-n', '--number', type=int, default=2000, help='reports per case')
+    parser.add_argument('-r', '--repeat', type=int, default=5)
+    parser.add_argument('-f', '--filter', help='only run cases containing this')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='compare against results written with --json before')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed slowdown against --compare')
+    sys.exit(main(parser.parse_args()))